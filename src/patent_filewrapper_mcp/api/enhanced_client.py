@@ -6,22 +6,21 @@ applications, getting detailed application data, retrieving documents, and
 downloading PDFs.
 """
 import httpx
+import importlib.util
 import os
 # defusedxml: hardens against XXE / entity-expansion in USPTO-served XML (audit L12)
 from typing import Dict, Any, List, Optional
 from .helpers import validate_app_number, format_error_response, generate_request_id, create_inventor_queries, map_user_fields_to_api_fields
 from ..exceptions import AuthenticationError, NotFoundError
+from ..shared.mistral_placeholders import find_mistral_placeholder
 from ..shared.safe_logger import get_safe_logger
 from ..shared.uspto_shared_rate_limiter import get_shared_limiter
-
-try:
-    import PyPDF2  # noqa: F401 — availability probe; used lazily in extract_with_pypdf2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-
 from .docling_client import DoclingClient
 
+# Availability probe without executing PyPDF2 (~50 ms of imports); the module
+# itself is imported on first use in extract_with_pypdf2
+PDF_AVAILABLE = importlib.util.find_spec("PyPDF2") is not None
+
 logger = get_safe_logger(__name__)
 
 
@@ -58,16 +57,8 @@ class EnhancedPatentClient:
             self.api_key = api_key
         else:
             # Try to load from unified secure storage first, then fall back to environment
-            try:
-                from ..shared_secure_storage import get_uspto_api_key
-                self.api_key = get_uspto_api_key()
-            except Exception:
-                # Fall back to environment variable if secure storage fails
-                pass
-
-            # If still no key, try environment variable
-            if not self.api_key:
-                self.api_key = os.getenv("USPTO_API_KEY")
+            from ..shared_secure_storage import get_api_key_with_env_fallback
+            self.api_key = get_api_key_with_env_fallback("USPTO_API_KEY")
 
             # Final validation
             if not self.api_key:
@@ -120,26 +111,19 @@ class EnhancedPatentClient:
         self.retry_budget = self.transport.retry_budget
 
         # Mistral OCR configuration - check unified secure storage first, then environment
-        raw_mistral_key = None
-        try:
-            from ..shared_secure_storage import get_mistral_api_key
-            raw_mistral_key = get_mistral_api_key()
-        except Exception:
-            # Fall back to environment variable if secure storage fails
-            pass
-
-        # If still no key, try environment variable
-        if not raw_mistral_key:
-            raw_mistral_key = os.getenv("MISTRAL_API_KEY")
-
-        self.mistral_api_key = self._validate_mistral_api_key(raw_mistral_key)
+        from ..shared_secure_storage import get_api_key_with_env_fallback
+        self.mistral_api_key = self._validate_mistral_api_key(
+            get_api_key_with_env_fallback("MISTRAL_API_KEY")
+        )
         self.mistral_base_url = "https://api.mistral.ai/v1"
 
         # Single Mistral OCR implementation lives in OCRService (audit F1);
         # it owns rate limiting, the model slug, and the page cap.
         from ..services.ocr_service import OCRService
         self.ocr_service = OCRService(
-            api_key=self.mistral_api_key,
+            # "" (not None) so OCRService doesn't re-read and re-validate
+            # a key this client already found missing
+            api_key=self.mistral_api_key or "",
             model=self.mistral_ocr_model,
             timeout=self.ocr_timeout,
             limits=self.ocr_limits,
@@ -161,38 +145,30 @@ class EnhancedPatentClient:
         if not raw_key:
             return None
 
+        # Very short keys are likely placeholders; checked first since it's a
+        # single len() and skips the pattern scan
+        key = raw_key.strip()
+        if len(key) < 10:
+            logger.info(f"Detected suspiciously short API key ({len(raw_key)} chars). Treating as missing key.")
+            return None
+
         # Common placeholder patterns that should be treated as missing.
         # Allow override via MISTRAL_PLACEHOLDER_PATTERNS env var (comma-separated).
         # The default covers common mistake patterns; additional patterns can be added
         # without a code change.
-        env_patterns = os.getenv("MISTRAL_PLACEHOLDER_PATTERNS", "")
-        placeholder_patterns = [
-            "your_mistral_api_key_here",
-            "your_key_here",
-            "your_api_key_here",
-            "placeholder",
-            "optional",
-            "change_me",
-            "replace_me",
-            "insert_key_here",
-            "api_key_here",
-        ]
-        if env_patterns:
-            placeholder_patterns.extend([p.strip() for p in env_patterns.split(",") if p.strip()])
-
         # Check if the key matches any placeholder pattern (case-insensitive)
-        key_lower = raw_key.lower().strip()
-        for pattern in placeholder_patterns:
-            if pattern in key_lower:
-                logger.info(f"Detected placeholder API key pattern: {pattern}. Treating as missing key.")
-                return None
-
-        # Additional check for very short keys that are likely placeholders
-        if len(raw_key.strip()) < 10:
-            logger.info(f"Detected suspiciously short API key ({len(raw_key)} chars). Treating as missing key.")
+        placeholder = find_mistral_placeholder(key)
+        if placeholder:
+            logger.info(f"Detected placeholder API key pattern: {placeholder}. Treating as missing key.")
             return None
 
-        return raw_key.strip()
+        return key
+
+    async def aclose(self) -> None:
+        """Close the pooled Mistral OCR client of the running event loop
+        (owner shutdown). The client may be shared across loops, so other
+        loops' connections are left to their own shutdown."""
+        await self.ocr_service.aclose()
 
     async def _make_request(self, endpoint: str, method: str = "GET", **kwargs) -> Dict[str, Any]:
         """Make HTTP request to the PFW API — delegates to USPTOTransport
@@ -1,6 +1,7 @@
 """
 Helper functions for Patent File Wrapper MCP
 """
+import hashlib
 import re
 import uuid
 from typing import Dict, Any, List, Optional
@@ -708,8 +709,6 @@ def generate_safe_filename(app_number: str, invention_title: str, doc_code: str,
         generate_safe_filename("17896175", "Communication Method and Apparatus", "ABST")
         -> "APP-17896175_COMMUNICATION_METHOD_AND_APPARATUS_ABST.pdf"
     """
-    import hashlib
-
     # Handle empty or None title
     if not invention_title or invention_title.strip() == "":
         safe_title = "UNTITLED"
@@ -106,11 +106,11 @@ class ResponseCache:
             **kwargs: Request parameters
 
         Returns:
-            SHA256 hash of endpoint and parameters (first 16 chars)
+            16-char BLAKE2b hash of endpoint and parameters
         """
         # Sort kwargs to ensure consistent key generation
         key_data = f"{endpoint}:{str(sorted(kwargs.items()))}"
-        return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+        return hashlib.blake2b(key_data.encode(), digest_size=8).hexdigest()
 
     def get(self, endpoint: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
@@ -9,14 +9,20 @@ Security Features:
 - SafeLogger integration for automatic sensitive data sanitization
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 
 from ..shared.log_sanitizer import SanitizingFilter
 
+# Background writer for the root logger's file/console sinks (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
@@ -74,11 +80,21 @@ def setup_logging(log_level: str = "INFO") -> None:
         datefmt='%Y-%m-%d %H:%M:%S'
     ))
 
-    # Sink-level sanitization guarantee: every record is scrubbed at the
-    # handler regardless of which logger emitted it (library loggers included)
-    sanitizing_filter = SanitizingFilter()
-    for _sink in (file_handler, console_handler):
-        _sink.addFilter(sanitizing_filter)
+    # Log calls only enqueue the record; a QueueListener thread does the
+    # formatting and file/stderr I/O, so request handlers on the event loop
+    # never block on a disk write or a log rotation.
+    # Sink-level sanitization guarantee: every record is scrubbed at the root
+    # queue handler — before it leaves the calling thread — regardless of
+    # which logger emitted it (library loggers included)
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(SanitizingFilter())
+    _queue_listener = logging.handlers.QueueListener(
+        queue_handler.queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Configure root logger with all handlers
     root_logger = logging.getLogger()
@@ -88,9 +104,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)
 
     # Set file permissions to 600 (owner read/write only) - CRITICAL SECURITY
     if hasattr(os, 'chmod'):
@@ -114,6 +128,13 @@ def setup_logging(log_level: str = "INFO") -> None:
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued records to the sinks at interpreter exit."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
 def get_log_files() -> dict:
     """
     Get the paths to the log files.
@@ -2,13 +2,19 @@
 (carved out of create_proxy_app() — audit F4)."""
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+import sqlite3
 import time
+from typing import Any, Optional
 
 from ...shared.safe_logger import get_safe_logger
+from ...util.database import create_secure_connection
 from ..fpd_document_store import get_fpd_store
 from ..ptab_document_store import get_ptab_store
 from ..rate_limiter import rate_limiter
+from ..recent_downloads_store import get_recent, register_download
+from ..secure_link_cache import get_link_cache
 
 from .. import server as _server
 from ..server import (
@@ -19,19 +25,46 @@ logger = get_safe_logger(__name__)
 
 router = APIRouter()
 
+# Health-check SQLite probe: one in-memory connection for the process lifetime
+# (the old probe created, fsynced and unlinked a temp .db file on every hit),
+# re-probed at most once per interval so back-to-back liveness checks are free.
+_HEALTH_DB_RECHECK_SECONDS = 30.0
+_health_db: Optional[sqlite3.Connection] = None
+_health_db_checked_at = 0.0
 
-@router.get("/")
-async def health_check():
-    """
-    Enhanced health check endpoint with component status
 
-    Returns health status of all system components including:
-    - Circuit breaker state
-    - Database connectivity
-    - Response cache statistics
-    - Retry budget tracking
-    """
-    health_data = {
+# Serialized GET / report: (monotonic time, circuit state, body, status code)
+_HEALTH_CACHE_SECONDS = 2.0
+_health_cache: Optional[tuple[float, Optional[str], bytes, int]] = None
+
+
+def _check_database() -> dict:
+    """Return the database component status for the health check."""
+    global _health_db, _health_db_checked_at
+    now = time.monotonic()
+    if _health_db is not None and now - _health_db_checked_at < _HEALTH_DB_RECHECK_SECONDS:
+        return {"status": "healthy", "message": "SQLite connectivity verified"}
+    try:
+        if _health_db is None:
+            _health_db = create_secure_connection(":memory:", timeout=5.0)
+        _health_db.execute("SELECT 1").fetchone()
+        _health_db_checked_at = now
+        return {"status": "healthy", "message": "SQLite connectivity verified"}
+    except Exception as db_error:
+        _health_db = None
+        return {"status": "unhealthy", "error": str(db_error)}
+
+
+def _circuit_state() -> Optional[str]:
+    """Current circuit-breaker state value, or None without an API client."""
+    if _server.api_client:
+        return _server.api_client.circuit_breaker.state.value
+    return None
+
+
+def _collect_health() -> tuple[dict, int]:
+    """Build the full component health report and its HTTP status code."""
+    health_data: dict[str, Any] = {
         "service": "USPTO Document Proxy",
         "timestamp": time.time(),
         "components": {}
@@ -82,40 +115,10 @@ async def health_check():
         overall_healthy = False
 
     # Database health check
-    try:
-        from ...util.database import create_secure_connection
-        import os
-        import tempfile
-
-        # Test database connectivity with temporary database
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_db:
-            tmp_db_path = tmp_db.name
-
-        try:
-            conn = create_secure_connection(tmp_db_path, timeout=5.0)
-            conn.execute("SELECT 1").fetchone()
-            conn.close()
-            os.unlink(tmp_db_path)
-
-            health_data["components"]["database"] = {
-                "status": "healthy",
-                "message": "SQLite connectivity verified"
-            }
-        except Exception as db_error:
-            health_data["components"]["database"] = {
-                "status": "unhealthy",
-                "error": str(db_error)
-            }
-            overall_healthy = False
-            # Clean up temp file if exists
-            if os.path.exists(tmp_db_path):
-                os.unlink(tmp_db_path)
-
-    except Exception as e:
-        health_data["components"]["database"] = {
-            "status": "unknown",
-            "error": f"Health check failed: {str(e)}"
-        }
+    db_component = _check_database()
+    health_data["components"]["database"] = db_component
+    if db_component["status"] == "unhealthy":
+        overall_healthy = False
 
     # Set overall status
     health_data["status"] = "healthy" if overall_healthy else "degraded"
@@ -123,47 +126,76 @@ async def health_check():
     # Return appropriate HTTP status code
     status_code = 200 if overall_healthy else 503
 
-    return JSONResponse(content=health_data, status_code=status_code)
+    return health_data, status_code
+
+
+@router.get("/")
+async def health_check():
+    """
+    Enhanced health check endpoint with component status
+
+    Returns health status of all system components including:
+    - Circuit breaker state
+    - Database connectivity
+    - Response cache statistics
+    - Retry budget tracking
+
+    The serialized report is reused for _HEALTH_CACHE_SECONDS so rapid
+    polling doesn't rebuild it; a circuit-breaker state change invalidates
+    it immediately.
+    """
+    global _health_cache
+    now = time.monotonic()
+    cb_state = _circuit_state()
+    cached = _health_cache
+    if cached is None or now - cached[0] >= _HEALTH_CACHE_SECONDS or cached[1] != cb_state:
+        health_data, status_code = _collect_health()
+        cached = _health_cache = (now, cb_state, orjson.dumps(health_data), status_code)
+    return Response(content=cached[2], status_code=cached[3], media_type="application/json")
+
+
+@router.head("/")
+async def health_check_head():
+    """Liveness probe: status code only, without running the component checks."""
+    return Response(status_code=200 if _server.api_client is not None else 503)
 
 
 @router.get("/cache/stats", dependencies=[Depends(_check_proxy_token)])
 async def get_cache_stats():
     """Get persistent link cache statistics for monitoring"""
     try:
-        from ..secure_link_cache import get_link_cache
         link_cache = get_link_cache()
-        return link_cache.get_cache_stats()
+        return ORJSONResponse(link_cache.get_cache_stats())
     except Exception as e:
         logger.error(f"Error getting cache stats: {e}")
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 @router.post("/cache/cleanup", dependencies=[Depends(_check_proxy_token)])
 async def cleanup_expired_links():
     """Clean up expired persistent links"""
     try:
-        from ..secure_link_cache import get_link_cache
         link_cache = get_link_cache()
         deleted_count = link_cache.cleanup_expired_links()
-        return {
+        return ORJSONResponse({
             "success": True,
             "deleted_links": deleted_count,
             "message": f"Cleaned up {deleted_count} expired links"
-        }
+        })
     except Exception as e:
         logger.error(f"Error during cache cleanup: {e}")
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 
 @router.get("/rate-limit/{client_ip}", dependencies=[Depends(_check_proxy_token)])
 async def check_rate_limit(client_ip: str):
     """Check rate limit status for a client IP"""
-    return {
+    return ORJSONResponse({
         "client_ip": client_ip,
         "remaining_requests": rate_limiter.get_remaining_requests(client_ip),
         "max_requests": rate_limiter.max_requests,
         "time_window": rate_limiter.time_window,
         "reset_time": rate_limiter.get_reset_time(client_ip)
-    }
+    })
 
 
 @router.get("/ptab-stats")
@@ -171,20 +203,20 @@ async def get_ptab_stats():
     """Get PTAB document store statistics for monitoring"""
     try:
         ptab_store = get_ptab_store()
-        return ptab_store.get_statistics()
+        return ORJSONResponse(ptab_store.get_statistics())
     except Exception as e:
         logger.error(f"Error getting PTAB stats: {e}")
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 @router.get("/fpd-stats")
 async def get_fpd_stats():
     """Get FPD document store statistics for monitoring"""
     try:
         fpd_store = get_fpd_store()
-        return fpd_store.get_statistics()
+        return ORJSONResponse(fpd_store.get_statistics())
     except Exception as e:
         logger.error(f"Error getting FPD stats: {e}")
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 
 @router.get("/api/recent-downloads", dependencies=[Depends(_check_proxy_token)])
@@ -199,8 +231,7 @@ async def get_recent_downloads():
 
     Returns JSON array of download entries (newest first).
     """
-    from ..recent_downloads_store import get_recent
-    return get_recent()
+    return ORJSONResponse(get_recent())
 
 @router.post("/api/register-download", dependencies=[Depends(_check_proxy_token)])
 async def post_register_download(request: Request):
@@ -210,7 +241,6 @@ async def post_register_download(request: Request):
     via HTTP so the registration works whether the proxy is in-process or a
     separately-running instance (e.g. ENABLE_ALWAYS_ON_PROXY=true across sessions).
     """
-    from ..recent_downloads_store import register_download
     payload = await request.json()
     register_download(
         title=payload.get("title", "Document"),
@@ -220,4 +250,4 @@ async def post_register_download(request: Request):
         filename=payload.get("filename"),
     )
     logger.info("register-download: registered '%s' for app %s", payload.get("title"), payload.get("app_number"))
-    return {"ok": True}
+    return ORJSONResponse({"ok": True})
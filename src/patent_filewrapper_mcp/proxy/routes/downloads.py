@@ -5,22 +5,30 @@ building the whole app.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from starlette.background import BackgroundTask
+import asyncio
+import hashlib
 import httpx
+import time
+from typing import Optional
 
-from ...api.helpers import validate_app_number, generate_request_id
+from ...api.helpers import extract_patent_number, generate_safe_filename, validate_app_number
 from ...shared.safe_logger import get_safe_logger
 from ...util.security_logger import security_logger
 from ..fpd_document_store import get_fpd_store
 from ..ptab_document_store import get_ptab_store
 from ..rate_limiter import rate_limiter
 from ..models import _validate_uspto_download_url
+from ..secure_link_cache import get_link_cache
 
 from .. import server as _server
 from ..server import (
     _check_proxy_token,
+    _etag_matches,
     _open_upstream_pdf_stream,
+    _release_pdf_body,
+    _request_context,
     _safe_filename,
     _safe_header_value,
 )
@@ -29,6 +37,181 @@ logger = get_safe_logger(__name__)
 
 router = APIRouter()
 
+# Constant response headers per document source, overlaid with the
+# per-request fields instead of being re-assigned key by key on every download
+_PDF_STATIC_HEADERS = {"Content-Type": "application/pdf"}
+_SOURCE_STATIC_HEADERS = {
+    "FPD": {**_PDF_STATIC_HEADERS, "X-Document-Source": "FPD"},
+    "PTAB": {**_PDF_STATIC_HEADERS, "X-Document-Source": "PTAB"},
+}
+
+
+# Per-application documentBag index ({documentIdentifier: (doc, pdf_option)})
+# so repeat
+# downloads from the same file wrapper (several documents in a row, re-clicked
+# persistent links) skip the upstream documents round-trip. Short TTL: the
+# bag only grows as prosecution continues.
+_DOC_INDEX_TTL_SECONDS = 60.0
+_DOC_INDEX_MAX_ENTRIES = 128
+_doc_index_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _pdf_download_option(doc: dict) -> Optional[dict]:
+    """The document's PDF entry from downloadOptionBag, or None."""
+    return next(
+        (option for option in doc.get('downloadOptionBag', []) if option.get('mimeTypeIdentifier') == 'PDF'),
+        None,
+    )
+
+
+async def _get_document_index(app_number: str) -> dict:
+    """Return {documentIdentifier: (doc, pdf_option)} for an application,
+    cached briefly. The PDF option is resolved once when the index is built.
+
+    Upstream errors raise HTTPException(404) and are never cached.
+    """
+    now = time.monotonic()
+    cached = _doc_index_cache.get(app_number)
+    if cached is not None and now - cached[0] < _DOC_INDEX_TTL_SECONDS:
+        return cached[1]
+
+    docs_result = await _server.api_client.get_documents(app_number)
+    if docs_result.get('error'):
+        raise HTTPException(status_code=404, detail=docs_result.get('message', 'Document not found'))
+
+    index = {
+        doc.get('documentIdentifier'): (doc, _pdf_download_option(doc))
+        for doc in docs_result.get('documentBag', [])
+    }
+    _doc_index_cache.pop(app_number, None)
+    if len(_doc_index_cache) >= _DOC_INDEX_MAX_ENTRIES:
+        # Dicts keep insertion order: drop the oldest entry
+        del _doc_index_cache[next(iter(_doc_index_cache))]
+    _doc_index_cache[app_number] = (now, index)
+    return index
+
+
+# Per-application (invention_title, patent_number) for download filenames,
+# so repeat downloads from one file wrapper skip the search round-trip that
+# only exists to name the file. Failed searches are not cached.
+_FILENAME_METADATA_TTL_SECONDS = 300.0
+_filename_metadata_cache: dict[str, tuple[float, tuple]] = {}
+
+
+async def _get_title_and_patent_number(app_number: str):
+    """Invention title and patent number for the download filename.
+
+    Best effort: returns ``(None, None)`` when the search fails, so the
+    caller falls back to the id-based filename. Successful lookups are
+    cached briefly per application.
+    """
+    now = time.monotonic()
+    cached = _filename_metadata_cache.get(app_number)
+    if cached is not None and now - cached[0] < _FILENAME_METADATA_TTL_SECONDS:
+        return cached[1]
+
+    try:
+        # Search for the application to get the title and patent number info
+        search_result = await _server.api_client.search_applications(
+            f"applicationNumberText:{app_number}",
+            limit=1,
+            offset=0,
+            fields=["applicationMetaData.inventionTitle", "applicationMetaData.patentNumber"]
+        )
+    except Exception as e:
+        logger.warning(f"Could not fetch application metadata for {app_number}: {e}")
+        return None, None
+    if not search_result.get('success'):
+        return None, None
+
+    metadata: tuple[Optional[str], Optional[str]] = (None, None)
+    apps = search_result.get('patentFileWrapperDataBag') or search_result.get('applications')
+    if apps:
+        app_data = apps[0]
+        # Extract patent number using helper function
+        metadata = (
+            app_data.get('applicationMetaData', {}).get('inventionTitle'),
+            extract_patent_number(app_data),
+        )
+    _filename_metadata_cache.pop(app_number, None)
+    if len(_filename_metadata_cache) >= _DOC_INDEX_MAX_ENTRIES:
+        del _filename_metadata_cache[next(iter(_filename_metadata_cache))]
+    _filename_metadata_cache[app_number] = (now, metadata)
+    return metadata
+
+
+# USPTO file-wrapper documents are immutable once in the documentBag, so a
+# PFW download's ETag is derived from its index entry alone and a matching
+# If-None-Match is answered 304 without an upstream fetch
+_PFW_CACHE_CONTROL = "private, max-age=3600"
+
+
+def _pfw_document_etag(document_identifier: str, doc_code: str, page_count) -> str:
+    """Quoted strong ETag for a PFW document."""
+    digest = hashlib.sha1(f"{document_identifier}:{doc_code}:{page_count}".encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _locate_pfw_pdf(doc_index: dict, document_identifier: str) -> tuple[dict, dict, str]:
+    """Return (doc, pdf_option, download_url) for a documentBag entry, or 404."""
+    target_doc, pdf_option = doc_index.get(document_identifier, (None, None))
+    if not target_doc:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Document with identifier '{document_identifier}' not found"
+        )
+
+    if not pdf_option:
+        raise HTTPException(status_code=404, detail="PDF not available for this document")
+
+    download_url = pdf_option.get('downloadUrl')
+    if not download_url:
+        raise HTTPException(status_code=404, detail="Download URL not available")
+    return target_doc, pdf_option, download_url
+
+
+def _attachment_disposition(filename: str) -> str:
+    """Content-Disposition value for a PDF download (filename sanitized)."""
+    return f'attachment; filename="{_safe_filename(filename)}"'
+
+
+class _UpstreamPdfResponse(StreamingResponse):
+    """StreamingResponse that always releases its upstream body.
+
+    Starlette only drains the body iterator once the response starts, so a
+    client that disconnects first (or an ASGI error before the body) would
+    otherwise leave the upstream connection and download slot held.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await _release_pdf_body(self.body_iterator)
+
+
+def _pdf_response(body, content_length, headers: dict, background: BackgroundTask):
+    """Build the outbound PDF response for an _open_upstream_pdf_stream result.
+
+    Small, fully-buffered bodies go out as a plain Response (one write, known
+    size); streamed bodies forward the upstream Content-Length when known so
+    clients get a sized download instead of chunked transfer encoding.
+    """
+    if isinstance(body, bytes):
+        return Response(content=body, media_type="application/pdf", headers=headers, background=background)
+    if content_length is not None:
+        headers = {**headers, "Content-Length": str(content_length)}
+    return _UpstreamPdfResponse(body, media_type="application/pdf", headers=headers, background=background)
+
+
+def _log_download_completed(
+    request_id: str, source: str, filename: str, content_length, started: float
+) -> None:
+    """The one INFO record per successful download, written after the body is sent."""
+    size = f"{content_length} bytes" if content_length is not None else "size unknown"
+    elapsed_ms = (time.monotonic() - started) * 1000
+    logger.info("[%s] %s download completed: %s (%s, %.0f ms)", request_id, source, filename, size, elapsed_ms)
+
 
 async def _stream_registered_document(
     source: str,
@@ -48,6 +231,7 @@ async def _stream_registered_document(
     through to the generic handler and became 500s.
     """
     endpoint = f"/download/{primary_id}/{document_identifier}"
+    started = time.monotonic()
     try:
         if not doc_metadata:
             logger.warning(f"[{request_id}] {source} document not found: {primary_id}/{document_identifier}")
@@ -60,7 +244,9 @@ async def _stream_registered_document(
                 detail=f"{source} document not found. Document may not be registered or may have expired."
             )
 
-        download_url = doc_metadata['download_url']
+        download_url, api_key, enhanced_filename = (
+            doc_metadata['download_url'], doc_metadata['api_key'], doc_metadata.get('enhanced_filename')
+        )
         # Defense in depth (audit H2): re-validate the stored URL before
         # attaching the real USPTO API key to an outbound fetch
         try:
@@ -69,24 +255,12 @@ async def _stream_registered_document(
             logger.error(f"[{request_id}] Stored {source} download_url failed host validation")
             raise HTTPException(status_code=502, detail="Stored download URL is not a uspto.gov endpoint")
 
-        api_key = doc_metadata['api_key']
-        enhanced_filename = doc_metadata.get('enhanced_filename')
         filename = enhanced_filename or fallback_filename
-        logger.info(f"[{request_id}] Streaming {source} document: {primary_id}/{document_identifier} as {filename}")
-
-        # Stream the PDF from USPTO API using stored credentials
-        # (magic-byte verified before response headers go out — audit M4)
-        pdf_stream = await _open_upstream_pdf_stream(
-            download_url, {"X-Api-Key": api_key, **upstream_headers}, request_id, source
-        )
-
-        security_logger.log_download_access(primary_id, document_identifier, client_ip, True, request_id)
+        logger.debug("[%s] Streaming %s document: %s/%s as %s", request_id, source, primary_id, document_identifier, filename)
 
-        safe_filename = _safe_filename(filename)
         headers = {
-            "Content-Type": "application/pdf",
-            "Content-Disposition": f'attachment; filename="{safe_filename}"',
-            "X-Document-Source": source,
+            **_SOURCE_STATIC_HEADERS[source],
+            "Content-Disposition": _attachment_disposition(filename),
             "X-Document-Identifier": document_identifier,
             "X-Request-ID": request_id,
             **response_headers_extra,
@@ -94,14 +268,26 @@ async def _stream_registered_document(
         if enhanced_filename:
             headers["X-Enhanced-Filename"] = _safe_header_value(enhanced_filename)
 
-        return StreamingResponse(
-            pdf_stream,
-            media_type="application/pdf",
-            headers=headers,
-            background=BackgroundTask(
-                lambda: logger.info(f"[{request_id}] {source} download completed: {filename}")
-            )
+        # Stream the PDF from USPTO API using stored credentials
+        # (magic-byte verified before response headers go out — audit M4)
+        pdf_body, content_length = await _open_upstream_pdf_stream(
+            download_url, {"X-Api-Key": api_key, **upstream_headers}, request_id, source
         )
+        # Until the response owns the body, a failure here must hand the
+        # download slot back itself
+        try:
+            security_logger.log_download_access(primary_id, document_identifier, client_ip, True, request_id)
+            return _pdf_response(
+                pdf_body,
+                content_length,
+                headers,
+                BackgroundTask(
+                    _log_download_completed, request_id, source, filename, content_length, started
+                ),
+            )
+        except BaseException:
+            await _release_pdf_body(pdf_body)
+            raise
 
     except HTTPException:
         raise
@@ -134,16 +320,15 @@ async def _stream_registered_document(
 async def _download_fpd_document(petition_id: str, document_identifier: str, client_ip: str, request_id: str):
     """Stream an FPD petition document registered with the proxy."""
     doc_metadata = get_fpd_store().get_document(petition_id, document_identifier)
-    fallback_parts = [petition_id[:8]]
+    application_number = doc_metadata.get('application_number') if doc_metadata else None
     extra_headers = {"X-Petition-ID": petition_id}
-    if doc_metadata and doc_metadata.get('application_number'):
-        fallback_parts.append(doc_metadata['application_number'])
-        extra_headers["X-Application-Number"] = doc_metadata['application_number']
-    fallback_parts.append(document_identifier)
+    if application_number:
+        extra_headers["X-Application-Number"] = application_number
+    app_part = f"_{application_number}" if application_number else ""
     return await _stream_registered_document(
         "FPD", petition_id, document_identifier, client_ip, request_id,
         doc_metadata,
-        fallback_filename="_".join(fallback_parts) + ".pdf",
+        fallback_filename=f"{petition_id[:8]}{app_part}_{document_identifier}.pdf",
         upstream_headers={"Accept": "application/pdf"},
         response_headers_extra=extra_headers,
     )
@@ -152,203 +337,149 @@ async def _download_fpd_document(petition_id: str, document_identifier: str, cli
 async def _download_ptab_document(proceeding_number: str, document_identifier: str, client_ip: str, request_id: str):
     """Stream a PTAB proceeding document registered with the proxy."""
     doc_metadata = get_ptab_store().get_document(proceeding_number, document_identifier)
-    fallback_parts = [proceeding_number]
-    if doc_metadata and doc_metadata.get('patent_number'):
-        fallback_parts.append(f"PAT-{doc_metadata['patent_number']}")
-    fallback_parts.append(document_identifier)
+    patent_number, proceeding_type = (
+        (doc_metadata.get('patent_number'), doc_metadata.get('proceeding_type')) if doc_metadata else (None, None)
+    )
+    patent_part = f"_PAT-{patent_number}" if patent_number else ""
     return await _stream_registered_document(
         "PTAB", proceeding_number, document_identifier, client_ip, request_id,
         doc_metadata,
-        fallback_filename="_".join(fallback_parts) + ".pdf",
+        fallback_filename=f"{proceeding_number}{patent_part}_{document_identifier}.pdf",
         upstream_headers={"User-Agent": "USPTO-PFW-MCP/1.0 (PTAB Document Proxy)"},
         response_headers_extra={
             "X-Proceeding-Number": proceeding_number,
-            "X-Proceeding-Type": (doc_metadata or {}).get('proceeding_type') or "unknown",
+            "X-Proceeding-Type": proceeding_type or "unknown",
         },
     )
 
 
 
-@router.get("/download/{app_number}/{document_identifier}", dependencies=[Depends(_check_proxy_token)])
-async def download_document(
-    app_number: str,
-    document_identifier: str,
-    request: Request
+async def _download_pfw_document(
+    app_number: str, document_identifier: str, client_ip: str, request_id: str, started: float,
+    if_none_match: Optional[str] = None,
 ):
+    """Stream a PFW application document, located via its documentBag entry.
+
+    A conditional request whose If-None-Match matches the document's ETag
+    gets a bodyless 304 before the filename lookup or the upstream fetch.
     """
-    Proxy endpoint for downloading USPTO patent documents
+    # Validate application number
+    try:
+        app_number = validate_app_number(app_number)
+    except Exception as e:
+        # Log validation error
+        security_logger.log_validation_error(
+            f"/download/{app_number}/{document_identifier}",
+            client_ip,
+            "invalid_app_number",
+            str(e),
+            request_id
+        )
+        raise HTTPException(status_code=400, detail=f"Invalid application number: {e}")
+
+    # Get document metadata and download URL
+    logger.debug("[%s] Proxying download for app %s, doc %s, IP %s", request_id, app_number, document_identifier, client_ip)
+
+    if if_none_match:
+        # Conditional request: a matching ETag needs only the document index
+        doc_index, title_and_patent = await _get_document_index(app_number), None
+    else:
+        # Document index and filename metadata are independent lookups:
+        # fetch both concurrently
+        doc_index, title_and_patent = await asyncio.gather(
+            _get_document_index(app_number), _get_title_and_patent_number(app_number)
+        )
 
-    This endpoint handles authentication with the USPTO API and streams
-    the PDF content directly to the browser, enabling direct downloads
-    while keeping API keys secure.
+    # Find the target document and its PDF download option
+    target_doc, pdf_option, download_url = _locate_pfw_pdf(doc_index, document_identifier)
 
-    Supports PFW application documents, FPD petition documents, and PTAB proceeding documents:
-    - PFW: /download/{app_number}/{doc_id}
-    - FPD: /download/{petition_id}/{doc_id} (UUID format for petition_id)
-    - PTAB: /download/{proceeding_number}/{doc_id} (AIA Trials: IPR2025-00895, Appeals: 2025000950)
+    # Get document metadata for response headers
+    doc_code = target_doc.get('documentCode', 'UNKNOWN')
+    page_count = pdf_option.get('pageTotalQuantity', 0)
+    etag = _pfw_document_etag(document_identifier, doc_code, page_count)
 
-    Args:
-        app_number: Patent application number (e.g., '17896175'), FPD petition UUID, or PTAB proceeding number
-        document_identifier: Document ID from documentBag (e.g., 'L7AJVPB2GREENX5')
-        request: FastAPI request object (for client IP)
-    """
+    if if_none_match and _etag_matches(if_none_match, etag):
+        logger.debug("[%s] Not modified: %s/%s", request_id, app_number, document_identifier)
+        security_logger.log_download_access(app_number, document_identifier, client_ip, True, request_id)
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _PFW_CACHE_CONTROL})
+
+    invention_title, patent_number = title_and_patent or await _get_title_and_patent_number(app_number)
+
+    # Generate filename using invention title and patent number if available
+    if invention_title:
+        filename = generate_safe_filename(app_number, invention_title, doc_code, patent_number)
+    else:
+        # Fallback to old format if no title available
+        filename = f"{app_number}_{document_identifier}_{doc_code}.pdf"
+
+    # Set appropriate headers for PDF download
+    # Use _safe_filename to guard against any edge-case control chars
+    # from generate_safe_filename output being used in the header.
+    headers = {
+        **_PDF_STATIC_HEADERS,
+        "Content-Disposition": _attachment_disposition(filename),
+        "X-Document-Code": doc_code,
+        "X-Page-Count": str(page_count),
+        "X-Application-Number": app_number,
+        "X-Document-Identifier": document_identifier,
+        "ETag": etag,
+        "Cache-Control": _PFW_CACHE_CONTROL,
+    }
+
+    # Stream the PDF from USPTO API
+    # (magic-byte verified before response headers go out — audit M4)
+    pdf_body, content_length = await _open_upstream_pdf_stream(
+        download_url, _server.api_client.headers, request_id, "PFW"
+    )
+
+    logger.debug("[%s] Streaming PDF: %s (%s pages)", request_id, filename, page_count)
+
+    # Until the response owns the body, a failure here must hand the
+    # download slot back itself
     try:
-        # Get client IP for rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        request_id = generate_request_id()
+        # Log successful download access
+        security_logger.log_download_access(app_number, document_identifier, client_ip, True, request_id)
+        return _pdf_response(
+            pdf_body,
+            content_length,
+            headers,
+            BackgroundTask(
+                _log_download_completed, request_id, "PFW", filename, content_length, started
+            ),
+        )
+    except BaseException:
+        await _release_pdf_body(pdf_body)
+        raise
 
-        # Apply rate limiting
-        if not rate_limiter.is_allowed(client_ip):
-            import time
-            remaining_time = max(1, int(rate_limiter.get_reset_time(client_ip) - time.time()))
-
-            # Log rate limit violation
-            security_logger.log_rate_limit_violation(client_ip, f"/download/{app_number}/{document_identifier}", request_id)
-
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": True,
-                    "message": "Rate limit exceeded. USPTO allows 5 downloads per 10 seconds.",
-                    "retry_after": remaining_time,
-                    "remaining_requests": 0,
-                    "request_id": request_id
-                },
-                headers={"Retry-After": str(int(remaining_time))}
-            )
 
+async def _perform_download(
+    app_number: str, document_identifier: str, client_ip: str, request_id: str, started: float,
+    if_none_match: Optional[str] = None,
+):
+    """Dispatch a download to the FPD, PTAB or PFW path and build the response.
+
+    Shared by the direct and persistent-link routes, which each apply the
+    per-IP rate limit exactly once before calling this. ``if_none_match``
+    (the request's If-None-Match header) only applies to PFW documents.
+    """
+    try:
         # Check if this is an FPD document (UUID format)
         fpd_store = get_fpd_store()
         if fpd_store.is_fpd_petition_id(app_number):
             # Handle FPD petition document download
-            logger.info(f"Detected FPD document request: petition_id={app_number}, doc_id={document_identifier}")
+            logger.debug("Detected FPD document request: petition_id=%s, doc_id=%s", app_number, document_identifier)
             return await _download_fpd_document(app_number, document_identifier, client_ip, request_id)
 
         # Check if this is a PTAB document (proceeding number format)
         ptab_store = get_ptab_store()
         if ptab_store.is_ptab_proceeding_number(app_number):
             # Handle PTAB proceeding document download
-            logger.info(f"Detected PTAB document request: proceeding_number={app_number}, doc_id={document_identifier}")
+            logger.debug("Detected PTAB document request: proceeding_number=%s, doc_id=%s", app_number, document_identifier)
             return await _download_ptab_document(app_number, document_identifier, client_ip, request_id)
 
-        # Handle PFW application document download (existing logic)
-        # Validate application number
-        try:
-            app_number = validate_app_number(app_number)
-        except Exception as e:
-            # Log validation error
-            security_logger.log_validation_error(
-                f"/download/{app_number}/{document_identifier}",
-                client_ip,
-                "invalid_app_number",
-                str(e),
-                request_id
-            )
-            raise HTTPException(status_code=400, detail=f"Invalid application number: {e}")
-
-        # Get document metadata and download URL
-        logger.info(f"Proxying download for app {app_number}, doc {document_identifier}, IP {client_ip}")
-
-        # Get documents to find the specific document
-        docs_result = await _server.api_client.get_documents(app_number)
-        if docs_result.get('error'):
-            raise HTTPException(status_code=404, detail=docs_result.get('message', 'Document not found'))
-
-        documents = docs_result.get('documentBag', [])
-
-        # Find the target document
-        target_doc = None
-        for doc in documents:
-            if doc.get('documentIdentifier') == document_identifier:
-                target_doc = doc
-                break
-
-        if not target_doc:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Document with identifier '{document_identifier}' not found"
-            )
-
-        # Find PDF download option
-        download_options = target_doc.get('downloadOptionBag', [])
-        pdf_option = None
-
-        for option in download_options:
-            if option.get('mimeTypeIdentifier') == 'PDF':
-                pdf_option = option
-                break
-
-        if not pdf_option:
-            raise HTTPException(status_code=404, detail="PDF not available for this document")
-
-        download_url = pdf_option.get('downloadUrl')
-        if not download_url:
-            raise HTTPException(status_code=404, detail="Download URL not available")
-
-        # Get document metadata for response headers
-        doc_code = target_doc.get('documentCode', 'UNKNOWN')
-        page_count = pdf_option.get('pageTotalQuantity', 0)
-
-        # Get invention title and patent number for better filename
-        invention_title = None
-        patent_number = None
-        try:
-            # Search for the application to get the title and patent number info
-            search_result = await _server.api_client.search_applications(
-                f"applicationNumberText:{app_number}",
-                limit=1,
-                offset=0,
-                fields=["applicationMetaData.inventionTitle", "applicationMetaData.patentNumber"]
-            )
-            if search_result.get('success'):
-                apps = search_result.get('patentFileWrapperDataBag') or search_result.get('applications')
-                if apps:
-                    app_data = apps[0]
-                    invention_title = app_data.get('applicationMetaData', {}).get('inventionTitle')
-                    # Extract patent number using helper function
-                    from ...api.helpers import extract_patent_number
-                    patent_number = extract_patent_number(app_data)
-        except Exception as e:
-            logger.warning(f"Could not fetch application metadata for {app_number}: {e}")
-
-        # Generate filename using invention title and patent number if available
-        if invention_title:
-            from ...api.helpers import generate_safe_filename
-            filename = generate_safe_filename(app_number, invention_title, doc_code, patent_number)
-        else:
-            # Fallback to old format if no title available
-            filename = f"{app_number}_{document_identifier}_{doc_code}.pdf"
-
-        # Stream the PDF from USPTO API
-        # (magic-byte verified before response headers go out — audit M4)
-        pdf_stream = await _open_upstream_pdf_stream(
-            download_url, _server.api_client.headers, request_id, "PFW"
-        )
-
-        # Set appropriate headers for PDF download
-        # Use _safe_filename to guard against any edge-case control chars
-        # from generate_safe_filename output being used in the header.
-        headers = {
-            "Content-Type": "application/pdf",
-            "Content-Disposition": f'attachment; filename="{_safe_filename(filename)}"',
-            "X-Document-Code": doc_code,
-            "X-Page-Count": str(page_count),
-            "X-Application-Number": app_number,
-            "X-Document-Identifier": document_identifier
-        }
-
-        logger.info(f"Streaming PDF: {filename} ({page_count} pages)")
-
-        # Log successful download access
-        security_logger.log_download_access(app_number, document_identifier, client_ip, True, request_id)
-
-        return StreamingResponse(
-            pdf_stream,
-            media_type="application/pdf",
-            headers=headers,
-            background=BackgroundTask(
-                lambda: logger.info(f"Download completed: {filename}")
-            )
+        # Handle PFW application document download
+        return await _download_pfw_document(
+            app_number, document_identifier, client_ip, request_id, started, if_none_match
         )
 
     except HTTPException:
@@ -377,6 +508,60 @@ async def download_document(
         raise HTTPException(status_code=500, detail=f"Download failed: {str(e)}")
 
 
+def _download_rate_limited(client_ip: str, endpoint: str, request_id: str) -> ORJSONResponse:
+    """Log the violation and build the 429 for a rate-limited download."""
+    remaining_time = max(1, int(rate_limiter.get_reset_time(client_ip) - time.time()))
+    security_logger.log_rate_limit_violation(client_ip, endpoint, request_id)
+    return ORJSONResponse(
+        status_code=429,
+        content={
+            "error": True,
+            "message": "Rate limit exceeded. USPTO allows 5 downloads per 10 seconds.",
+            "retry_after": remaining_time,
+            "remaining_requests": 0,
+            "request_id": request_id
+        },
+        headers={"Retry-After": str(int(remaining_time))}
+    )
+
+
+@router.get("/download/{app_number}/{document_identifier}", dependencies=[Depends(_check_proxy_token)])
+async def download_document(
+    app_number: str,
+    document_identifier: str,
+    request: Request
+):
+    """
+    Proxy endpoint for downloading USPTO patent documents
+
+    This endpoint handles authentication with the USPTO API and streams
+    the PDF content directly to the browser, enabling direct downloads
+    while keeping API keys secure.
+
+    Supports PFW application documents, FPD petition documents, and PTAB proceeding documents:
+    - PFW: /download/{app_number}/{doc_id}
+    - FPD: /download/{petition_id}/{doc_id} (UUID format for petition_id)
+    - PTAB: /download/{proceeding_number}/{doc_id} (AIA Trials: IPR2025-00895, Appeals: 2025000950)
+
+    Args:
+        app_number: Patent application number (e.g., '17896175'), FPD petition UUID, or PTAB proceeding number
+        document_identifier: Document ID from documentBag (e.g., 'L7AJVPB2GREENX5')
+        request: FastAPI request object (for client IP)
+    """
+    started = time.monotonic()
+    # Get client IP for rate limiting
+    request_id, client_ip = _request_context(request)
+
+    # Apply rate limiting
+    if not rate_limiter.is_allowed(client_ip):
+        return _download_rate_limited(client_ip, f"/download/{app_number}/{document_identifier}", request_id)
+
+    return await _perform_download(
+        app_number, document_identifier, client_ip, request_id, started,
+        request.headers.get("if-none-match"),
+    )
+
+
 @router.get("/document/persistent/{link_hash}")
 async def download_document_persistent(link_hash: str, request: Request):
     """
@@ -385,33 +570,15 @@ async def download_document_persistent(link_hash: str, request: Request):
     This endpoint resolves opaque persistent links and streams the document
     while maintaining security and rate limiting.
     """
+    started = time.monotonic()
     try:
-        from ..secure_link_cache import get_link_cache
-
         # Get client IP for rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        request_id = generate_request_id()
+        request_id, client_ip = _request_context(request)
 
-        # Apply rate limiting
+        # Apply rate limiting — truncated hash only in the violation log
+        # (the full hash is the credential, Lesson 43)
         if not rate_limiter.is_allowed(client_ip):
-            import time
-            remaining_time = max(1, int(rate_limiter.get_reset_time(client_ip) - time.time()))
-
-            # Log rate limit violation — truncated hash only (the full
-            # hash is the credential, Lesson 43)
-            security_logger.log_rate_limit_violation(client_ip, f"/document/persistent/{link_hash[:8]}...", request_id)
-
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": True,
-                    "message": "Rate limit exceeded. USPTO allows 5 downloads per 10 seconds.",
-                    "retry_after": remaining_time,
-                    "remaining_requests": 0,
-                    "request_id": request_id
-                },
-                headers={"Retry-After": str(int(remaining_time))}
-            )
+            return _download_rate_limited(client_ip, f"/document/persistent/{link_hash[:8]}...", request_id)
 
         # Resolve persistent link
         link_cache = get_link_cache()
@@ -433,10 +600,18 @@ async def download_document_persistent(link_hash: str, request: Request):
         app_number = link_info['app_number']
         document_identifier = link_info['doc_id']
 
-        logger.info(f"Resolving persistent link {link_hash[:8]}... for app {app_number}, doc {document_identifier} (access #{link_info['access_count']})")
+        logger.info(
+            "Resolving persistent link %s... for app %s, doc %s (access #%s)",
+            link_hash[:8], app_number, document_identifier, link_info['access_count'],
+        )
 
-        # Continue with standard download logic
-        return await download_document(app_number, document_identifier, request)
+        # Continue with the standard download logic. Calls the shared core
+        # directly: re-entering download_document() charged the client's
+        # rate limit a second time for the same download.
+        return await _perform_download(
+            app_number, document_identifier, client_ip, request_id, started,
+            request.headers.get("if-none-match"),
+        )
 
     except HTTPException:
         raise
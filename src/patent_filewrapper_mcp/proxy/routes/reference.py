@@ -1,12 +1,26 @@
 """Reference-data routes for the PFW proxy: document-code table and
 reflections resources (carved out of create_proxy_app() — audit F4)."""
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
+import codecs
+import csv
+import email.utils
+import functools
+import gzip
+import hashlib
+import heapq
+import io
+import mmap
+import operator
+import os
 import time
-from typing import Optional
+from pathlib import Path
+from typing import NamedTuple, Optional
 
+from ...reflections.reflection_manager import get_reflection_manager
 from ...shared.safe_logger import get_safe_logger
+from ..server import _etag_matches
 
 
 logger = get_safe_logger(__name__)
@@ -14,6 +28,16 @@ logger = get_safe_logger(__name__)
 router = APIRouter()
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_tags(tags: str) -> tuple[str, ...]:
+    """Split a comma-separated tags query value, dropping blanks.
+
+    Memoized: clients send the same handful of tag filters repeatedly.
+    Returns a tuple so cached results can't be mutated by a caller.
+    """
+    return tuple(filter(None, map(str.strip, tags.split(','))))
+
+
 @router.get("/reflections")
 async def list_reflections(mcp_type: Optional[str] = None, tags: Optional[str] = None):
     """
@@ -24,17 +48,13 @@ async def list_reflections(mcp_type: Optional[str] = None, tags: Optional[str] =
         tags: Comma-separated list of tags to filter by
     """
     try:
-        from ...reflections.reflection_manager import get_reflection_manager
-
         # Parse tags parameter
-        tag_list = None
-        if tags:
-            tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
+        tag_list = _parse_tags(tags) if tags else None
 
         reflection_manager = get_reflection_manager()
         resources = reflection_manager.list_resources(mcp_type=mcp_type, tags=tag_list)
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "resources": resources,
             "count": len(resources),
@@ -42,14 +62,62 @@ async def list_reflections(mcp_type: Optional[str] = None, tags: Optional[str] =
                 "mcp_type": mcp_type,
                 "tags": tag_list
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error listing reflections: {e}")
-        return {"success": False, "error": str(e)}
+        return ORJSONResponse({"success": False, "error": str(e)})
+
+def _coding_quality(params: str) -> float:
+    """q-value of one Accept-Encoding entry's parameters (1 when absent, 0 when malformed)."""
+    params = params.replace(" ", "")
+    if not params.startswith("q="):
+        return 1.0
+    try:
+        return float(params[2:])
+    except ValueError:
+        return 0.0
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding value allows gzip (an explicit q=0 refuses it).
+
+    Per RFC 9110, a listed ``gzip`` decides by its own q-value wherever it
+    appears; ``*`` only applies when gzip is not listed at all.
+    """
+    wildcard_quality = 0.0
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip()
+        if name == "gzip":
+            return _coding_quality(params) > 0
+        if name == "*":
+            wildcard_quality = _coding_quality(params)
+    return wildcard_quality > 0
+
+
+def _reflection_markdown_response(
+    encoded: tuple[bytes, bytes], accept_encoding: str, mcp_type: str, resource_name: str
+) -> Response:
+    """Serve precomputed reflection markdown, gzipped when the client accepts it."""
+    headers = {
+        "Content-Type": "text/markdown; charset=utf-8",
+        "X-Resource-Type": "USPTO-MCP-Reflection",
+        "X-MCP-Type": mcp_type,
+        "X-Resource-Name": resource_name,
+        "Vary": "Accept-Encoding",
+    }
+    raw, compressed = encoded
+    if _accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=compressed, media_type="text/markdown", headers=headers)
+    return Response(content=raw, media_type="text/markdown", headers=headers)
+
 
 @router.get("/reflections/{mcp_type}/{resource_name}")
-async def get_reflection_resource(mcp_type: str, resource_name: str, format: str = "markdown"):
+async def get_reflection_resource(
+    mcp_type: str, resource_name: str, request: Request, format: str = "markdown"
+):
     """
     Get specific reflection resource content
 
@@ -61,56 +129,38 @@ async def get_reflection_resource(mcp_type: str, resource_name: str, format: str
         format: Response format (markdown, json, summary)
     """
     try:
-        from ...reflections.reflection_manager import get_reflection_manager
-
         resource_path = f"/reflections/{mcp_type}/{resource_name}"
         reflection_manager = get_reflection_manager()
 
+        # One (mcp_type, resource_name) lookup serves every format
+        reflection = reflection_manager.get_reflection_by_uri(resource_path)
+        if reflection is None:
+            raise HTTPException(status_code=404, detail="Resource not found")
+
         if format == "summary":
             # Get resource metadata and summary
-            resources = reflection_manager.list_resources(mcp_type=mcp_type)
-            matching_resource = None
-            for resource in resources:
-                if resource['uri'] == resource_path:
-                    matching_resource = resource
-                    break
-
-            if not matching_resource:
-                raise HTTPException(status_code=404, detail="Resource not found")
-
-            reflection = reflection_manager.get_reflection_by_name(resource_name)
-            if reflection:
-                return {
-                    "success": True,
-                    "resource": matching_resource,
-                    "summary": reflection.get_summary(),
-                    "format": "summary"
-                }
+            return ORJSONResponse({
+                "success": True,
+                "resource": reflection.to_resource_format(),
+                "summary": reflection.get_summary(),
+                "format": "summary"
+            })
 
         elif format == "json":
             # Get resource as JSON metadata
-            reflection = reflection_manager.get_reflection_by_name(resource_name)
-            if reflection:
-                return {
-                    "success": True,
-                    "metadata": reflection.get_metadata(),
-                    "content_available": True,
-                    "format": "json"
-                }
+            return ORJSONResponse({
+                "success": True,
+                "metadata": reflection.get_metadata(),
+                "content_available": True,
+                "format": "json"
+            })
 
         else:
-            # Get full content as markdown (default)
-            content = reflection_manager.get_resource(resource_path)
-            if content:
-                return Response(
-                    content=content,
-                    media_type="text/markdown",
-                    headers={
-                        "Content-Type": "text/markdown; charset=utf-8",
-                        "X-Resource-Type": "USPTO-MCP-Reflection",
-                        "X-MCP-Type": mcp_type,
-                        "X-Resource-Name": resource_name
-                    }
+            # Get full content as markdown (default), precomputed at load
+            encoded = reflection_manager.get_resource_bytes(resource_path)
+            if encoded:
+                return _reflection_markdown_response(
+                    encoded, request.headers.get("accept-encoding", ""), mcp_type, resource_name
                 )
 
         raise HTTPException(status_code=404, detail="Resource not found")
@@ -125,12 +175,10 @@ async def get_reflection_resource(mcp_type: str, resource_name: str, format: str
 async def get_reflection_stats():
     """Get reflection statistics for monitoring"""
     try:
-        from ...reflections.reflection_manager import get_reflection_manager
-
         reflection_manager = get_reflection_manager()
         stats = reflection_manager.get_statistics()
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "stats": stats,
             "endpoints": {
@@ -138,195 +186,269 @@ async def get_reflection_stats():
                 "get_resource": "/reflections/{mcp_type}/{resource_name}",
                 "statistics": "/reflections/stats"
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error getting reflection stats: {e}")
-        return {"success": False, "error": str(e)}
+        return ORJSONResponse({"success": False, "error": str(e)})
+
+
+_DOC_CODES_TABLE_HEADER = "| Code | Description | Business Process |\n|------|-------------|------------------|\n"
+_DOC_CODES_RESPONSE_HEADERS = {
+    "Content-Type": "text/markdown; charset=utf-8",
+    "X-Resource-Type": "USPTO-DOC-CODES",
+    "X-Source": "USPTO-EFS-Web",
+    # Fresh for 1 hour, then servable stale for a day while revalidating
+    "Cache-Control": "public, max-age=3600, stale-while-revalidate=86400"
+}
+
+# reference/ in the project root, four levels up from
+# src/patent_filewrapper_mcp/proxy/routes/
+_DOC_CODES_CSV_PATH = Path(__file__).resolve().parents[4] / "reference" / "Document_Descriptions_List.csv"
+
+class _DocCodesBody(NamedTuple):
+    """The rendered /doc-codes table in both content codings, each with
+    its own ETag (a strong validator is per representation)."""
+    markdown: bytes
+    gzipped: bytes
+    etag: str
+    gzip_etag: str
+    modified_at: int  # CSV mtime, whole seconds (HTTP-date precision)
+    last_modified: str
+    generated_at: str
+
+
+# Rendered /doc-codes body as (last mtime check, CSV mtime, _DocCodesBody).
+# The CSV is static reference data, so it's parsed and compressed once and
+# re-rendered only if the file changes; the mtime itself is re-checked at
+# most once a minute.
+_DOC_CODES_RECHECK_SECONDS = 60.0
+_doc_codes_cache: Optional[tuple[float, float, _DocCodesBody]] = None
+
+
+class _DocCodeEntry(NamedTuple):
+    """One rendered row of the document-code table."""
+    code: str
+    description: str
+    process: str
+
+
+_BY_CODE = operator.itemgetter(0)
+
+_LINE_BREAKS_TO_SPACES = str.maketrans({'\n': ' ', '\r': ' '})
+
+
+def _clean_doc_code_field(text: str, max_length: int) -> str:
+    """Flatten, ASCII-fold, truncate and pipe-escape one CSV cell for a markdown table."""
+    text = text.strip().translate(_LINE_BREAKS_TO_SPACES)
+    # Replace each non-ASCII character with '?' in one C-level pass
+    text = text.encode('ascii', 'replace').decode('ascii')
+    # Limit lengths for readability
+    if len(text) > max_length:
+        text = text[:max_length - 3] + "..."
+    # Escape pipe characters for markdown table
+    return text.replace('|', '\\|')
+
+
+def _parse_doc_code_rows(file) -> tuple[list, list, list]:
+    """Split CSV rows into (prosecution, ptab, fpd) code entries."""
+    prosecution_codes = []
+    ptab_codes = []
+    fpd_codes = []
+
+    rows = list(csv.reader(file))
+    # The USPTO export opens with a title row ahead of the column header:
+    # start after the header so the row loop needs no header check. If the
+    # header text ever changes, parse every row rather than silently
+    # serving (and caching) an empty table.
+    start = next(
+        (index + 1 for index, row in enumerate(rows) if len(row) >= 4 and row[3].strip() == "DOC CODE"),
+        None,
+    )
+    if start is None:
+        logger.warning("Document-description CSV has no DOC CODE header row; parsing from the first row")
+        start = 0
+
+    for row in rows[start:]:
+        if len(row) < 4:
+            continue
+        category, description, business_process, doc_code = row[:4]
+        doc_code = doc_code.strip()
+        if not doc_code:
+            continue
+
+        code_entry = _DocCodeEntry(
+            doc_code, _clean_doc_code_field(description, 120), _clean_doc_code_field(business_process, 100)
+        )
+
+        if 'PTAB' in category:
+            ptab_codes.append(code_entry)
+        elif 'FPD' in category or 'Final Petition Decision' in category:
+            fpd_codes.append(code_entry)
+        else:
+            prosecution_codes.append(code_entry)
+
+    return prosecution_codes, ptab_codes, fpd_codes
+
+
+def _decode_doc_codes_csv(raw) -> str:
+    """Decode the CSV bytes (any buffer): UTF-8 (BOM stripped) when valid,
+    else Latin-1.
+
+    Latin-1 maps every byte, so it is the terminal fallback; the USPTO
+    export itself is not valid UTF-8.
+    """
+    with memoryview(raw) as view:
+        start = len(codecs.BOM_UTF8) if view[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+        with view[start:] as body:
+            try:
+                return str(body, 'utf-8')
+            except UnicodeDecodeError:
+                logger.debug("Document-description CSV is not UTF-8; decoding as Latin-1")
+                return str(body, 'latin-1')
+
+
+def _read_doc_code_sections(csv_path: Path) -> tuple[list, list, list]:
+    """Parse the document-description CSV, decoding straight from a
+    read-only memory map of the file (no intermediate bytes copy)."""
+    with open(csv_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return [], [], []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = _decode_doc_codes_csv(mapped)
+    return _parse_doc_code_rows(io.StringIO(text, newline=''))
+
+
+def _write_doc_code_rows(out: io.StringIO, codes: list, limit: Optional[int] = None) -> None:
+    """Write one section's markdown rows, sorted by code (the first ``limit`` only)."""
+    # nsmallest keeps a bounded heap instead of sorting rows that are cut;
+    # like sorted(), it is stable for equal codes
+    ordered = sorted(codes, key=_BY_CODE) if limit is None else heapq.nsmallest(limit, codes, key=_BY_CODE)
+    for entry in ordered:
+        out.write(f"| `{entry.code}` | {entry.description} | {entry.process} |\n")
+
+
+# Constant portions of the /doc-codes markdown, assembled once at import
+_DOC_CODES_INTRO = (
+    "# USPTO Document Code Decoder Table\n"
+    "\n"
+    "**Source**: [USPTO EFS-Web Document Description List](https://www.uspto.gov/patents/apply/filing-online/efs-info-document-description)\n"
+    "**Updated**: April 27, 2022\n"
+    "\n"
+    "This table provides document codes used in USPTO patent prosecution, PTAB proceedings, and FPD petitions.\n"
+    "\n"
+)
+_DOC_CODES_PROSECUTION_HEADING = "## Common Prosecution Document Codes\n\n" + _DOC_CODES_TABLE_HEADER
+_DOC_CODES_PTAB_HEADING = (
+    "\n## PTAB (Patent Trial and Appeal Board) Document Codes\n\n" + _DOC_CODES_TABLE_HEADER
+)
+_DOC_CODES_FPD_HEADING = "\n## FPD (Final Petition Decision) Document Codes\n\n" + _DOC_CODES_TABLE_HEADER
+_DOC_CODES_QUICK_REFERENCE = (
+    "\n"
+    "## Quick Reference - Most Common Codes\n"
+    "\n"
+    "| Code | Document Type |\n"
+    "|------|---------------|\n"
+    "| `A...` | Amendment/Request for Reconsideration-After Non-Final Rejection |\n"
+    "| `A.PE` | Preliminary Amendment |\n"
+    "| `A.NE` | Response After Final Action |\n"
+    "| `SPEC` | Specification |\n"
+    "| `CLM` | Claims |\n"
+    "| `DRW` | Drawings (black and white line drawings) |\n"
+    "| `N/AP` | Notice of Appeal Filed |\n"
+    "| `AP.B` | Appeal Brief Filed |\n"
+    "| `APRB` | Reply Brief Filed |\n"
+    "| `PA..` | Power of Attorney |\n"
+    "| `IDS` | Information Disclosure Statement |\n"
+    "\n"
+    "---\n"
+    "*This table is generated from the USPTO EFS-Web Document Description List and includes document codes used in patent prosecution, PTAB proceedings, and FPD petitions.*\n"
+)
+
+
+def _render_doc_codes_markdown(prosecution_codes: list, ptab_codes: list, fpd_codes: list) -> str:
+    """Render the document-code markdown into a single string buffer."""
+    out = io.StringIO()
+    out.write(_DOC_CODES_INTRO)
+
+    # Common prosecution codes, limited to the first 60 for readability
+    out.write(_DOC_CODES_PROSECUTION_HEADING)
+    _write_doc_code_rows(out, prosecution_codes, limit=60)
+
+    if ptab_codes:
+        out.write(_DOC_CODES_PTAB_HEADING)
+        _write_doc_code_rows(out, ptab_codes)
+
+    if fpd_codes:
+        out.write(_DOC_CODES_FPD_HEADING)
+        _write_doc_code_rows(out, fpd_codes)
+
+    out.write(_DOC_CODES_QUICK_REFERENCE)
+    return out.getvalue()
+
+
+def _get_doc_codes_markdown() -> _DocCodesBody:
+    """Rendered document-code table (plain and gzipped) and its ETag,
+    rebuilt only when the CSV's mtime changes."""
+    global _doc_codes_cache
+    now = time.monotonic()
+    cached = _doc_codes_cache
+    if cached is not None and now - cached[0] < _DOC_CODES_RECHECK_SECONDS:
+        return cached[2]
+
+    try:
+        mtime = _DOC_CODES_CSV_PATH.stat().st_mtime
+    except OSError:
+        raise FileNotFoundError(f"Document_Descriptions_List.csv not found at {_DOC_CODES_CSV_PATH}")
+
+    if cached is not None and cached[1] == mtime:
+        _doc_codes_cache = (now, mtime, cached[2])
+        return cached[2]
+
+    body = _render_doc_codes_markdown(*_read_doc_code_sections(_DOC_CODES_CSV_PATH)).encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    rendered = _DocCodesBody(
+        body, gzip.compress(body, compresslevel=6, mtime=0), etag, etag[:-1] + '-gzip"',
+        int(mtime), email.utils.formatdate(mtime, usegmt=True),
+        time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
+    )
+    _doc_codes_cache = (now, mtime, rendered)
+    logger.info(f"Generated document codes table ({len(body)} bytes, {len(rendered.gzipped)} gzipped)")
+    return rendered
+
+
+def _doc_codes_not_modified(request: Request, etag: str, modified_at: int) -> bool:
+    """Conditional GET check: If-None-Match when sent, else If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since:
+        return False
+    try:
+        return modified_at <= email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
 
 
 @router.get("/doc-codes")
-async def get_doc_codes():
+async def get_doc_codes(request: Request):
     """
     Serve USPTO Document Code Decoder Table
 
     This endpoint provides a formatted markdown table of USPTO document codes
-    for patent prosecution, PTAB proceedings, and FPD petitions.
+    for patent prosecution, PTAB proceedings, and FPD petitions. The table is
+    rendered on first use and served from memory afterwards; a matching
+    If-None-Match (or, without one, If-Modified-Since against the CSV's
+    mtime) gets a bodyless 304.
 
     Source: https://www.uspto.gov/patents/apply/filing-online/efs-info-document-description
     """
     try:
-        import csv
-        import os
-
-        # Find the CSV file relative to project root
-        # Get project root (go up from src/patent_filewrapper_mcp/proxy/)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.join(current_dir, "..", "..", "..")
-        csv_path = os.path.join(project_root, "reference", "Document_Descriptions_List.csv")
-
-        if not os.path.exists(csv_path):
-            raise FileNotFoundError(f"Document_Descriptions_List.csv not found at {csv_path}")
-
-        # Parse CSV and format as markdown
-        output = []
-        output.append("# USPTO Document Code Decoder Table")
-        output.append("")
-        output.append("**Source**: [USPTO EFS-Web Document Description List](https://www.uspto.gov/patents/apply/filing-online/efs-info-document-description)")
-        output.append("**Updated**: April 27, 2022")
-        output.append("")
-        output.append("This table provides document codes used in USPTO patent prosecution, PTAB proceedings, and FPD petitions.")
-        output.append("")
-
-        prosecution_codes = []
-        ptab_codes = []
-        fpd_codes = []
-
-        # Try multiple encodings to handle the CSV file
-        encodings_to_try = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1']
-
-        for encoding in encodings_to_try:
-            try:
-                logger.info(f"Trying to read CSV with encoding: {encoding}")
-                with open(csv_path, 'r', encoding=encoding) as file:
-                    csv_reader = csv.reader(file)
-                    headers = None
-
-                    for row in csv_reader:
-                        if not headers:
-                            headers = row
-                            continue
-
-                        if len(row) >= 4:
-                            category = row[0].strip()
-                            description = row[1].strip()
-                            business_process = row[2].strip()
-                            doc_code = row[3].strip()
-
-                            if doc_code and doc_code != "DOC CODE":
-                                # Clean up description and business process
-                                description = description.replace('\n', ' ').replace('\r', ' ')
-                                business_process = business_process.replace('\n', ' ').replace('\r', ' ')
-
-                                # Remove any problematic characters
-                                description = ''.join(char if ord(char) < 128 else '?' for char in description)
-                                business_process = ''.join(char if ord(char) < 128 else '?' for char in business_process)
-
-                                # Limit lengths for readability
-                                if len(description) > 120:
-                                    description = description[:117] + "..."
-                                if len(business_process) > 100:
-                                    business_process = business_process[:97] + "..."
-
-                                # Escape pipe characters for markdown table
-                                description = description.replace('|', '\\|')
-                                business_process = business_process.replace('|', '\\|')
-
-                                code_entry = {
-                                    'code': doc_code,
-                                    'description': description,
-                                    'process': business_process,
-                                    'category': category
-                                }
-
-                                if 'PTAB' in category:
-                                    ptab_codes.append(code_entry)
-                                elif 'FPD' in category or 'Final Petition Decision' in category:
-                                    fpd_codes.append(code_entry)
-                                else:
-                                    prosecution_codes.append(code_entry)
-
-                logger.info(f"Successfully read CSV with {encoding} encoding")
-                break  # Success - exit the encoding loop
-
-            except UnicodeDecodeError as e:
-                logger.warning(f"Failed to read CSV with {encoding} encoding: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Error reading CSV with {encoding} encoding: {e}")
-                continue
-        else:
-            # If we get here, all encodings failed
-            raise FileNotFoundError(f"Unable to read CSV file with any of the attempted encodings: {encodings_to_try}")
-
-        # Add common prosecution codes section
-        output.append("## Common Prosecution Document Codes")
-        output.append("")
-        output.append("| Code | Description | Business Process |")
-        output.append("|------|-------------|------------------|")
-
-        # Sort prosecution codes by code for better organization
-        prosecution_codes.sort(key=lambda x: x['code'])
-
-        for code_info in prosecution_codes[:60]:  # Limit to first 60 for readability
-            output.append(f"| `{code_info['code']}` | {code_info['description']} | {code_info['process']} |")
-
-        # Add PTAB codes section if available
-        if ptab_codes:
-            output.append("")
-            output.append("## PTAB (Patent Trial and Appeal Board) Document Codes")
-            output.append("")
-            output.append("| Code | Description | Business Process |")
-            output.append("|------|-------------|------------------|")
-
-            ptab_codes.sort(key=lambda x: x['code'])
-
-            for code_info in ptab_codes:
-                output.append(f"| `{code_info['code']}` | {code_info['description']} | {code_info['process']} |")
-
-        # Add FPD codes section if available
-        if fpd_codes:
-            output.append("")
-            output.append("## FPD (Final Petition Decision) Document Codes")
-            output.append("")
-            output.append("| Code | Description | Business Process |")
-            output.append("|------|-------------|------------------|")
-
-            fpd_codes.sort(key=lambda x: x['code'])
-
-            for code_info in fpd_codes:
-                output.append(f"| `{code_info['code']}` | {code_info['description']} | {code_info['process']} |")
-
-        # Add common codes reference
-        output.append("")
-        output.append("## Quick Reference - Most Common Codes")
-        output.append("")
-        output.append("| Code | Document Type |")
-        output.append("|------|---------------|")
-        output.append("| `A...` | Amendment/Request for Reconsideration-After Non-Final Rejection |")
-        output.append("| `A.PE` | Preliminary Amendment |")
-        output.append("| `A.NE` | Response After Final Action |")
-        output.append("| `SPEC` | Specification |")
-        output.append("| `CLM` | Claims |")
-        output.append("| `DRW` | Drawings (black and white line drawings) |")
-        output.append("| `N/AP` | Notice of Appeal Filed |")
-        output.append("| `AP.B` | Appeal Brief Filed |")
-        output.append("| `APRB` | Reply Brief Filed |")
-        output.append("| `PA..` | Power of Attorney |")
-        output.append("| `IDS` | Information Disclosure Statement |")
-        output.append("")
-        output.append("---")
-        output.append("*This table is generated from the USPTO EFS-Web Document Description List and includes document codes used in patent prosecution, PTAB proceedings, and FPD petitions.*")
-        output.append("")
-        output.append(f"**Generated**: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}")
-
-        result = "\n".join(output)
-        logger.info(f"Generated document codes table ({len(result)} characters)")
-
-        return Response(
-            content=result,
-            media_type="text/markdown",
-            headers={
-                "Content-Type": "text/markdown; charset=utf-8",
-                "X-Resource-Type": "USPTO-DOC-CODES",
-                "X-Source": "USPTO-EFS-Web",
-                "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
-            }
-        )
-
+        rendered = _get_doc_codes_markdown()
     except Exception as e:
         logger.error(f"Error generating document codes table: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": True,
@@ -335,3 +457,26 @@ async def get_doc_codes():
             }
         )
 
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        content, etag = rendered.gzipped, rendered.gzip_etag
+        headers = {**_DOC_CODES_RESPONSE_HEADERS, "Content-Encoding": "gzip"}
+    else:
+        content, etag = rendered.markdown, rendered.etag
+        headers = dict(_DOC_CODES_RESPONSE_HEADERS)
+    headers.update({
+        "ETag": etag,
+        "Last-Modified": rendered.last_modified,
+        "X-Generated-At": rendered.generated_at,
+        "Vary": "Accept-Encoding",
+    })
+    if _doc_codes_not_modified(request, etag, rendered.modified_at):
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": etag,
+                "Last-Modified": rendered.last_modified,
+                "Cache-Control": headers["Cache-Control"],
+                "Vary": "Accept-Encoding",
+            },
+        )
+    return Response(content=content, media_type="text/markdown", headers=headers)
@@ -2,13 +2,14 @@
 create_proxy_app() — audit F4)."""
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import os
 import time
+from typing import Optional
 
-from ...api.helpers import generate_request_id
 from ...shared.internal_auth import get_pfw_auth
 from ...shared.safe_logger import get_safe_logger
+from ...shared_secure_storage import get_uspto_api_key
 from ...util.security_logger import security_logger
 from ..fpd_document_store import get_fpd_store
 from ..models import (
@@ -19,11 +20,29 @@ from ..models import (
 )
 from ..ptab_document_store import get_ptab_store
 from ..rate_limiter import rate_limiter
+from ..secure_link_cache import get_link_cache
+from ..server import _request_context
 
 logger = get_safe_logger(__name__)
 
 router = APIRouter()
 
+# Base URL for the links returned to registering MCPs. Configuration is fixed
+# for the process lifetime, so resolve it once (same precedence as
+# tools/document_tools.py: PFW_PROXY_BASE_URL, else localhost on the
+# PFW_PROXY_PORT / PROXY_PORT / 8080 port).
+_PROXY_PORT = int(os.getenv('PFW_PROXY_PORT', os.getenv('PROXY_PORT', '8080')))
+_PROXY_BASE_URL = os.getenv("PFW_PROXY_BASE_URL", f"http://localhost:{_PROXY_PORT}")
+
+
+def _get_pfw_uspto_api_key() -> Optional[str]:
+    """PFW's USPTO API key (secure storage, else USPTO_API_KEY).
+
+    Not cached here: secure storage reuses the decrypted key until the key
+    file changes, so a rotated key is picked up by the next registration.
+    """
+    return get_uspto_api_key() or os.getenv("USPTO_API_KEY") or None
+
 @router.post("/register-fpd-document", response_model=FPDDocumentRegistrationResponse)
 async def register_fpd_document(registration: FPDDocumentRegistration, request: Request):
     """
@@ -36,12 +55,9 @@ async def register_fpd_document(registration: FPDDocumentRegistration, request:
         registration: FPD document registration payload
         request: FastAPI request object (for client IP logging)
     """
-    import os  # Import at function scope to ensure availability
-
     try:
         # Get client IP for logging and rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        request_id = generate_request_id()
+        request_id, client_ip = _request_context(request)
 
         # Rate-limit registration endpoints: 10 req/min per IP
         if not rate_limiter.is_allowed(client_ip, limit=10, window=60.0):
@@ -49,7 +65,7 @@ async def register_fpd_document(registration: FPDDocumentRegistration, request:
             security_logger.log_rate_limit_violation(
                 client_ip, "/register-fpd-document", request_id
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={
                     "error": True,
@@ -107,12 +123,7 @@ async def register_fpd_document(registration: FPDDocumentRegistration, request:
 
         # Get PFW's own secure USPTO API key (don't use the one from FPD)
         try:
-            from ...shared_secure_storage import get_uspto_api_key
-            pfw_uspto_api_key = get_uspto_api_key()
-            if not pfw_uspto_api_key:
-                # Fall back to environment variable
-                pfw_uspto_api_key = os.getenv("USPTO_API_KEY")
-
+            pfw_uspto_api_key = _get_pfw_uspto_api_key()
             if not pfw_uspto_api_key:
                 logger.error(f"[{request_id}] No USPTO API key available in PFW")
                 raise HTTPException(
@@ -143,10 +154,6 @@ async def register_fpd_document(registration: FPDDocumentRegistration, request:
         )
 
         if success:
-            # Get the configured proxy port (same logic as other parts of the code)
-            proxy_port = int(os.getenv('PFW_PROXY_PORT', os.getenv('PROXY_PORT', '8080')))
-            proxy_base = os.getenv("PFW_PROXY_BASE_URL", f"http://localhost:{proxy_port}")
-
             # Return a browser-usable PERSISTENT link. The direct
             # /download/{petition_id}/{doc} route requires X-Proxy-Token,
             # which browsers cannot send on navigation (Lesson 43) — a
@@ -154,18 +161,17 @@ async def register_fpd_document(registration: FPDDocumentRegistration, request:
             # calls download_document() directly, which dispatches to the
             # FPD document store.
             try:
-                from ..secure_link_cache import get_link_cache
                 download_url = get_link_cache().generate_persistent_link(
                     app_number=registration.petition_id,
                     doc_id=registration.document_identifier,
-                    base_url=proxy_base,
+                    base_url=_PROXY_BASE_URL,
                 )
             except Exception as link_error:
                 logger.warning(
                     f"[{request_id}] Persistent link generation failed "
                     f"({type(link_error).__name__}); returning direct URL"
                 )
-                download_url = f"{proxy_base}/download/{registration.petition_id}/{registration.document_identifier}"
+                download_url = f"{_PROXY_BASE_URL}/download/{registration.petition_id}/{registration.document_identifier}"
 
             logger.info(
                 f"[{request_id}] Successfully registered FPD document: {registration.petition_id}/{registration.document_identifier}"
@@ -215,8 +221,7 @@ async def register_ptab_document(registration: PTABDocumentRegistration, request
     """
     try:
         # Get client IP for logging and rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        request_id = generate_request_id()
+        request_id, client_ip = _request_context(request)
 
         # Rate-limit registration endpoints: 10 req/min per IP
         if not rate_limiter.is_allowed(client_ip, limit=10, window=60.0):
@@ -224,7 +229,7 @@ async def register_ptab_document(registration: PTABDocumentRegistration, request
             security_logger.log_rate_limit_violation(
                 client_ip, "/register-ptab-document", request_id
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={
                     "error": True,
@@ -259,12 +264,7 @@ async def register_ptab_document(registration: PTABDocumentRegistration, request
 
         # Get PFW's own secure USPTO API key
         try:
-            from ...shared_secure_storage import get_uspto_api_key
-            pfw_uspto_api_key = get_uspto_api_key()
-            if not pfw_uspto_api_key:
-                # Fall back to environment variable
-                pfw_uspto_api_key = os.getenv("USPTO_API_KEY")
-
+            pfw_uspto_api_key = _get_pfw_uspto_api_key()
             if not pfw_uspto_api_key:
                 logger.error(f"[{request_id}] No USPTO API key available in PFW")
                 raise HTTPException(
@@ -296,10 +296,6 @@ async def register_ptab_document(registration: PTABDocumentRegistration, request
         )
 
         if success:
-            # Get the configured proxy port (same logic as other parts of the code)
-            proxy_port = int(os.getenv('PFW_PROXY_PORT', os.getenv('PROXY_PORT', '8080')))
-            proxy_base = os.getenv("PFW_PROXY_BASE_URL", f"http://localhost:{proxy_port}")
-
             # Return a browser-usable PERSISTENT link. The direct
             # /download/{proceeding}/{doc} route requires X-Proxy-Token,
             # which browsers cannot send on navigation (Lesson 43) — a
@@ -307,18 +303,17 @@ async def register_ptab_document(registration: PTABDocumentRegistration, request
             # calls download_document() directly, which dispatches to the
             # PTAB document store.
             try:
-                from ..secure_link_cache import get_link_cache
                 download_url = get_link_cache().generate_persistent_link(
                     app_number=registration.proceeding_number,
                     doc_id=registration.document_identifier,
-                    base_url=proxy_base,
+                    base_url=_PROXY_BASE_URL,
                 )
             except Exception as link_error:
                 logger.warning(
                     f"[{request_id}] Persistent link generation failed "
                     f"({type(link_error).__name__}); returning direct URL"
                 )
-                download_url = f"{proxy_base}/download/{registration.proceeding_number}/{registration.document_identifier}"
+                download_url = f"{_PROXY_BASE_URL}/download/{registration.proceeding_number}/{registration.document_identifier}"
 
             logger.info(
                 f"[{request_id}] Successfully registered PTAB document: {registration.proceeding_number}/{registration.document_identifier}"
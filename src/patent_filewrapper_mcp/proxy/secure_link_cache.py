@@ -12,7 +12,7 @@ as last resort.
 
 import hashlib
 import secrets
-import json
+import orjson
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from ..util.database import create_secure_connection
@@ -108,19 +108,21 @@ class SecureLinkCache:
             # Create token with random component to prevent pattern analysis
             timestamp = datetime.now().isoformat()
             random_component = secrets.token_hex(16)
-            token_data = json.dumps({
+            token_data = orjson.dumps({
                 'app_number': app_number,
                 'doc_id': doc_id,
                 'timestamp': timestamp,
                 'random': random_component
             })
 
-            # Encrypt the token
-            encrypted_token = self.cipher.encrypt(token_data.encode('utf-8')).decode('utf-8')
+            # Encrypt the token (orjson already yields the UTF-8 bytes Fernet takes)
+            encrypted_token = self.cipher.encrypt(token_data).decode('utf-8')
 
             # Generate irreversible hash for database lookup
-            # Using 24 hex chars (~96 bits of entropy) for collision resistance
-            link_hash = hashlib.sha256(encrypted_token.encode('utf-8')).hexdigest()[:24]
+            # Using 24 hex chars (~96 bits of entropy) for collision resistance;
+            # BLAKE2b emits the 12 bytes directly (links are looked up by the
+            # stored hash, so existing SHA-256-derived links keep resolving)
+            link_hash = hashlib.blake2b(encrypted_token.encode('utf-8'), digest_size=12).hexdigest()
 
             # Calculate expiration time
             expires_at = datetime.now() + self.cache_duration
@@ -186,8 +188,8 @@ class SecureLinkCache:
 
             try:
                 # Decrypt token to get original data
-                decrypted_data = self.cipher.decrypt(encrypted_token.encode('utf-8')).decode('utf-8')
-                token_data = json.loads(decrypted_data)
+                decrypted_data = self.cipher.decrypt(encrypted_token.encode('utf-8'))
+                token_data = orjson.loads(decrypted_data)
 
                 # Update access tracking
                 self._update_access(link_hash)
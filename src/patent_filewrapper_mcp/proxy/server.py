@@ -3,23 +3,29 @@ FastAPI HTTP server for secure document downloads
 
 Provides browser-accessible download URLs while keeping USPTO API keys secure.
 """
+import asyncio
 import ipaddress
 import os
 import re
 import secrets
 import time
+import traceback
 from typing import Optional
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import httpx
+import orjson
 
 from ..api.enhanced_client import EnhancedPatentClient
 from ..api.helpers import generate_request_id, is_development
 from ..util.security_logger import security_logger
 from .fpd_document_store import get_fpd_store
 from .ptab_document_store import get_ptab_store
+from .secure_link_cache import get_link_cache
 from ..shared.safe_logger import get_safe_logger
 from ..shared.uspto_shared_rate_limiter import get_shared_limiter
 
@@ -29,6 +35,11 @@ logger = get_safe_logger(__name__)
 # ---------------------------------------------------------------------------
 # Response-header sanitization helpers
 # ---------------------------------------------------------------------------
+# Built once: both helpers run on every download response
+_HEADER_CONTROL_CHARS = dict.fromkeys([*range(32), 127])
+_UNSAFE_FILENAME_CHARS = re.compile(r"[\x00-\x1f\x7f\\/:*?\"<>|]")
+
+
 def _safe_header_value(raw: Optional[str]) -> str:
     """
     Strip CR/LF and all control characters from a string before using it
@@ -37,7 +48,7 @@ def _safe_header_value(raw: Optional[str]) -> str:
     """
     if not raw:
         return ""
-    return "".join(ch for ch in raw if ord(ch) >= 32 and ord(ch) != 127)
+    return raw.translate(_HEADER_CONTROL_CHARS)
 
 
 def _safe_filename(raw: Optional[str]) -> str:
@@ -53,14 +64,50 @@ def _safe_filename(raw: Optional[str]) -> str:
     # Note: '.' is intentionally NOT in this class — path traversal risk comes from
     # '/' and '\' (already stripped), not from bare dots. Stripping dots breaks the
     # .pdf extension: "FOO.pdf" → "FOO_pdf" → appends ".pdf" → "FOO_pdf.pdf".
-    safe = re.sub(r"[\x00-\x1f\x7f\\/:*?\"<>|]", "_", raw)
-    safe = "".join(ch for ch in safe if ord(ch) >= 32 and ord(ch) != 127)
+    # (the character class covers every control char, so no second pass)
+    safe = _UNSAFE_FILENAME_CHARS.sub("_", raw)
     if not safe.strip():
         return "document.pdf"
     if not safe.lower().endswith(".pdf"):
         safe += ".pdf"
     return safe[:200]
 
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag`` (weak comparison).
+
+    Handles a list of tags, ``W/`` weak tags and ``*``; shared by every
+    route that answers conditional GETs.
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _scope_request_context(scope) -> tuple[str, str]:
+    """Return ``(request_id, client_ip)`` for an HTTP scope, computed once.
+
+    The first caller (middleware, dependency, route or exception handler)
+    generates the ID and stashes both values in ``scope["state"]`` — the dict
+    behind ``request.state`` — so every layer logs the same request ID and
+    no layer re-derives the client IP.
+    """
+    state = scope.setdefault("state", {})
+    request_id = state.get("request_id")
+    if request_id is None:
+        client = scope.get("client")
+        request_id = state["request_id"] = generate_request_id()
+        state["client_ip"] = client[0] if client else "unknown"
+    return request_id, state["client_ip"]
+
+
+def _request_context(request: Request) -> tuple[str, str]:
+    """``(request_id, client_ip)`` for a Request — see _scope_request_context."""
+    return _scope_request_context(request.scope)
+
+
 # =============================================================================
 # Proxy Token — defense-in-depth auth for download/document endpoints
 # =============================================================================
@@ -93,8 +140,7 @@ class ProxyTokenDependency:
         token = request.headers.get("x-proxy-token", "")
         expected = _get_proxy_token()
         if not secrets.compare_digest(token, expected):
-            client_ip = request.client.host if request.client else "unknown"
-            request_id = generate_request_id()
+            request_id, client_ip = _request_context(request)
             logger.warning(
                 f"[{request_id}] Proxy token missing or invalid from {client_ip} "
                 f"(path={request.url.path})"
@@ -117,6 +163,14 @@ _check_proxy_token = ProxyTokenDependency()
 # Request size limit configuration
 MAX_REQUEST_SIZE = 1024 * 1024  # 1MB limit
 
+# Constant body for the IP allowlist rejection — serialized once at import
+# instead of on every denied request
+_IP_DENIED_BODY = orjson.dumps({"error": "Access denied from this IP address"})
+
+
+# Methods whose request bodies RequestSizeLimitMiddleware enforces the cap on
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
 
 class _BodyTooLarge(Exception):
     """Raised by the counting receive wrapper when a body exceeds the cap."""
@@ -138,6 +192,24 @@ class RequestSizeLimitMiddleware:
     def __init__(self, app, max_request_size: int = MAX_REQUEST_SIZE):
         self.app = app
         self.max_request_size = max_request_size
+        # A digit string longer than the cap's own digit count is over the cap
+        # without being converted to an int
+        self._max_size_digits = len(str(max_request_size))
+
+    def _declared_length_over_cap(self, scope) -> Optional[str]:
+        """Return the Content-Length header value if it exceeds the cap, else None.
+
+        Non-numeric values are left to the server's HTTP parser and to the
+        streaming byte count below.
+        """
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                if not value.isdigit():
+                    return None
+                if len(value) > self._max_size_digits or int(value) > self.max_request_size:
+                    return value.decode("latin-1")
+                return None
+        return None
 
     def _log_too_large(self, path: str, client_ip: str, detail: str, request_id: str) -> None:
         logger.warning(f"[{request_id}] Request body too large: {detail} from {client_ip}")
@@ -147,13 +219,12 @@ class RequestSizeLimitMiddleware:
         )
 
     async def _send_413(self, send, request_id: str) -> None:
-        import json as _json
-        body = _json.dumps({
+        body = orjson.dumps({
             "error": True,
             "message": f"Request body too large. Maximum size: {self.max_request_size} bytes",
             "max_allowed": self.max_request_size,
             "request_id": request_id,
-        }).encode("utf-8")
+        })
         await send({
             "type": "http.response.start",
             "status": 413,
@@ -165,25 +236,17 @@ class RequestSizeLimitMiddleware:
         await send({"type": "http.response.body", "body": body})
 
     async def __call__(self, scope, receive, send):
-        if scope["type"] != "http":
+        # Only body-carrying methods are checked; the GET-heavy download hot
+        # path skips the header scan and receive wrapping entirely
+        if scope["type"] != "http" or scope.get("method") not in _BODY_METHODS:
             await self.app(scope, receive, send)
             return
 
         path = scope.get("path", "")
-        client = scope.get("client")
-        client_ip = client[0] if client else "unknown"
 
-        content_length = None
-        for name, value in scope.get("headers", []):
-            if name == b"content-length":
-                try:
-                    content_length = int(value)
-                except ValueError:
-                    pass
-                break
-
-        if content_length is not None and content_length > self.max_request_size:
-            request_id = generate_request_id()
+        content_length = self._declared_length_over_cap(scope)
+        if content_length is not None:
+            request_id, client_ip = _scope_request_context(scope)
             self._log_too_large(path, client_ip, f"Content-Length: {content_length} bytes", request_id)
             await self._send_413(send, request_id)
             return
@@ -209,25 +272,217 @@ class RequestSizeLimitMiddleware:
         try:
             await self.app(scope, counting_receive, tracking_send)
         except _BodyTooLarge as exc:
-            request_id = generate_request_id()
+            request_id, client_ip = _scope_request_context(scope)
             self._log_too_large(path, client_ip, f"streamed body: {exc.received}+ bytes", request_id)
             if not response_started:
                 await self._send_413(send, request_id)
             # If the response already started there is nothing safe to send;
             # the connection is torn down by the server.
 
-async def _limiter_acquire(limiter) -> None:
-    """No-op when the shared rate limiter is disabled. Extracted so callers
-    with an already-complex control flow (e.g. _open_upstream_pdf_stream)
-    don't pick up an extra branch toward their own cyclomatic complexity."""
-    if limiter is not None:
-        await limiter.__aenter__()
+# Process-wide cap on concurrent upstream PDF downloads. The download pool's
+# max_connections no longer bounds this on its own: over HTTP/2 many
+# downloads multiplex onto one connection. Default matches that pool size.
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv("PFW_PROXY_MAX_CONCURRENT_DOWNLOADS", "5"))
+
+# Built lazily in the proxy's own event loop (see _get_download_slots)
+_download_slots: Optional[asyncio.Semaphore] = None
+_download_slots_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
-async def _limiter_release(limiter) -> None:
-    """No-op when the shared rate limiter is disabled. See _limiter_acquire."""
+def _get_download_slots() -> asyncio.Semaphore:
+    """Get or create the download-slot semaphore for the running event loop.
+
+    The proxy runs its own loop in a separate thread, so a semaphore built at
+    import time could end up bound to a different loop than the one serving
+    downloads.
+    """
+    global _download_slots, _download_slots_loop
+    loop = asyncio.get_running_loop()
+    if _download_slots is None or _download_slots_loop is not loop:
+        _download_slots = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        _download_slots_loop = loop
+    return _download_slots
+
+
+async def _limiter_acquire(limiter) -> asyncio.Semaphore:
+    """Take a process-local download slot, then the shared rate limiter
+    when it is enabled. Returns the semaphore the slot came from, to be
+    handed back to _limiter_release. Extracted so callers with an
+    already-complex control flow (e.g. _open_upstream_pdf_stream) don't
+    pick up extra branches toward their own cyclomatic complexity."""
+    slots = _get_download_slots()
+    await slots.acquire()
     if limiter is not None:
-        await limiter.__aexit__(None, None, None)
+        try:
+            await limiter.__aenter__()
+        except BaseException:
+            slots.release()
+            raise
+    return slots
+
+
+async def _limiter_release(limiter, slots: asyncio.Semaphore) -> None:
+    """Undo _limiter_acquire: shared limiter (if enabled), then the local slot."""
+    try:
+        if limiter is not None:
+            await limiter.__aexit__(None, None, None)
+    finally:
+        slots.release()
+
+
+# Upstream PDFs at or below this size (per their Content-Length) are read in
+# full and sent with a single write instead of as an async chunk stream
+MAX_BUFFERED_PDF_BYTES = 4 * 1024 * 1024
+
+# Seconds allowed to establish the upstream USPTO connection for a download
+_UPSTREAM_CONNECT_TIMEOUT = 5.0
+
+# Read size for upstream PDF bodies; large reads mean far fewer await/send
+# cycles per multi-MB document than the old 8 KB chunks
+STREAM_CHUNK_SIZE = int(os.getenv("PFW_STREAM_CHUNK_SIZE", str(256 * 1024)))
+
+
+def _upstream_content_length(response: httpx.Response) -> Optional[int]:
+    """Content-Length of the upstream body as the client will receive it.
+
+    None when absent/invalid, or when the body is content-encoded — httpx
+    decodes gzip/deflate while iterating, so the upstream length would not
+    match the bytes we forward.
+    """
+    if response.headers.get("content-encoding", "identity").lower() != "identity":
+        return None
+    try:
+        return int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+# Long-lived client for upstream PDF downloads (see _get_download_client)
+_download_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_download_client() -> httpx.AsyncClient:
+    """Get or create the pooled httpx client used for upstream PDF downloads.
+
+    One client for the process lifetime keeps TCP/TLS connections to the
+    USPTO host alive between downloads instead of paying a fresh handshake
+    per request. Closed in the app lifespan.
+    """
+    global _download_client
+    if _download_client is None or _download_client.is_closed:
+        # Bulkhead (audit F46): reuse the API client's download pool limits so
+        # proxy download traffic can't starve tool traffic of connections.
+        # Connect is bounded separately so an unreachable upstream fails fast
+        # instead of holding a rate-limiter slot for the whole download timeout;
+        # HTTP/2 lets concurrent downloads share one connection to the host.
+        download_timeout = getattr(api_client, "download_timeout", 60.0)
+        download_limits = getattr(api_client, "download_limits", None)
+        _download_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(download_timeout, connect=_UPSTREAM_CONNECT_TIMEOUT),
+            follow_redirects=True,
+            http2=True,
+            limits=download_limits or httpx.Limits(),
+        )
+    return _download_client
+
+
+async def _close_download_client() -> None:
+    """Close the pooled download client (app shutdown)."""
+    global _download_client
+    if _download_client is not None:
+        await _download_client.aclose()
+        _download_client = None
+
+
+async def _close_upstream(response: httpx.Response, limiter, slots: asyncio.Semaphore) -> None:
+    """Release everything _open_upstream_pdf_stream holds for one download."""
+    try:
+        await response.aclose()
+    finally:
+        await _limiter_release(limiter, slots)
+
+
+class _UpstreamPdfStream:
+    """Verified upstream PDF body that owns its download slot.
+
+    Iterating yields the body; ``aclose()`` closes the upstream response and
+    releases the slot exactly once. Unlike an async generator's ``finally``,
+    ``aclose()`` also releases when iteration never starts (client gone
+    before the body is sent, or an error before the response is returned),
+    so the owner must always call it — ``_pdf_response`` ties it to the
+    response lifecycle.
+    """
+
+    def __init__(self, response: httpx.Response, limiter, slots: asyncio.Semaphore,
+                 byte_iter, first_chunk: bytes, request_id: str, source: str):
+        self._response = response
+        self._limiter = limiter
+        self._slots = slots
+        self._byte_iter = byte_iter
+        self._first_chunk = first_chunk
+        self._request_id = request_id
+        self._source = source
+        self._closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        try:
+            yield self._first_chunk
+            async for chunk in self._byte_iter:
+                yield chunk
+        except Exception as exc:
+            logger.error(
+                f"[{self._request_id}] {self._source} PDF stream interrupted mid-transfer: "
+                f"{type(exc).__name__}"
+            )
+            raise
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        await _close_upstream(self._response, self._limiter, self._slots)
+
+
+async def _release_pdf_body(body) -> None:
+    """Release a body from _open_upstream_pdf_stream that will not be sent.
+
+    Buffered (bytes) bodies hold nothing; streamed bodies give back their
+    upstream connection and download slot.
+    """
+    if isinstance(body, _UpstreamPdfStream):
+        await body.aclose()
+
+
+async def _prefetch_verified_pdf(response: httpx.Response, request_id: str, source: str):
+    """Raise on non-2xx (body pre-read) and check the first chunk's %PDF- magic.
+
+    Returns ``(byte_iter, first_chunk)`` with the iterator positioned after
+    the first chunk.
+    """
+    if response.status_code >= 400:
+        await response.aread()
+    response.raise_for_status()
+    # PDFs are opaque bytes: skip httpx's decoder unless the upstream actually
+    # content-encoded the body (then decoded bytes are what we must forward)
+    if response.headers.get("content-encoding", "identity").lower() == "identity":
+        byte_iter = response.aiter_raw(chunk_size=STREAM_CHUNK_SIZE)
+    else:
+        byte_iter = response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE)
+    first_chunk = b""
+    async for chunk in byte_iter:
+        first_chunk = chunk
+        break
+    if not first_chunk.startswith(b"%PDF-"):
+        logger.error(
+            f"[{request_id}] Upstream {source} response failed PDF magic-byte check"
+        )
+        raise HTTPException(status_code=502, detail="Upstream document is not a PDF")
+    return byte_iter, first_chunk
 
 
 async def _open_upstream_pdf_stream(download_url: str, headers: dict, request_id: str, source: str):
@@ -237,74 +492,54 @@ async def _open_upstream_pdf_stream(download_url: str, headers: dict, request_id
     response headers go to the client, so a non-PDF upstream body becomes a
     clean 502 instead of being served as application/pdf (audit M4).
 
-    Returns an async generator yielding the validated body. Mid-transfer
-    upstream failures get a distinct log line instead of a silently truncated
-    file (audit F21). Raises httpx.HTTPStatusError on non-2xx (body pre-read
-    so callers may inspect it) and HTTPException(502) on magic-byte failure.
+    Returns ``(body, content_length)``. ``content_length`` is the upstream
+    Content-Length (None when unknown) so callers can forward it instead of
+    falling back to chunked transfer. When it is at most
+    MAX_BUFFERED_PDF_BYTES, ``body`` is the complete PDF as bytes and the
+    upstream connection is already closed; otherwise ``body`` is an async
+    _UpstreamPdfStream yielding the validated body, which the caller must
+    eventually ``aclose()`` (see _release_pdf_body). Mid-transfer upstream failures
+    get a distinct log line instead of a silently truncated file (audit
+    F21). Raises httpx.HTTPStatusError on non-2xx (body pre-read so callers
+    may inspect it) and HTTPException(502) on magic-byte failure.
 
     Shared cross-process rate limiter (token + concurrency slot) — off unless
     USPTO_SHARED_RATE_LIMIT_DIR is set. A streamed PDF download legitimately
     occupies one of the shared slots for its FULL duration (USPTO's burst=1
     guidance), not just connection setup, so the limiter can't be a single
-    `async with` here — it's acquired manually below and released either on
-    an early-exit path or in stream_body()'s `finally`, since the generator
-    this function returns outlives the function call.
+    `async with` here — it's acquired manually below and released on an
+    early-exit path, once a buffered body has been read, or when the returned
+    _UpstreamPdfStream is closed, since it outlives the function call.
     """
-    # Bulkhead (audit F46): reuse the API client's download pool limits so
-    # proxy download traffic can't starve tool traffic of connections
-    client_kwargs = {"timeout": 60.0, "follow_redirects": True}
-    download_limits = getattr(api_client, "download_limits", None)
-    if download_limits is not None:
-        client_kwargs["limits"] = download_limits
-    client = httpx.AsyncClient(**client_kwargs)
+    client = _get_download_client()
 
     limiter = get_shared_limiter()
-    await _limiter_acquire(limiter)
+    slots = await _limiter_acquire(limiter)
     try:
         response = await client.send(
             client.build_request("GET", download_url, headers=headers), stream=True
         )
     except BaseException:
-        await _limiter_release(limiter)
-        await client.aclose()
+        await _limiter_release(limiter, slots)
         raise
     try:
-        if response.status_code >= 400:
-            await response.aread()
-        response.raise_for_status()
-        byte_iter = response.aiter_bytes(chunk_size=8192)
-        first_chunk = b""
-        async for chunk in byte_iter:
-            first_chunk = chunk
-            break
-        if not first_chunk.startswith(b"%PDF-"):
-            logger.error(
-                f"[{request_id}] Upstream {source} response failed PDF magic-byte check"
-            )
-            raise HTTPException(status_code=502, detail="Upstream document is not a PDF")
+        byte_iter, first_chunk = await _prefetch_verified_pdf(response, request_id, source)
+        content_length = _upstream_content_length(response)
+        buffered = None
+        if content_length is not None and content_length <= MAX_BUFFERED_PDF_BYTES:
+            buffered = first_chunk + b"".join([chunk async for chunk in byte_iter])
     except BaseException:
-        await _limiter_release(limiter)
-        await response.aclose()
-        await client.aclose()
+        await _close_upstream(response, limiter, slots)
         raise
 
-    async def stream_body():
-        try:
-            yield first_chunk
-            async for chunk in byte_iter:
-                yield chunk
-        except Exception as exc:
-            logger.error(
-                f"[{request_id}] {source} PDF stream interrupted mid-transfer: "
-                f"{type(exc).__name__}"
-            )
-            raise
-        finally:
-            await response.aclose()
-            await client.aclose()
-            await _limiter_release(limiter)
+    if buffered is not None:
+        await _close_upstream(response, limiter, slots)
+        return buffered, content_length
 
-    return stream_body()
+    return (
+        _UpstreamPdfStream(response, limiter, slots, byte_iter, first_chunk, request_id, source),
+        content_length,
+    )
 
 
 # Global client instance
@@ -314,10 +549,6 @@ async def _periodic_store_cleanup(interval_seconds: int = 3600):
     """Hourly expiry sweep (audit L8): expired persistent links and stale
     FPD/PTAB document registrations (which hold encrypted API keys) are
     deleted instead of accumulating until a manual /cache/cleanup call."""
-    import asyncio
-
-    from .secure_link_cache import get_link_cache
-
     while True:
         await asyncio.sleep(interval_seconds)
         try:
@@ -331,8 +562,6 @@ async def _periodic_store_cleanup(interval_seconds: int = 3600):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan"""
-    import asyncio
-
     global api_client
     try:
         if api_client is None:
@@ -345,6 +574,12 @@ async def lifespan(app: FastAPI):
             yield
         finally:
             cleanup_task.cancel()
+            await _close_download_client()
+            # The proxy loop's pooled Mistral client (the API client itself
+            # may be shared with the MCP tools and outlives the proxy)
+            close_api_client = getattr(api_client, "aclose", None)
+            if close_api_client is not None:
+                await close_api_client()
     except Exception as e:
         logger.error(f"Failed to initialize USPTO API client: {e}")
         raise
@@ -368,7 +603,9 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
         title="USPTO Document Proxy",
         description="Secure proxy for USPTO patent document downloads",
         version="1.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        # orjson-backed responses for every JSON reply (errors, health, stats)
+        default_response_class=ORJSONResponse,
     )
 
     # Add request size limit middleware
@@ -378,7 +615,6 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
     # Default: localhost only (secure). Set CORS_EXTRA_ORIGIN env var to allow
     # additional origins — e.g. when behind a reverse proxy or MCP gateway.
     # Format: comma-separated URLs, e.g. "https://mcp.example.com,https://proxy.internal"
-    import re as _re
     _proxy_cors_origins = ["http://localhost:*", "http://127.0.0.1:*"]
     _extra = os.getenv("CORS_EXTRA_ORIGIN", "").strip()
     if _extra:
@@ -386,7 +622,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
             _origin = _origin.strip()
             if not _origin:
                 continue
-            if not _re.match(r"^https?://[a-zA-Z0-9.\-]+(:[0-9]+)?$", _origin):
+            if not re.match(r"^https?://[a-zA-Z0-9.\-]+(:[0-9]+)?$", _origin):
                 raise ValueError(f"CORS_EXTRA_ORIGIN must be valid HTTP/HTTPS URLs, got: {_origin}")
             _proxy_cors_origins.append(_origin)
             logger.info(f"Proxy CORS: added extra origin {_origin}")
@@ -427,21 +663,20 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
     @app.middleware("http")
     async def add_ip_access_control(request: Request, call_next):
         """Restrict access to localhost IPs (and any configured PROXY_ALLOWED_IPS networks)"""
-        client_ip = request.client.host if request.client else "unknown"
+        request_id, client_ip = _request_context(request)
 
         if not _ip_is_allowed(client_ip):
-            request_id = generate_request_id()
             logger.warning(f"[{request_id}] Access denied from IP: {client_ip}")
             security_logger.log_auth_failure(
                 str(request.url.path),
                 client_ip,
                 "ip_not_whitelisted",
-                f"IP {client_ip} not in allowed list",
                 request_id
             )
-            return JSONResponse(
+            return Response(
+                content=_IP_DENIED_BODY,
                 status_code=403,
-                content={"error": "Access denied from this IP address"}
+                media_type="application/json",
             )
 
         response = await call_next(request)
@@ -463,10 +698,6 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
     # Global Exception Handlers
     # =========================================================================
 
-    from fastapi.exceptions import RequestValidationError
-    from starlette.exceptions import HTTPException as StarletteHTTPException
-    import traceback
-
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         """
@@ -475,15 +706,14 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
         This ensures all HTTP errors (404, 403, etc.) return consistent
         JSON responses with proper logging and request IDs.
         """
-        request_id = generate_request_id()
-        client_ip = request.client.host if request.client else "unknown"
+        request_id, client_ip = _request_context(request)
 
         logger.warning(
             f"[{request_id}] HTTP {exc.status_code}: {exc.detail} "
             f"(path={request.url.path}, client={client_ip})"
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": True,
@@ -492,7 +722,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
                 "message": str(exc.detail),
                 "request_id": request_id,
                 "path": str(request.url.path),
-                "timestamp": import_time().strftime('%Y-%m-%dT%H:%M:%SZ', import_time().gmtime())
+                "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
             }
         )
 
@@ -504,8 +734,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
         This catches malformed requests (missing params, wrong types, etc.)
         and returns user-friendly error messages.
         """
-        request_id = generate_request_id()
-        client_ip = request.client.host if request.client else "unknown"
+        request_id, client_ip = _request_context(request)
 
         # Pydantic v2 puts the raw exception object in ctx['error'] — not
         # JSON-serializable, which turned every model-validator rejection
@@ -532,7 +761,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
             request_id
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": True,
@@ -542,7 +771,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
                 "request_id": request_id,
                 "errors": errors,
                 "guidance": "Check request parameters and try again",
-                "timestamp": import_time().strftime('%Y-%m-%dT%H:%M:%SZ', import_time().gmtime())
+                "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
             }
         )
 
@@ -555,8 +784,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
         by more specific handlers. It provides different detail levels for
         development vs production environments.
         """
-        request_id = generate_request_id()
-        client_ip = request.client.host if request.client else "unknown"
+        request_id, client_ip = _request_context(request)
 
         logger.exception(
             f"[{request_id}] Unhandled exception: {str(exc)} "
@@ -582,7 +810,7 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
             "message": "An unexpected error occurred",
             "request_id": request_id,
             "guidance": "Please try again. If the problem persists, contact support with request ID.",
-            "timestamp": import_time().strftime('%Y-%m-%dT%H:%M:%SZ', import_time().gmtime())
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
         }
 
         if is_development():
@@ -592,15 +820,11 @@ def create_proxy_app(shared_client: Optional[EnhancedPatentClient] = None) -> Fa
                 "traceback": traceback.format_exc()
             }
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=response_content
         )
 
-    def import_time():
-        """Import time module to avoid circular imports"""
-        return time
-
     # =========================================================================
     # Helper Functions
     # =========================================================================
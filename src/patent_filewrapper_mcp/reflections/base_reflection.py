@@ -4,9 +4,26 @@ Base reflection class for USPTO MCP ecosystem guidance
 Provides common structure and functionality for all USPTO guidance modules.
 """
 
+import functools
+import inspect
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Sequence
+from datetime import datetime, timezone
+
+
+@functools.lru_cache(maxsize=None)
+def _guidance_timestamp(reflection_class: type) -> str:
+    """ISO timestamp (UTC) of the module defining a reflection class.
+
+    Guidance is static per release, so this stands in for a creation time
+    that stays the same across restarts and instances.
+    """
+    try:
+        mtime = Path(inspect.getfile(reflection_class)).stat().st_mtime
+    except (OSError, TypeError):
+        return datetime.fromtimestamp(0, tz=timezone.utc).isoformat()
+    return datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
 
 
 class BaseReflection(ABC):
@@ -32,9 +49,21 @@ class BaseReflection(ABC):
         self.name = name
         self.description = description
         self.version = version
-        self.created_at = datetime.now().isoformat()
         self.tags = self._get_tags()
+        self._tag_set: frozenset = frozenset(self.tags)
         self.mcp_type = self._get_mcp_type()
+        # Normalized name and resource path, fixed for the instance's lifetime
+        self.resource_name = name.lower().replace(' ', '_')
+        self.resource_uri = f"/reflections/{self.mcp_type}/{self.resource_name}"
+        # Guidance content is static per instance: rendered once on first use
+        self._content_cache: Optional[str] = None
+        self._summary_cache: Optional[str] = None
+
+    @property
+    def created_at(self) -> str:
+        """When this guidance was last changed (its module's mtime), not when
+        the instance was built, so metadata is identical across restarts"""
+        return _guidance_timestamp(type(self))
 
     @abstractmethod
     def _get_tags(self) -> List[str]:
@@ -66,6 +95,26 @@ class BaseReflection(ABC):
         """
         pass
 
+    def get_cached_content(self) -> str:
+        """
+        Get the guidance content, rendering it on first use only
+
+        Returns:
+            The get_content() markdown, memoized for this instance
+        """
+        if self._content_cache is None:
+            self._content_cache = self.get_content()
+        return self._content_cache
+
+    def get_content_size(self) -> int:
+        """
+        Get the length of the guidance content
+
+        Returns:
+            Character count of the memoized content
+        """
+        return len(self.get_cached_content())
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get reflection metadata for resource discovery
@@ -81,8 +130,8 @@ class BaseReflection(ABC):
             'tags': self.tags,
             'mcp_type': self.mcp_type,
             'content_type': 'text/markdown',
-            'size_estimate': len(self.get_content()),
-            'resource_uri': f"/reflections/{self.mcp_type}/{self.name.lower().replace(' ', '_')}"
+            'size_estimate': self.get_content_size(),
+            'resource_uri': self.resource_uri
         }
 
     def get_summary(self) -> str:
@@ -92,7 +141,13 @@ class BaseReflection(ABC):
         Returns:
             Concise summary suitable for resource listings
         """
-        content = self.get_content()
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+
+    def _build_summary(self) -> str:
+        """First meaningful paragraph of the content, else the description"""
+        content = self.get_cached_content()
 
         # Extract first meaningful paragraph
         lines = content.split('\n')
@@ -107,7 +162,7 @@ class BaseReflection(ABC):
         # Fallback to description
         return self.description
 
-    def matches_filter(self, tags: Optional[List[str]] = None, mcp_type: Optional[str] = None) -> bool:
+    def matches_filter(self, tags: Optional[Sequence[str]] = None, mcp_type: Optional[str] = None) -> bool:
         """
         Check if this reflection matches the given filters
 
@@ -121,9 +176,8 @@ class BaseReflection(ABC):
         if mcp_type and self.mcp_type != mcp_type:
             return False
 
-        if tags:
-            if not any(tag in self.tags for tag in tags):
-                return False
+        if tags and self._tag_set.isdisjoint(tags):
+            return False
 
         return True
 
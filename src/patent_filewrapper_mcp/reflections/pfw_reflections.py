@@ -9,64 +9,9 @@ from typing import List
 from .base_reflection import BaseReflection
 
 
-class PFWReflection(BaseReflection):
-    """
-    Patent File Wrapper MCP guidance reflection
+# Static guidance text, assembled once at import
 
-    Provides comprehensive guidance for PFW tools including:
-    - Progressive disclosure workflow (minimal → balanced → detailed)
-    - Field customization and context reduction strategies
-    - Document selection and extraction patterns
-    - Cross-MCP integration workflows
-    - Attorney-specific use cases and cost optimization
-    """
-
-    def __init__(self):
-        super().__init__(
-            name="USPTO PFW Tool Guidance",
-            description="Comprehensive Patent File Wrapper MCP guidance covering progressive workflows, field customization, document extraction, and cross-MCP integration patterns",
-            version="3.0"
-        )
-
-    def _get_tags(self) -> List[str]:
-        """Get PFW-specific tags for categorization"""
-        return [
-            'patent-prosecution',
-            'document-extraction',
-            'field-customization',
-            'progressive-disclosure',
-            'context-reduction',
-            'workflow-guidance',
-            'attorney-tools',
-            'api-optimization',
-            'cross-mcp-integration',
-            'cost-optimization'
-        ]
-
-    def _get_mcp_type(self) -> str:
-        """Get MCP type identifier"""
-        return 'pfw'
-
-    def get_content(self) -> str:
-        """
-        Get the complete PFW guidance content
-
-        Returns:
-            Full PFW guidance as markdown (61K+ characters)
-        """
-        # UPDATED: Use the new comprehensive guidance content
-        # This provides the complete guidance that was previously in get_all_tool_reflections()
-        # but now sourced from the sectioned guidance system
-        return self._get_comprehensive_guidance()
-
-    def get_quick_reference(self) -> str:
-        """
-        Get a quick reference version for resource-constrained clients
-
-        Returns:
-            Condensed guidance focusing on essential workflows
-        """
-        return """# USPTO PFW MCP - Quick Reference
+_QUICK_REFERENCE = """# USPTO PFW MCP - Quick Reference
 
 ## Essential Workflow Patterns
 
@@ -100,29 +45,7 @@ class PFWReflection(BaseReflection):
 
 For complete guidance, use the full tool reflections resource."""
 
-    def _get_comprehensive_guidance(self) -> str:
-        """
-        Get comprehensive guidance content from all sections combined
-
-        Returns:
-            Complete PFW guidance combining all sections
-        """
-        # This reconstructs the comprehensive guidance by combining all sections
-        # from the new pfw_get_guidance system
-        sections_content = []
-
-        # Add header
-        sections_content.append("# USPTO Patent File Wrapper MCP Server - Complete Tool Guidance")
-        sections_content.append("")
-        sections_content.append("**Version:** 3.0")
-        sections_content.append("**Last Updated:** 2025-11-09")
-        sections_content.append("")
-        sections_content.append("Comprehensive guidance for Patent File Wrapper, cross-MCP workflows, and patent attorney use cases.")
-        sections_content.append("")
-
-        # Note: The full content is now delivered through pfw_get_guidance() sections
-        # for context efficiency. This method provides a comprehensive overview.
-        overview_content = """
+_GUIDANCE_OVERVIEW = """
 ## Migration Notice
 
 This comprehensive guidance has been migrated to a context-efficient sectioned approach using `pfw_get_guidance()`.
@@ -159,8 +82,87 @@ guidance = pfw_get_guidance(section='overview')
 For complete guidance access, use the `pfw_get_guidance(section='...')` function with specific section names listed above.
 """
 
-        sections_content.append(overview_content)
-        return '\n'.join(sections_content)
+_COMPREHENSIVE_GUIDANCE = '\n'.join([
+    "# USPTO Patent File Wrapper MCP Server - Complete Tool Guidance",
+    "",
+    "**Version:** 3.0",
+    "**Last Updated:** 2025-11-09",
+    "",
+    "Comprehensive guidance for Patent File Wrapper, cross-MCP workflows, and patent attorney use cases.",
+    "",
+    _GUIDANCE_OVERVIEW,
+])
+
+
+class PFWReflection(BaseReflection):
+    """
+    Patent File Wrapper MCP guidance reflection
+
+    Provides comprehensive guidance for PFW tools including:
+    - Progressive disclosure workflow (minimal → balanced → detailed)
+    - Field customization and context reduction strategies
+    - Document selection and extraction patterns
+    - Cross-MCP integration workflows
+    - Attorney-specific use cases and cost optimization
+    """
+
+    def __init__(self):
+        super().__init__(
+            name="USPTO PFW Tool Guidance",
+            description="Comprehensive Patent File Wrapper MCP guidance covering progressive workflows, field customization, document extraction, and cross-MCP integration patterns",
+            version="3.0"
+        )
+
+    def _get_tags(self) -> List[str]:
+        """Get PFW-specific tags for categorization"""
+        return [
+            'patent-prosecution',
+            'document-extraction',
+            'field-customization',
+            'progressive-disclosure',
+            'context-reduction',
+            'workflow-guidance',
+            'attorney-tools',
+            'api-optimization',
+            'cross-mcp-integration',
+            'cost-optimization'
+        ]
+
+    def _get_mcp_type(self) -> str:
+        """Get MCP type identifier"""
+        return 'pfw'
+
+    def get_content(self) -> str:
+        """
+        Get the complete PFW guidance content
+
+        Returns:
+            Full PFW guidance as markdown (61K+ characters)
+        """
+        # UPDATED: Use the new comprehensive guidance content
+        # This provides the complete guidance that was previously in get_all_tool_reflections()
+        # but now sourced from the sectioned guidance system
+        return self._get_comprehensive_guidance()
+
+    def get_quick_reference(self) -> str:
+        """
+        Get a quick reference version for resource-constrained clients
+
+        Returns:
+            Condensed guidance focusing on essential workflows
+        """
+        return _QUICK_REFERENCE
+
+    def _get_comprehensive_guidance(self) -> str:
+        """
+        Get comprehensive guidance content from all sections combined
+
+        Returns:
+            Complete PFW guidance combining all sections
+        """
+        # Combines the header with the sectioned-guidance overview; the full
+        # content is delivered through pfw_get_guidance() sections
+        return _COMPREHENSIVE_GUIDANCE
 
     def get_tool_specific_guidance(self, tool_name: str) -> str:
         """
@@ -5,7 +5,8 @@ Provides unified access to all USPTO guidance content as both traditional
 tool reflections and modern MCP Resources for optimal client compatibility.
 """
 
-from typing import Dict, List, Optional, Any
+import gzip
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from .base_reflection import BaseReflection
 from .pfw_reflections import PFWReflection
 from ..shared.safe_logger import get_safe_logger
@@ -28,6 +29,11 @@ class ReflectionManager:
     def __init__(self):
         """Initialize reflection manager with all available reflections"""
         self._reflections: Dict[str, BaseReflection] = {}
+        # Resource URI ("/reflections/{mcp_type}/{name}") -> reflection
+        self._reflections_by_uri: Dict[str, BaseReflection] = {}
+        # Resource URI -> (UTF-8 markdown, gzip of it); content is static,
+        # so it is encoded and compressed once at load
+        self._encoded_by_uri: Dict[str, Tuple[bytes, bytes]] = {}
         self._load_reflections()
 
     def _load_reflections(self):
@@ -35,14 +41,20 @@ class ReflectionManager:
         try:
             # Load PFW reflections
             pfw_reflection = PFWReflection()
-            self._reflections[pfw_reflection.name.lower().replace(' ', '_')] = pfw_reflection
+            self._reflections[pfw_reflection.resource_name] = pfw_reflection
+
+            for reflection in self._reflections.values():
+                uri = reflection.resource_uri
+                self._reflections_by_uri[uri] = reflection
+                raw = reflection.get_cached_content().encode('utf-8')
+                self._encoded_by_uri[uri] = (raw, gzip.compress(raw, mtime=0))
 
             logger.info(f"Loaded {len(self._reflections)} USPTO MCP reflections")
 
         except Exception as e:
             logger.error(f"Error loading reflections: {e}")
 
-    def list_resources(self, mcp_type: Optional[str] = None, tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def list_resources(self, mcp_type: Optional[str] = None, tags: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """
         List available resources for MCP Resources capability
 
@@ -74,24 +86,45 @@ class ReflectionManager:
         Returns:
             Resource content as markdown, or None if not found
         """
-        # Parse resource path
-        if not resource_path.startswith('/reflections/'):
-            return None
+        reflection = self._reflections_by_uri.get(resource_path)
+        return reflection.get_cached_content() if reflection else None
 
-        path_parts = resource_path[13:].split('/')  # Remove '/reflections/'
-        if len(path_parts) < 2:
-            return None
+    def get_resource_bytes(self, resource_path: str) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Get precomputed resource content for HTTP delivery
 
-        mcp_type = path_parts[0]
-        resource_name = path_parts[1]
+        Args:
+            resource_path: Resource path (e.g., "/reflections/pfw/tool_guidance")
 
-        # Find matching reflection
-        for reflection in self._reflections.values():
-            if (reflection.mcp_type == mcp_type and
-                reflection.name.lower().replace(' ', '_') == resource_name):
-                return reflection.get_content()
+        Returns:
+            (UTF-8 markdown bytes, gzip-compressed bytes), or None if not found
+        """
+        return self._encoded_by_uri.get(resource_path)
+
+    def get_resource_metadata_by_uri(self, uri: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one resource's MCP Resource entry without listing the catalog
+
+        Args:
+            uri: Resource URI (e.g., "/reflections/pfw/tool_guidance")
+
+        Returns:
+            MCP Resource-compatible dictionary, or None if not found
+        """
+        reflection = self._reflections_by_uri.get(uri)
+        return reflection.to_resource_format() if reflection else None
 
-        return None
+    def get_reflection_by_uri(self, uri: str) -> Optional[BaseReflection]:
+        """
+        Get reflection by resource URI, i.e. by MCP type and resource name
+
+        Args:
+            uri: Resource URI (e.g., "/reflections/pfw/tool_guidance")
+
+        Returns:
+            BaseReflection instance or None if not found
+        """
+        return self._reflections_by_uri.get(uri)
 
     def get_reflection_by_name(self, name: str) -> Optional[BaseReflection]:
         """
@@ -121,29 +154,19 @@ class ReflectionManager:
         Returns:
             Statistics dictionary for monitoring
         """
-        stats = {
+        reflections = self._reflections.values()
+        by_mcp_type: Dict[str, int] = {}
+        for reflection in reflections:
+            by_mcp_type[reflection.mcp_type] = by_mcp_type.get(reflection.mcp_type, 0) + 1
+
+        return {
             'total_reflections': len(self._reflections),
-            'by_mcp_type': {},
-            'total_content_size': 0,
-            'available_tags': set()
+            'by_mcp_type': by_mcp_type,
+            # Memoized per reflection: no guidance is re-rendered here
+            'total_content_size': sum(reflection.get_content_size() for reflection in reflections),
+            'available_tags': sorted(frozenset().union(*(reflection.tags for reflection in reflections)))
         }
 
-        for reflection in self._reflections.values():
-            # Count by MCP type
-            mcp_type = reflection.mcp_type
-            stats['by_mcp_type'][mcp_type] = stats['by_mcp_type'].get(mcp_type, 0) + 1
-
-            # Sum content size
-            stats['total_content_size'] += len(reflection.get_content())
-
-            # Collect tags
-            stats['available_tags'].update(reflection.tags)
-
-        # Convert set to sorted list
-        stats['available_tags'] = sorted(list(stats['available_tags']))
-
-        return stats
-
 
 # Global reflection manager instance
 _reflection_manager = None
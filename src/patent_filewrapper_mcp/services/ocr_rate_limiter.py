@@ -0,0 +1,175 @@
+"""
+OCR rate-limit strategies for OCRService.
+
+Both limiters use a sliding-window counter: call counts for the current and
+previous fixed window (index = time // window), with the previous count
+weighted by how much of it still overlaps the sliding window. State stays
+O(1) whatever the limit, without fixed-window boundary bursts.
+
+- InMemoryOCRRateLimiter: per process (the default).
+- SharedOCRRateLimiter: one budget across every process pointed at the same
+  directory (several uvicorn workers, or several containers sharing one
+  Mistral key), arbitrated with flock like shared/uspto_shared_rate_limiter.py.
+  Enabled by MISTRAL_OCR_SHARED_RATE_LIMIT_DIR.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from ..exceptions import OCRRateLimitError
+from ..shared.safe_logger import get_safe_logger
+
+logger = get_safe_logger(__name__)
+
+
+def _new_counts() -> Dict[str, float]:
+    return {"index": 0, "current": 0, "previous": 0}
+
+
+class OCRRateLimiter(ABC):
+    """Base strategy: sliding-window counter math plus the check/raise."""
+
+    def __init__(self, limit: int, window: int):
+        self.limit = limit
+        self.window = window
+
+    async def check(self, request_id: str) -> None:
+        """
+        Count one OCR call, or raise if the limit is reached.
+
+        Args:
+            request_id: Request ID for logging
+
+        Raises:
+            OCRRateLimitError: If rate limit is exceeded
+        """
+        weighted, wait_time = await self._admit(time.time())
+        if wait_time is not None:
+            logger.warning(f"[{request_id}] OCR rate limit exceeded. ~{weighted:.1f} calls in last {self.window}s")
+            raise OCRRateLimitError(
+                f"OCR rate limit exceeded. Maximum {self.limit} calls per {self.window} seconds. "
+                f"Try again in {wait_time:.0f} seconds.",
+                retry_after_seconds=int(wait_time) + 1,
+                request_id=request_id
+            )
+        logger.info(f"[{request_id}] OCR rate limit check passed. ~{weighted + 1:.1f}/{self.limit} calls in window")
+
+    @abstractmethod
+    async def _admit(self, now: float) -> Tuple[float, Optional[float]]:
+        """Atomically apply _admit_counts to this limiter's state."""
+
+    def _admit_counts(self, counts: Dict[str, float], now: float) -> Tuple[float, Optional[float]]:
+        """Roll the window buckets and count the call if under the limit.
+
+        Mutates counts. Returns (weighted count before this call,
+        retry-after seconds or None when admitted).
+        """
+        window_index, elapsed = divmod(now, self.window)
+        if window_index != counts["index"]:
+            # Roll the buckets; a gap of more than one window clears both
+            adjacent = window_index == counts["index"] + 1
+            counts["previous"] = counts["current"] if adjacent else 0
+            counts["current"] = 0
+            counts["index"] = window_index
+
+        overlap = 1 - elapsed / self.window
+        weighted = counts["previous"] * overlap + counts["current"]
+        if weighted >= self.limit:
+            return weighted, self._retry_after(counts, elapsed)
+        counts["current"] += 1
+        return weighted, None
+
+    def _retry_after(self, counts: Dict[str, float], elapsed: float) -> float:
+        """Seconds until the weighted count drops below the limit again."""
+        window, limit = self.window, self.limit
+        current, previous = counts["current"], counts["previous"]
+        if current < limit:
+            # Decays within this window as the previous bucket slides out
+            return max(0.0, (1 - (limit - current) / previous) * window - elapsed)
+        # Wait for the next window, then for this window's calls to slide out
+        return (window - elapsed) + (1 - limit / current) * window
+
+
+class InMemoryOCRRateLimiter(OCRRateLimiter):
+    """Per-process limiter.
+
+    OCRService is shared with the download proxy thread (own event loop), so
+    the check-and-increment runs under a thread lock; it holds no await.
+    """
+
+    def __init__(self, limit: int, window: int):
+        super().__init__(limit, window)
+        self._counts = _new_counts()
+        self._lock = threading.Lock()
+
+    async def _admit(self, now: float) -> Tuple[float, Optional[float]]:
+        with self._lock:
+            return self._admit_counts(self._counts, now)
+
+
+class SharedOCRRateLimiter(OCRRateLimiter):
+    """Cross-process limiter: counts in a JSON file, updated under flock."""
+
+    def __init__(self, limit: int, window: int, directory: str):
+        super().__init__(limit, window)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.directory / "mistral_ocr_window.lock"
+        self._state_path = self.directory / "mistral_ocr_window.json"
+        logger.info(f"Shared OCR rate limiter enabled: dir={self.directory} limit={limit}/{window}s")
+
+    async def _admit(self, now: float) -> Tuple[float, Optional[float]]:
+        # flock blocks, so keep it off the event loop
+        return await asyncio.to_thread(self._admit_locked, now)
+
+    def _admit_locked(self, now: float) -> Tuple[float, Optional[float]]:
+        with open(self._lock_path, "a+") as lockf:
+            fcntl.flock(lockf.fileno(), fcntl.LOCK_EX)
+            try:
+                counts = self._read_counts()
+                result = self._admit_counts(counts, now)
+                self._write_counts(counts)
+                return result
+            finally:
+                fcntl.flock(lockf.fileno(), fcntl.LOCK_UN)
+
+    def _read_counts(self) -> Dict[str, float]:
+        try:
+            with open(self._state_path, "r") as f:
+                data = json.load(f)
+            return {key: float(data[key]) for key in ("index", "current", "previous")}
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError, TypeError):
+            # Missing/corrupt state — start an empty window rather than crash
+            return _new_counts()
+
+    def _write_counts(self, counts: Dict[str, float]) -> None:
+        # A fixed temp name and no fsync are safe only because every writer
+        # holds the flock (see _admit_locked): no two writers share the
+        # .tmp file, and a torn file after a crash reads as an empty window
+        tmp_path = self._state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(counts, f)
+        os.replace(tmp_path, self._state_path)
+
+
+def build_ocr_rate_limiter(limit: int, window: int) -> OCRRateLimiter:
+    """Shared limiter when MISTRAL_OCR_SHARED_RATE_LIMIT_DIR is set (POSIX), else in-memory."""
+    directory = os.getenv("MISTRAL_OCR_SHARED_RATE_LIMIT_DIR")
+    if directory:
+        if fcntl is not None:
+            return SharedOCRRateLimiter(limit, window, directory)
+        logger.warning(
+            "MISTRAL_OCR_SHARED_RATE_LIMIT_DIR is set but this platform has no "
+            "fcntl — falling back to the per-process OCR rate limiter."
+        )
+    return InMemoryOCRRateLimiter(limit, window)
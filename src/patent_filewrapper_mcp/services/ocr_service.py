@@ -5,14 +5,20 @@ Single owner of the Mistral OCR call path (audit F1): EnhancedPatentClient
 delegates here instead of carrying its own copy, so the model slug, timeout,
 rate limiting, and cost-control page cap live in exactly one place.
 """
+import asyncio
+import hashlib
 import httpx
 import os
-import time
-from typing import Dict, Any, Optional
+import random
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..api.helpers import format_error_response, generate_request_id
 from ..exceptions import OCRRateLimitError
+from ..shared.mistral_placeholders import find_mistral_placeholder
 from ..shared.safe_logger import get_safe_logger
+from .ocr_rate_limiter import build_ocr_rate_limiter
 
 logger = get_safe_logger(__name__)
 
@@ -20,51 +26,84 @@ logger = get_safe_logger(__name__)
 class OCRService:
     """Service for handling OCR operations with Mistral API"""
 
+    # Retry configuration for transient Mistral failures (same shape as
+    # USPTOTransport); retries run inside the call's single rate-limit slot
+    RETRY_ATTEMPTS = 3
+    RETRY_DELAY = 0.5  # Base delay in seconds
+    RETRY_BACKOFF = 2  # Exponential backoff multiplier
+    RETRY_AFTER_MAX = 30.0  # Cap on a server-sent Retry-After
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    # Transport errors raised before the request reached Mistral; the only
+    # ones safe to retry for a non-idempotent POST
+    CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         timeout: Optional[float] = None,
         limits: Optional[httpx.Limits] = None,
+        concurrency: Optional[int] = None,
     ):
         """Initialize OCR service with rate limiting.
 
         Args:
-            api_key: Pre-validated Mistral key; when None, loaded from secure
-                storage / MISTRAL_API_KEY and validated here.
+            api_key: Pre-validated Mistral key ("" when the caller already
+                resolved that none is configured); when None, loaded from
+                secure storage / MISTRAL_API_KEY and validated here.
             model: OCR model slug; default env MISTRAL_OCR_MODEL or
                 mistral-ocr-latest.
             timeout: httpx timeout; default env MISTRAL_OCR_TIMEOUT or 30s.
             limits: optional httpx.Limits for connection pooling.
+            concurrency: documents in flight at once in extract_many;
+                default env MISTRAL_OCR_CONCURRENCY or 5.
         """
         if api_key is not None:
-            self.mistral_api_key = api_key
+            self.mistral_api_key = api_key or None
         else:
             # Check secure storage first, then environment
-            raw_mistral_key = None
-            try:
-                from ..shared_secure_storage import get_mistral_api_key
-                raw_mistral_key = get_mistral_api_key()
-            except Exception:
-                # Fall back to environment variable if secure storage fails
-                pass
-            if not raw_mistral_key:
-                raw_mistral_key = os.getenv("MISTRAL_API_KEY")
-            self.mistral_api_key = self._validate_mistral_api_key(raw_mistral_key)
+            from ..shared_secure_storage import get_api_key_with_env_fallback
+            self.mistral_api_key = self._validate_mistral_api_key(
+                get_api_key_with_env_fallback("MISTRAL_API_KEY")
+            )
 
         self.mistral_base_url = "https://api.mistral.ai/v1"
         # Model slug: `mistral-ocr-latest` tracks Mistral's current GA model;
         # pin a dated slug (e.g. mistral-ocr-2503) via MISTRAL_OCR_MODEL.
-        self.mistral_ocr_model = model or os.getenv("MISTRAL_OCR_MODEL", "mistral-ocr-latest")
+        self.mistral_ocr_model: str = model or os.getenv("MISTRAL_OCR_MODEL") or "mistral-ocr-latest"
         self.ocr_timeout = timeout if timeout is not None else float(os.getenv("MISTRAL_OCR_TIMEOUT", "30.0"))
         self.ocr_http_limits = limits
+        # /files upload: multi-MB bodies get a longer write phase, while
+        # connect/pool waits fail fast rather than holding up the pool
+        self.ocr_upload_timeout = httpx.Timeout(
+            self.ocr_timeout,
+            connect=min(self.ocr_timeout, 10.0),
+            write=float(os.getenv("MISTRAL_OCR_UPLOAD_TIMEOUT", "120.0")),
+            pool=min(self.ocr_timeout, 10.0),
+        )
+        self.ocr_concurrency = concurrency if concurrency is not None else int(os.getenv("MISTRAL_OCR_CONCURRENCY", "5"))
+        # Pooled Mistral clients, one per event loop that uses the service,
+        # built lazily (see _get_client)
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
         # Cost-control page cap per document
         self.ocr_max_pages = int(os.getenv("MISTRAL_OCR_MAX_PAGES", "50"))
 
         # OCR rate limiting configuration
-        self.ocr_calls = []  # List of timestamps for OCR calls
         self.ocr_rate_limit = 10  # Max OCR calls per minute
         self.ocr_window = 60  # Time window in seconds
+        # Per-process by default; MISTRAL_OCR_SHARED_RATE_LIMIT_DIR shares
+        # one budget across workers (see ocr_rate_limiter)
+        self._ocr_rate_limiter = build_ocr_rate_limiter(self.ocr_rate_limit, self.ocr_window)
+
+        # LRU of successful results keyed by (sha256(pdf), pages, model):
+        # identical PDF bytes (form boilerplate, batch repeats) skip Mistral
+        # and the rate limit entirely
+        self.ocr_cache_size = int(os.getenv("MISTRAL_OCR_CACHE_SIZE", "256"))
+        self._ocr_cache: "OrderedDict[Tuple[bytes, int, str], Dict[str, Any]]" = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+        # cache key -> future of the OCR call currently running for it
+        # (guarded by _ocr_cache_lock)
+        self._ocr_inflight: Dict[Tuple[bytes, int, str], asyncio.Future] = {}
 
     def _validate_mistral_api_key(self, raw_key: Optional[str]) -> Optional[str]:
         """
@@ -79,47 +118,62 @@ class OCRService:
         if not raw_key:
             return None
 
+        # Very short keys are likely placeholders; checked first since it's a
+        # single len() and skips the pattern scan
+        key = raw_key.strip()
+        if len(key) < 10:
+            logger.info(f"Detected suspiciously short API key ({len(raw_key)} chars). Treating as missing key.")
+            return None
+
         # Common placeholder patterns that should be treated as missing.
         # Allow override via MISTRAL_PLACEHOLDER_PATTERNS env var (comma-separated).
         # The default covers common mistake patterns; additional patterns can be added
         # without a code change.
-        env_patterns = os.getenv("MISTRAL_PLACEHOLDER_PATTERNS", "")
-        placeholder_patterns = [
-            "your_mistral_api_key_here",
-            "your_key_here",
-            "your_api_key_here",
-            "placeholder",
-            "optional",
-            "mistral_api_key",
-            "enter_your_key",
-            "add_your_key",
-            "your_mistral_key",
-            "api_key_here",
-            "replace_with_your_key",
-            "insert_key_here",
-            "temp_key",
-            "test_key",
-            "example_key",
-        ]
-        if env_patterns:
-            placeholder_patterns.extend([p.strip() for p in env_patterns.split(",") if p.strip()])
-
-        normalized_key = raw_key.lower().strip()
-
-        # Check against placeholder patterns
-        for pattern in placeholder_patterns:
-            if pattern in normalized_key:
-                logger.info(f"Detected placeholder pattern '{pattern}' in MISTRAL_API_KEY. Treating as missing key.")
-                return None
-
-        # Additional check for very short keys that are likely placeholders
-        if len(raw_key.strip()) < 10:
-            logger.info(f"Detected suspiciously short API key ({len(raw_key)} chars). Treating as missing key.")
+        # Check against placeholder patterns: one regex pass over the key
+        placeholder = find_mistral_placeholder(key)
+        if placeholder:
+            logger.info(f"Detected placeholder pattern '{placeholder}' in MISTRAL_API_KEY. Treating as missing key.")
             return None
 
-        return raw_key.strip()
+        return key
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled httpx client for Mistral calls.
+
+        Reused across OCR calls so the /files upload, the /ocr request and
+        later documents share kept-alive TLS connections instead of paying a
+        fresh handshake each. An httpx client is bound to the event loop it
+        first ran on, and the download proxy thread runs its own loop, so
+        each loop gets a client of its own; none is ever replaced while
+        still open. Clients of loops that have since closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # list(): the proxy thread's loop may add its client concurrently
+            for stale_loop in [other for other in list(self._clients) if other.is_closed()]:
+                self._clients.pop(stale_loop, None)
+            client_kwargs: Dict[str, Any] = {
+                "timeout": self.ocr_timeout,
+                "http2": True,
+                "headers": {"Authorization": f"Bearer {self.mistral_api_key}"},
+            }
+            if self.ocr_http_limits is not None:
+                client_kwargs["limits"] = self.ocr_http_limits
+            client = self._clients[loop] = httpx.AsyncClient(**client_kwargs)
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled Mistral client of the running event loop.
+
+        Called from that loop's shutdown path; clients other loops are still
+        using are left open.
+        """
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
-    def _check_ocr_rate_limit(self, request_id: str) -> None:
+    async def _check_ocr_rate_limit(self, request_id: str) -> None:
         """
         Check if OCR rate limit is exceeded and raise exception if so.
 
@@ -129,25 +183,167 @@ class OCRService:
         Raises:
             OCRRateLimitError: If rate limit is exceeded
         """
-        now = time.time()
-
-        # Clean old calls outside the time window
-        self.ocr_calls = [ts for ts in self.ocr_calls if now - ts < self.ocr_window]
-
-        if len(self.ocr_calls) >= self.ocr_rate_limit:
-            oldest_call = min(self.ocr_calls)
-            wait_time = self.ocr_window - (now - oldest_call)
-            logger.warning(f"[{request_id}] OCR rate limit exceeded. {len(self.ocr_calls)} calls in last {self.ocr_window}s")
-            raise OCRRateLimitError(
-                f"OCR rate limit exceeded. Maximum {self.ocr_rate_limit} calls per {self.ocr_window} seconds. "
-                f"Try again in {wait_time:.0f} seconds.",
-                retry_after_seconds=int(wait_time) + 1,
-                request_id=request_id
-            )
+        await self._ocr_rate_limiter.check(request_id)
+
+    async def _post_with_retry(self, client: httpx.AsyncClient, url: str,
+                               request_id: str, retry_transport_errors: bool = True,
+                               **kwargs) -> httpx.Response:
+        """
+        POST to Mistral, retrying 429/5xx responses and transport errors.
+
+        Backs off exponentially with jitter, or for the server's Retry-After
+        (seconds form, capped) when it sends one. With retry_transport_errors
+        off, only connect-phase errors are retried: a read or protocol error
+        may come after Mistral acted on the request. The final failure is
+        raised for extract_document_content's error mapping.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(url, **kwargs)
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as e:
+                if (e.response.status_code not in self.RETRYABLE_STATUS_CODES
+                        or attempt == self.RETRY_ATTEMPTS - 1):
+                    raise
+                delay = self._retry_delay(attempt, e.response.headers.get("Retry-After"))
+                reason = f"HTTP {e.response.status_code}"
+            except httpx.TransportError as e:
+                if ((not retry_transport_errors and not isinstance(e, self.CONNECT_ERRORS))
+                        or attempt == self.RETRY_ATTEMPTS - 1):
+                    raise
+                delay = self._retry_delay(attempt, None)
+                reason = type(e).__name__
+
+            logger.warning(f"[{request_id}] Mistral request failed on attempt {attempt + 1}/{self.RETRY_ATTEMPTS} "
+                           f"({reason}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Backoff for the given attempt: Retry-After seconds if usable, plus jitter."""
+        delay = self.RETRY_DELAY * (self.RETRY_BACKOFF ** attempt)
+        if retry_after is not None:
+            try:
+                delay = min(float(retry_after), self.RETRY_AFTER_MAX)
+            except ValueError:
+                pass  # HTTP-date form: keep the exponential backoff
+        return max(0.0, delay) + random.uniform(0, 0.25)
+
+    @staticmethod
+    def _combine_pages(pages) -> str:
+        """Join the non-blank page markdown under === PAGE n === headers."""
+        parts = []
+        for page in pages:
+            page_markdown = page.get("markdown")
+            # isspace() tests blankness without building a stripped copy
+            if page_markdown and not page_markdown.isspace():
+                parts.append(f"=== PAGE {page.get('index', 0) + 1} ===\n{page_markdown}")
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _for_document(result: Dict[str, Any], app_number: str, document_identifier: str) -> Dict[str, Any]:
+        """A shared (cached or in-flight) result restamped for this caller's document.
+
+        Always a new dict: this caller made no Mistral call, so it is billed
+        nothing, and editing it cannot reach the cached entry.
+        """
+        if not result.get("success"):
+            return dict(result)
+        return {
+            **result,
+            "application_number": app_number,
+            "document_identifier": document_identifier,
+            "processing_cost_usd": 0.0,
+            "cost_breakdown": "$0.0000 - served from the OCR result cache, no Mistral call",
+            "usage_info": {},
+            "cached": True,
+        }
+
+    def _ocr_inflight_enter(
+        self, key: Tuple[bytes, int, str]
+    ) -> Tuple[Optional[asyncio.Future], Optional[asyncio.Future]]:
+        """Join the in-flight OCR for key, or register this caller as its owner.
+
+        Returns (waiter, owned): the running call's future to await, or
+        else the future this caller registered and must resolve. Futures
+        are bound to an event loop, so a call already running on another
+        loop (the proxy thread) is not joined: this caller proceeds without
+        registering (both None).
+        """
+        loop = asyncio.get_running_loop()
+        with self._ocr_cache_lock:
+            future = self._ocr_inflight.get(key)
+            if future is not None:
+                if future.get_loop() is loop:
+                    return future, None
+                return None, None
+            future = self._ocr_inflight[key] = loop.create_future()
+            return None, future
+
+    def _ocr_inflight_exit(self, key: Tuple[bytes, int, str], future: Optional[asyncio.Future]) -> None:
+        """Unregister an owner's future; cancel it if the owner never finished."""
+        if future is None:
+            return
+        with self._ocr_cache_lock:
+            if self._ocr_inflight.get(key) is future:
+                del self._ocr_inflight[key]
+        if not future.done():
+            future.cancel()
+
+    def _ocr_cache_key(self, pdf_content: bytes, page_count: int) -> Tuple[bytes, int, str]:
+        """Cache key: everything that determines the Mistral OCR output."""
+        return hashlib.sha256(pdf_content).digest(), page_count, self.mistral_ocr_model
+
+    def _ocr_cache_get(self, key: Tuple[bytes, int, str]) -> Optional[Dict[str, Any]]:
+        """Cached result for key (marked most recently used), or None."""
+        with self._ocr_cache_lock:
+            result = self._ocr_cache.get(key)
+            if result is not None:
+                self._ocr_cache.move_to_end(key)
+            return result
+
+    def _ocr_cache_put(self, key: Tuple[bytes, int, str], result: Dict[str, Any]) -> None:
+        """Store a successful result, evicting the least recently used."""
+        if self.ocr_cache_size <= 0:
+            return
+        # A copy: the owning caller gets `result` itself and may edit it
+        entry = {**result, "usage_info": dict(result.get("usage_info", {}))}
+        with self._ocr_cache_lock:
+            self._ocr_cache[key] = entry
+            self._ocr_cache.move_to_end(key)
+            while len(self._ocr_cache) > self.ocr_cache_size:
+                self._ocr_cache.popitem(last=False)
+
+    async def extract_many(
+        self,
+        jobs: List[Tuple[bytes, int, str, str]],
+        concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run extract_document_content over many documents concurrently.
+
+        At most `concurrency` documents are in flight at once, so one
+        document's upload overlaps another's OCR on the shared client pool.
+        The OCR rate limit still applies per call.
+
+        Args:
+            jobs: (pdf_content, page_count, app_number, document_identifier)
+                tuples, as passed to extract_document_content
+            concurrency: Override for the constructor's ocr_concurrency
+
+        Returns:
+            One result per job, in job order; an exception that escaped a
+            call is returned in its slot instead of cancelling the batch
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.ocr_concurrency))
 
-        # Record this call
-        self.ocr_calls.append(now)
-        logger.info(f"[{request_id}] OCR rate limit check passed. {len(self.ocr_calls)}/{self.ocr_rate_limit} calls in window")
+        async def _one(job: Tuple[bytes, int, str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.extract_document_content(*job)
+
+        return await asyncio.gather(*(_one(job) for job in jobs), return_exceptions=True)
 
     async def extract_document_content(self, pdf_content: bytes, page_count: int,
                                      app_number: str, document_identifier: str) -> Dict[str, Any]:
@@ -165,120 +361,166 @@ class OCRService:
         """
         request_id = generate_request_id()
 
-        try:
-            # Check if Mistral API key is available
-            if not self.mistral_api_key:
-                return format_error_response(
-                    "MISTRAL_API_KEY environment variable is required for OCR content extraction. "
-                    "Set it with: set MISTRAL_API_KEY=your_key_here (Windows) or export MISTRAL_API_KEY=your_key_here (Linux/Mac)"
-                )
+        # Check if Mistral API key is available
+        if not self.mistral_api_key:
+            return format_error_response(
+                "MISTRAL_API_KEY environment variable is required for OCR content extraction. "
+                "Set it with: set MISTRAL_API_KEY=your_key_here (Windows) or export MISTRAL_API_KEY=your_key_here (Linux/Mac)"
+            )
 
+        # Identical PDF bytes already OCR'd: no Mistral call, so no
+        # rate-limit budget spent
+        cache_key = self._ocr_cache_key(pdf_content, page_count)
+        cached = self._ocr_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"[{request_id}] OCR CACHE HIT for {app_number}/{document_identifier}")
+            return self._for_document(cached, app_number, document_identifier)
+
+        # Identical PDF bytes being OCR'd right now by another caller: share
+        # that call's result instead of spending a second upload + OCR
+        waiter, future = self._ocr_inflight_enter(cache_key)
+        if waiter is not None:
+            logger.info(f"[{request_id}] OCR IN FLIGHT for identical PDF; awaiting it for {app_number}/{document_identifier}")
+            try:
+                result = await asyncio.shield(waiter)
+            except asyncio.CancelledError:
+                if not waiter.cancelled():
+                    raise  # this caller was cancelled
+                # The owning call was cancelled; run our own
+                return await self.extract_document_content(pdf_content, page_count, app_number, document_identifier)
+            return self._for_document(result, app_number, document_identifier)
+
+        try:
+            result = await self._extract_uncached(
+                request_id, cache_key, pdf_content, page_count, app_number, document_identifier
+            )
+            if future is not None:
+                future.set_result(result)
+            return result
+        finally:
+            self._ocr_inflight_exit(cache_key, future)
+
+    async def _extract_uncached(self, request_id: str, cache_key: Tuple[bytes, int, str],
+                                pdf_content: bytes, page_count: int,
+                                app_number: str, document_identifier: str) -> Dict[str, Any]:
+        """Rate-limited Mistral upload + OCR for a cache miss (see extract_document_content)."""
+        try:
             # Check OCR rate limit before proceeding
-            self._check_ocr_rate_limit(request_id)
+            await self._check_ocr_rate_limit(request_id)
 
             logger.info(f"[{request_id}] Starting OCR extraction for {app_number}/{document_identifier} ({page_count} pages)")
 
-            # Step 1: Upload file to Mistral
-            mistral_headers = {
-                "Authorization": f"Bearer {self.mistral_api_key}",
-            }
+            ocr_data = await self._run_mistral_ocr(request_id, pdf_content, min(page_count, self.ocr_max_pages))
+            if ocr_data is None:
+                return format_error_response("Failed to upload file to Mistral OCR service")
 
-            files = {
-                "file": ("document.pdf", pdf_content, "application/pdf")
-            }
+            # Extract content from OCR response
+            pages_processed = ocr_data.get("usage_info", {}).get("pages_processed", 0)
+            result = self._build_result(
+                ocr_data, ocr_data.get("pages", ()), pages_processed,
+                len(pdf_content), page_count, app_number, document_identifier,
+            )
+            self._ocr_cache_put(cache_key, result)
+            return result
 
-            data = {
-                "purpose": "ocr"
-            }
+        except Exception as e:
+            return self._ocr_error_response(e, request_id)
+
+    async def _run_mistral_ocr(self, request_id: str, pdf_content: bytes,
+                               pages: int) -> Optional[Dict[str, Any]]:
+        """Upload one PDF and OCR its first `pages` pages; None if the upload
+        returned no file id. HTTP errors propagate for _ocr_error_response."""
+        # Step 1: Upload file to Mistral. httpx streams a bytes field
+        # into the multipart body as-is, without another copy
+        files = {
+            "file": ("document.pdf", pdf_content, "application/pdf")
+        }
+
+        data = {
+            "purpose": "ocr"
+        }
+
+        client = self._get_client()
+        # Not idempotent: a retry after a read error could store (and bill)
+        # the upload twice
+        upload_response = await self._post_with_retry(
+            client,
+            f"{self.mistral_base_url}/files",
+            request_id,
+            retry_transport_errors=False,
+            files=files,
+            data=data,
+            timeout=self.ocr_upload_timeout,
+        )
+        file_id = upload_response.json().get("id")
+
+        if not file_id:
+            return None
 
-            client_kwargs = {"timeout": self.ocr_timeout}
-            if self.ocr_http_limits is not None:
-                client_kwargs["limits"] = self.ocr_http_limits
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                upload_response = await client.post(
-                    f"{self.mistral_base_url}/files",
-                    headers=mistral_headers,
-                    files=files,
-                    data=data
-                )
-                upload_response.raise_for_status()
-                upload_data = upload_response.json()
-                file_id = upload_data.get("id")
-
-                if not file_id:
-                    return format_error_response("Failed to upload file to Mistral OCR service")
-
-                # Step 2: Process with OCR
-                ocr_payload = {
-                    "model": self.mistral_ocr_model,
-                    "document": {
-                        "type": "file",
-                        "file_id": file_id
-                    },
-                    # Cost-control page cap (truncation surfaced in the result)
-                    "pages": list(range(min(page_count, self.ocr_max_pages))),
-                    "include_image_base64": False  # Save tokens
-                }
-
-                ocr_response = await client.post(
-                    f"{self.mistral_base_url}/ocr",
-                    headers={
-                        "Authorization": f"Bearer {self.mistral_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json=ocr_payload
-                )
-                ocr_response.raise_for_status()
-                ocr_data = ocr_response.json()
-
-                # Extract content from OCR response
-                pages_processed = ocr_data.get("usage_info", {}).get("pages_processed", 0)
-                estimated_cost = pages_processed * 0.001  # $1 per 1000 pages
-
-                # Combine all page content
-                extracted_content = []
-                for page in ocr_data.get("pages", []):
-                    page_markdown = page.get("markdown", "")
-                    if page_markdown.strip():
-                        extracted_content.append(f"=== PAGE {page.get('index', 0) + 1} ===\n{page_markdown}")
-
-                full_content = "\n\n".join(extracted_content)
-
-                result = {
-                    "success": True,
-                    "application_number": app_number,
-                    "document_identifier": document_identifier,
-                    "page_count": page_count,
-                    "pages_processed": pages_processed,
-                    "extracted_content": full_content,
-                    "structured_output": "markdown",
-                    "processing_cost_usd": round(estimated_cost, 4),
-                    "cost_breakdown": f"${estimated_cost:.4f} for {pages_processed} pages at $0.001/page",
-                    "ocr_model": ocr_data.get("model", self.mistral_ocr_model),
-                    "file_size_bytes": len(pdf_content),
-                    "document_annotation": ocr_data.get("document_annotation", ""),
-                    "usage_info": ocr_data.get("usage_info", {}),
-                    "note": "Content extracted using Mistral OCR - supports scanned documents, formulas, and complex layouts"
-                }
-                # Surface silent truncation from the cost-control cap (audit F48)
-                pages_truncated = max(0, page_count - self.ocr_max_pages)
-                if pages_truncated > 0:
-                    result["pages_truncated"] = pages_truncated
-                    result["truncation_note"] = (
-                        f"Only the first {self.ocr_max_pages} of {page_count} pages were "
-                        f"OCR'd (cost-control cap; raise MISTRAL_OCR_MAX_PAGES to change)."
-                    )
-                return result
-
-        except OCRRateLimitError as e:
+        # Step 2: Process with OCR
+        ocr_payload = {
+            "model": self.mistral_ocr_model,
+            "document": {
+                "type": "file",
+                "file_id": file_id
+            },
+            # Cost-control page cap (truncation surfaced in the result);
+            # a list because the request body is JSON
+            "pages": list(range(pages)),
+            "include_image_base64": False  # Save tokens
+        }
+
+        ocr_response = await self._post_with_retry(
+            client,
+            f"{self.mistral_base_url}/ocr",
+            request_id,
+            json=ocr_payload
+        )
+        return ocr_response.json()
+
+    def _build_result(self, ocr_data: Dict[str, Any], pages, pages_processed: int,
+                      file_size: int, page_count: int,
+                      app_number: str, document_identifier: str) -> Dict[str, Any]:
+        """Per-document success result from a Mistral OCR response."""
+        estimated_cost = pages_processed * 0.001  # $1 per 1000 pages
+
+        result = {
+            "success": True,
+            "application_number": app_number,
+            "document_identifier": document_identifier,
+            "page_count": page_count,
+            "pages_processed": pages_processed,
+            "extracted_content": self._combine_pages(pages),
+            "structured_output": "markdown",
+            "processing_cost_usd": round(estimated_cost, 4),
+            "cost_breakdown": f"${estimated_cost:.4f} for {pages_processed} pages at $0.001/page",
+            "ocr_model": ocr_data.get("model", self.mistral_ocr_model),
+            "file_size_bytes": file_size,
+            "document_annotation": ocr_data.get("document_annotation", ""),
+            "usage_info": ocr_data.get("usage_info", {}),
+            "note": "Content extracted using Mistral OCR - supports scanned documents, formulas, and complex layouts"
+        }
+        # Surface silent truncation from the cost-control cap (audit F48)
+        pages_truncated = max(0, page_count - self.ocr_max_pages)
+        if pages_truncated > 0:
+            result["pages_truncated"] = pages_truncated
+            result["truncation_note"] = (
+                f"Only the first {self.ocr_max_pages} of {page_count} pages were "
+                f"OCR'd (cost-control cap; raise MISTRAL_OCR_MAX_PAGES to change)."
+            )
+        return result
+
+    @staticmethod
+    def _ocr_error_response(e: Exception, request_id: str) -> Dict[str, Any]:
+        """Map a failed Mistral OCR attempt to the user-facing error response."""
+        if isinstance(e, OCRRateLimitError):
             logger.warning(f"[{request_id}] OCR rate limit exceeded: {e.message}")
             return format_error_response(e.message, e.status_code, e.request_id)
-        except httpx.HTTPStatusError as e:
+        if isinstance(e, httpx.HTTPStatusError):
             if e.response.status_code == 401:
                 return format_error_response("Mistral API authentication failed - check MISTRAL_API_KEY")
             elif e.response.status_code == 402:
                 return format_error_response("Mistral API payment required - insufficient credits")
             else:
                 return format_error_response(f"Mistral API error {e.response.status_code}: {e.response.text}")
-        except Exception as e:
-            return format_error_response(f"Failed to extract document content with Mistral OCR: {str(e)}")
+        return format_error_response(f"Failed to extract document content with Mistral OCR: {str(e)}")
@@ -69,8 +69,9 @@ def migrate_data_file(filename: str) -> Path:
 
 def _read_key_file(path: Path) -> Optional[bytes]:
     try:
-        if path.exists():
-            return path.read_bytes().strip()
+        return path.read_bytes().strip()
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Error reading key file {path.name}: {e}")
     return None
@@ -95,8 +96,10 @@ def get_or_create_fernet(secret_name: str, legacy_file_name: str) -> Fernet:
         logger.warning(f"Secure storage read failed for {secret_name}: {e}")
 
     # 2. Legacy / fallback key files: project root first (historical
-    #    location), then the data dir (current fallback location)
-    for key_path in (_PROJECT_ROOT / legacy_file_name, get_data_dir() / legacy_file_name):
+    #    location), then the data dir (current fallback location). The data
+    #    dir is resolved once (env read + mkdir + chmod) for steps 2 and 4.
+    data_dir = get_data_dir()
+    for key_path in (_PROJECT_ROOT / legacy_file_name, data_dir / legacy_file_name):
         key = _read_key_file(key_path)
         if not key:
             continue
@@ -125,7 +128,7 @@ def get_or_create_fernet(secret_name: str, legacy_file_name: str) -> Fernet:
         logger.warning(f"Secure storage write failed for {secret_name}: {e}")
 
     # 4. Last resort: key file in the hardened data dir
-    fallback = get_data_dir() / legacy_file_name
+    fallback = data_dir / legacy_file_name
     try:
         fallback.write_bytes(key)
         if hasattr(os, "chmod"):
@@ -2,15 +2,39 @@
 Internal Authentication System for MCP Inter-Service Communication
 
 Provides secure token-based authentication between MCPs instead of passing raw API keys.
+
+Token format: ``base64url(payload_json) + "." + base64url(signature)``, where
+the signature is the raw HMAC-SHA256 digest of exactly the transmitted payload
+bytes (unpadded base64url throughout), so the payload is serialized once and
+parsed once. Expiry and the caller's service/IP expectations are checked on
+the parsed payload before the HMAC is computed: those checks can only reject,
+and a token is accepted only on a signature match.
+Legacy tokens -- base64 of ``{"payload": ..., "signature": ...}`` with a
+hex signature -- are accepted by validate_token; standard base64 never
+contains ".", so the two formats can't be confused.
+
+This module is shared with the peer MCPs (FPD, PTAB, Citations), and peers
+on older releases only parse the legacy format. create_token therefore
+still issues legacy tokens unless INTERNAL_AUTH_COMPACT_TOKENS=true.
+Rollout order:
+
+1. Ship this version (accepts both formats) to every MCP in the suite.
+2. Only then set INTERNAL_AUTH_COMPACT_TOKENS=true, on every MCP.
+3. Legacy acceptance can be dropped once no MCP issues legacy tokens.
 """
 
+import base64
 import hashlib
 import hmac
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 
+import orjson
+
 
 def ensure_internal_auth_secret() -> str:
     """
@@ -37,16 +61,33 @@ def ensure_internal_auth_secret() -> str:
     return secret
 
 
+def _b64url_encode(data: bytes) -> str:
+    """Unpadded URL-safe base64."""
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip("=")
+
+
+def _b64url_decode(text: str) -> bytes:
+    """Decode unpadded URL-safe base64."""
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
 class InternalAuthToken:
     """Generate and validate time-limited tokens for internal MCP communication."""
 
-    def __init__(self, shared_secret: Optional[str] = None):
+    # Signature-verified tokens remembered so a peer replaying the same token
+    # skips the decode/HMAC path until the token expires
+    VALID_CACHE_MAXSIZE = 1024
+
+    def __init__(self, shared_secret: Optional[str] = None, compact_tokens: Optional[bool] = None):
         """
         Initialize with shared secret for HMAC operations.
 
         Args:
             shared_secret: Shared secret for HMAC. If None, reads from
                            INTERNAL_AUTH_SECRET env var.
+            compact_tokens: Issue compact tokens instead of legacy ones. If
+                           None, reads INTERNAL_AUTH_COMPACT_TOKENS (default
+                           off; see the module docstring for rollout order).
 
         Raises:
             RuntimeError: if no secret is provided and INTERNAL_AUTH_SECRET is not set.
@@ -62,7 +103,13 @@ class InternalAuthToken:
                 )
 
         self.shared_secret = shared_secret.encode('utf-8')
+        if compact_tokens is None:
+            compact_tokens = os.getenv("INTERNAL_AUTH_COMPACT_TOKENS", "false").lower() == "true"
+        self.compact_tokens = compact_tokens
         self.default_ttl_minutes = 5  # 5 minute token lifetime
+        # token -> (expires_at, payload), least recently used first
+        self._valid_cache: "OrderedDict[str, Tuple[int, Dict]]" = OrderedDict()
+        self._valid_cache_lock = threading.Lock()
 
     def create_token(self, service_name: str, client_ip: str = "127.0.0.1",
                     ttl_minutes: Optional[int] = None, metadata: Optional[Dict] = None) -> str:
@@ -76,7 +123,8 @@ class InternalAuthToken:
             metadata: Additional metadata to include in token
 
         Returns:
-            Base64-encoded token string
+            ``base64url(payload).signature`` token string when compact
+            tokens are enabled, else a legacy-format token
         """
         if ttl_minutes is None:
             ttl_minutes = self.default_ttl_minutes
@@ -93,99 +141,139 @@ class InternalAuthToken:
             "metadata": metadata or {}
         }
 
-        # Serialize payload
-        payload_json = json.dumps(payload, sort_keys=True)
-        payload_bytes = payload_json.encode('utf-8')
+        if not self.compact_tokens:
+            return self._create_legacy_token(payload)
+
+        # Serialize payload once; these exact bytes are signed and sent
+        payload_bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
 
         # Create HMAC signature
         signature = hmac.new(
             self.shared_secret,
             payload_bytes,
             hashlib.sha256
-        ).hexdigest()
+        ).digest()
 
-        # Combine payload and signature
-        token_data = {
-            "payload": payload,
-            "signature": signature
-        }
+        return f"{_b64url_encode(payload_bytes)}.{_b64url_encode(signature)}"
 
-        # Encode as base64 for transmission
-        token_json = json.dumps(token_data)
-        import base64
+    def _create_legacy_token(self, payload: Dict) -> str:
+        """Token in the format every peer release can validate: base64 of
+        ``{"payload": ..., "signature": hex HMAC of the sorted-key JSON}``."""
+        signature = hmac.new(
+            self.shared_secret,
+            json.dumps(payload, sort_keys=True).encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+        token_json = json.dumps({"payload": payload, "signature": signature})
         return base64.b64encode(token_json.encode('utf-8')).decode('utf-8')
 
+    @staticmethod
+    def _split_token(token: str) -> Tuple[bytes, bytes, Dict]:
+        """
+        Split a token into (signed bytes, raw provided signature, payload).
+
+        The payload is unverified at this point; callers must check the
+        signature before trusting it.
+        """
+        encoded_payload, dot, signature = token.partition(".")
+        if dot:
+            payload_bytes = _b64url_decode(encoded_payload)
+            return payload_bytes, _b64url_decode(signature), orjson.loads(payload_bytes)
+
+        # Legacy format: base64 of {"payload": ..., "signature": ...}
+        token_data = json.loads(base64.b64decode(token.encode('utf-8')))
+        payload = token_data.get("payload", {})
+        payload_bytes = json.dumps(payload, sort_keys=True).encode('utf-8')
+        return payload_bytes, bytes.fromhex(token_data.get("signature", "")), payload
+
     def validate_token(self, token: str, expected_service: Optional[str] = None,
                       expected_client_ip: Optional[str] = None) -> Tuple[bool, Optional[Dict]]:
         """
         Validate token and return payload if valid.
 
         Args:
-            token: Base64-encoded token string
+            token: Token string (compact or legacy format)
             expected_service: Expected service name (optional)
             expected_client_ip: Expected client IP (optional)
 
         Returns:
             Tuple of (is_valid, payload_dict)
         """
+        with self._valid_cache_lock:
+            cached = self._valid_cache.get(token)
+            if cached is not None:
+                self._valid_cache.move_to_end(token)
+        if cached is not None:
+            expires_at, payload = cached
+            if int(time.time()) > expires_at:
+                with self._valid_cache_lock:
+                    self._valid_cache.pop(token, None)
+                return False, None  # Token expired
+            return self._check_claims(payload, expected_service, expected_client_ip)
+
         try:
-            # Decode base64
-            import base64
-            token_json = base64.b64decode(token.encode('utf-8')).decode('utf-8')
-            token_data = json.loads(token_json)
+            payload_bytes, provided_signature, payload = self._split_token(token)
 
-            payload = token_data.get("payload", {})
-            provided_signature = token_data.get("signature", "")
+            # Cheap rejections first: stale or mismatched tokens never pay
+            # for the HMAC (acceptance still requires the signature below)
+            current_time = int(time.time())
+            expires_at = payload.get("expires_at", 0)
 
-            # Recreate signature to verify
-            payload_json = json.dumps(payload, sort_keys=True)
-            payload_bytes = payload_json.encode('utf-8')
+            if current_time > expires_at:
+                return False, None  # Token expired
+
+            if not self._check_claims(payload, expected_service, expected_client_ip)[0]:
+                return False, None
 
+            # Recreate signature to verify
             expected_signature = hmac.new(
                 self.shared_secret,
                 payload_bytes,
                 hashlib.sha256
-            ).hexdigest()
+            ).digest()
 
-            # Constant-time comparison
+            # Constant-time comparison of the raw 32-byte digests
             if not hmac.compare_digest(provided_signature, expected_signature):
                 return False, None
 
-            # Check expiration
-            current_time = int(time.time())
-            expires_at = payload.get("expires_at", 0)
-
-            if current_time > expires_at:
-                return False, None  # Token expired
-
-            # Check service name if provided
-            if expected_service and payload.get("service") != expected_service:
-                return False, None
-
-            # Check client IP if provided
-            if expected_client_ip and payload.get("client_ip") != expected_client_ip:
-                return False, None
+            # Signature and expiry are properties of the token alone, so the
+            # result is reusable; service/IP are re-checked per call
+            with self._valid_cache_lock:
+                self._valid_cache[token] = (expires_at, payload)
+                if len(self._valid_cache) > self.VALID_CACHE_MAXSIZE:
+                    self._valid_cache.popitem(last=False)
 
             return True, payload
 
         except Exception:
             return False, None
 
+    @staticmethod
+    def _check_claims(payload: Dict, expected_service: Optional[str],
+                      expected_client_ip: Optional[str]) -> Tuple[bool, Optional[Dict]]:
+        """Check the caller's service/IP expectations against a token payload."""
+        # Check service name if provided
+        if expected_service and payload.get("service") != expected_service:
+            return False, None
+
+        # Check client IP if provided
+        if expected_client_ip and payload.get("client_ip") != expected_client_ip:
+            return False, None
+
+        return True, payload
+
     def get_token_info(self, token: str) -> Optional[Dict]:
         """
         Get token information without validating signature (for debugging).
 
         Args:
-            token: Base64-encoded token string
+            token: Token string (compact or legacy format)
 
         Returns:
             Token payload dict or None if invalid format
         """
         try:
-            import base64
-            token_json = base64.b64decode(token.encode('utf-8')).decode('utf-8')
-            token_data = json.loads(token_json)
-            return token_data.get("payload", {})
+            return self._split_token(token)[2]
         except Exception:
             return None
 
@@ -55,7 +55,7 @@ class LogSanitizer:
 
         # Persistent download link hashes — the hash IS the credential (Lesson 43)
         'persistent_link_path': re.compile(r'(/(?:document|download)/persistent/)[A-Za-z0-9_\-]{16,}'),
-        # Bare link hashes (sha256[:24] hex)
+        # Bare link hashes (24 hex chars)
         'link_hash_hex': re.compile(r'\b[a-f0-9]{24}\b'),
 
         # URL query strings — may embed tokens or search terms
@@ -0,0 +1,47 @@
+"""Placeholder detection for MISTRAL_API_KEY values.
+
+Shared by EnhancedPatentClient and OCRService so both validators agree on
+what counts as a placeholder (a key copied from the docs or an unfilled
+config template is treated as missing, not sent to Mistral).
+"""
+import functools
+import os
+import re
+from typing import Optional
+
+# Common placeholder patterns treated as a missing Mistral key; extended by
+# the comma-separated MISTRAL_PLACEHOLDER_PATTERNS env var
+MISTRAL_PLACEHOLDER_PATTERNS = (
+    "your_mistral_api_key_here",
+    "your_key_here",
+    "your_api_key_here",
+    "placeholder",
+    "optional",
+    "enter_your_key",
+    "add_your_key",
+    "your_mistral_key",
+    "api_key_here",
+    "replace_with_your_key",
+    "insert_key_here",
+    "temp_key",
+    "test_key",
+    "example_key",
+    "change_me",
+    "replace_me",
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _placeholder_regex(env_patterns: str) -> "re.Pattern[str]":
+    """Single alternation over the default + MISTRAL_PLACEHOLDER_PATTERNS
+    placeholders, compiled once per distinct env value."""
+    patterns = MISTRAL_PLACEHOLDER_PATTERNS + tuple(
+        p.strip() for p in env_patterns.split(",") if p.strip()
+    )
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+def find_mistral_placeholder(key: str) -> Optional[str]:
+    """Return the placeholder pattern found in key (case-insensitive), or None."""
+    match = _placeholder_regex(os.getenv("MISTRAL_PLACEHOLDER_PATTERNS", "")).search(key.lower())
+    return match.group(0) if match else None
@@ -29,6 +29,11 @@ class SafeLoggerAdapter(logging.LoggerAdapter):
     - String messages
     - Dictionary arguments
     - Keyword arguments with sensitive keys
+
+    The level check runs first, so a call below the effective level costs
+    neither sanitization nor formatting. Prefer %-style arguments
+    (``logger.debug("doc %s", doc_id)``) over f-strings on hot paths so the
+    message is only built when the record is actually emitted.
     """
 
     def process(self, msg: Any, kwargs: Any) -> tuple:
@@ -55,16 +60,22 @@ class SafeLoggerAdapter(logging.LoggerAdapter):
 
     def debug(self, msg: Any, *args, **kwargs) -> None:
         """Log a debug message with sanitization."""
+        if not self.isEnabledFor(logging.DEBUG):
+            return
         msg, kwargs = self._sanitize_args(msg, *args, **kwargs)
         super().debug(msg, *args, **kwargs)
 
     def info(self, msg: Any, *args, **kwargs) -> None:
         """Log an info message with sanitization."""
+        if not self.isEnabledFor(logging.INFO):
+            return
         msg, kwargs = self._sanitize_args(msg, *args, **kwargs)
         super().info(msg, *args, **kwargs)
 
     def warning(self, msg: Any, *args, **kwargs) -> None:
         """Log a warning message with sanitization."""
+        if not self.isEnabledFor(logging.WARNING):
+            return
         msg, kwargs = self._sanitize_args(msg, *args, **kwargs)
         super().warning(msg, *args, **kwargs)
 
@@ -74,16 +85,22 @@ class SafeLoggerAdapter(logging.LoggerAdapter):
 
     def error(self, msg: Any, *args, **kwargs) -> None:
         """Log an error message with sanitization."""
+        if not self.isEnabledFor(logging.ERROR):
+            return
         msg, kwargs = self._sanitize_args(msg, *args, **kwargs)
         super().error(msg, *args, **kwargs)
 
     def exception(self, msg: Any, *args, **kwargs) -> None:
         """Log an exception message with sanitization."""
+        if not self.isEnabledFor(logging.ERROR):
+            return
         msg, kwargs = self._sanitize_args(msg, *args, **kwargs)
         super().exception(msg, *args, **kwargs)
 
     def critical(self, msg: Any, *args, **kwargs) -> None:
         """Log a critical message with sanitization."""
+        if not self.isEnabledFor(logging.CRITICAL):
+            return
         msg, kwargs = self._sanitize_args(msg, *args, **kwargs)
         super().critical(msg, *args, **kwargs)
 
@@ -40,27 +40,34 @@ ADVANTAGES over legacy format:
 For backward compatibility with legacy FPD MCP format, see secure_storage.py.
 """
 
+import base64
+import functools
+import logging
 import os
 import secrets
 import sys
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, NamedTuple, Optional
 
-from .util.dpapi_utils import encrypt_with_dpapi as _encrypt_dpapi
-from .util.dpapi_utils import decrypt_with_dpapi as _decrypt_dpapi
 from .shared.safe_logger import get_safe_logger
 
 logger = get_safe_logger(__name__)
 
+# Platform is fixed for the process lifetime; evaluated once for the hot paths
+_IS_WIN32 = sys.platform == "win32"
+
 
 def _encrypt_with_dpapi(data: bytes, entropy: bytes) -> bytes:
     """
     Encrypt data using Windows DPAPI with custom entropy.
 
     Delegates to the shared encrypt_with_dpapi implementation in dpapi_utils.
-    Kept as local wrapper for internal API compatibility.
+    Kept as local wrapper for internal API compatibility; the import is
+    deferred so non-Windows processes never load the ctypes DPAPI layer.
     """
-    return _encrypt_dpapi(data, entropy)
+    from .util.dpapi_utils import encrypt_with_dpapi
+    return encrypt_with_dpapi(data, entropy)
 
 
 def _decrypt_with_dpapi(encrypted_data: bytes, entropy: bytes) -> bytes:
@@ -68,9 +75,36 @@ def _decrypt_with_dpapi(encrypted_data: bytes, entropy: bytes) -> bytes:
     Decrypt data using Windows DPAPI with custom entropy.
 
     Delegates to the shared decrypt_with_dpapi implementation in dpapi_utils.
-    Kept as local wrapper for internal API compatibility.
+    Kept as local wrapper for internal API compatibility; the import is
+    deferred so non-Windows processes never load the ctypes DPAPI layer.
+    """
+    from .util.dpapi_utils import decrypt_with_dpapi
+    return decrypt_with_dpapi(encrypted_data, entropy)
+
+
+def _write_key_file(path: Path, data: bytes) -> None:
     """
-    return _decrypt_dpapi(encrypted_data, entropy)
+    Atomically replace `path` with `data`.
+
+    Writes a uniquely named 0600 temp file beside the target (mkstemp, so
+    concurrent writers from several MCPs and stale temp files from an
+    earlier crash never collide), fsyncs it and os.replace()s it over the
+    target. A crash mid-write leaves the previous key file intact instead of
+    a truncated one, and the published file never has looser permissions.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if hasattr(os, 'chmod'):
+            os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 class UnifiedSecureStorage:
@@ -93,10 +127,16 @@ class UnifiedSecureStorage:
         self.mistral_key_path = self.home_dir / ".mistral_api_key"
         self.internal_auth_secret_path = self.home_dir / ".uspto_internal_auth_secret"
 
-        # Log storage paths for debugging
-        logger.debug(f"USPTO key path: {self.uspto_key_path}")
-        logger.debug(f"Mistral key path: {self.mistral_key_path}")
-        logger.debug(f"Internal auth secret path: {self.internal_auth_secret_path}")
+        # Decrypted keys by path: ((st_mtime_ns, st_size), key). A DPAPI or
+        # systemd-creds decrypt per lookup is the dominant cost of a key read;
+        # the stat stamp invalidates an entry as soon as the file changes.
+        self._key_cache: dict = {}
+
+        # Log storage paths for debugging (skip the formatting when off)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"USPTO key path: {self.uspto_key_path}")
+            logger.debug(f"Mistral key path: {self.mistral_key_path}")
+            logger.debug(f"Internal auth secret path: {self.internal_auth_secret_path}")
 
     def has_uspto_key(self) -> bool:
         """Check if USPTO API key exists in secure storage."""
@@ -201,7 +241,6 @@ class UnifiedSecureStorage:
             return existing
 
         # Generate new random secret (32 bytes, base64 encoded)
-        import base64
         random_bytes = secrets.token_bytes(32)
         new_secret = base64.b64encode(random_bytes).decode('utf-8')
 
@@ -226,17 +265,9 @@ class UnifiedSecureStorage:
         Returns:
             True if successful, False otherwise
         """
+        self._key_cache.pop(path, None)
         try:
-            if sys.platform == "win32":
-                # Delete existing file if it exists (avoids permission issues on overwrite)
-                if path.exists():
-                    try:
-                        path.unlink()
-                        logger.debug(f"Deleted existing {key_name} file before writing new one")
-                    except Exception as e:
-                        logger.warning(f"Could not delete existing {key_name} file: {e}")
-                        # Continue anyway - write_bytes might still work
-
+            if _IS_WIN32:
                 # Generate cryptographically secure random entropy (CWE-330 compliant)
                 entropy = secrets.token_bytes(32)
 
@@ -247,12 +278,8 @@ class UnifiedSecureStorage:
                 # Format: entropy (32 bytes) + encrypted_data
                 file_data = entropy + encrypted_data
 
-                # Write to file with restricted permissions
-                path.write_bytes(file_data)
-
-                # Set restrictive permissions (owner read/write only)
-                if hasattr(os, 'chmod'):
-                    os.chmod(path, 0o600)
+                # Atomic replace with restricted permissions (owner read/write only)
+                _write_key_file(path, file_data)
 
                 logger.info(f"Stored {key_name} securely at: {path}")
                 return True
@@ -265,10 +292,7 @@ class UnifiedSecureStorage:
                 file_bytes, encrypted = encrypt_to_file_bytes(
                     key.encode('utf-8'), key_name
                 )
-                path.write_bytes(file_bytes)
-
-                if hasattr(os, 'chmod'):
-                    os.chmod(path, 0o600)
+                _write_key_file(path, file_bytes)
 
                 if encrypted:
                     logger.info(
@@ -287,7 +311,7 @@ class UnifiedSecureStorage:
 
     def _load_single_key(self, path: Path, key_name: str) -> Optional[str]:
         """
-        Load single key with entropy extraction.
+        Load single key, reusing the last decrypted value while the file is unchanged.
 
         Args:
             path: File path to load from
@@ -297,11 +321,38 @@ class UnifiedSecureStorage:
             Decrypted key string, or None if load fails
         """
         try:
-            if not path.exists():
-                logger.debug(f"{key_name} file not found: {path}")
-                return None
+            # One stat serves as both the existence check and the cache stamp
+            st = path.stat()
+        except FileNotFoundError:
+            logger.debug(f"{key_name} file not found: {path}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to load {key_name}: {e}")
+            return None
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._key_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        key = self._read_single_key(path, key_name)
+        if key is not None:
+            self._key_cache[path] = (stamp, key)
+        return key
 
-            if sys.platform == "win32":
+    def _read_single_key(self, path: Path, key_name: str) -> Optional[str]:
+        """
+        Read and decrypt single key with entropy extraction.
+
+        Args:
+            path: File path to load from
+            key_name: Key name for logging
+
+        Returns:
+            Decrypted key string, or None if load fails
+        """
+        try:
+            if _IS_WIN32:
                 # Read encrypted file data
                 file_data = path.read_bytes()
 
@@ -363,7 +414,7 @@ class UnifiedSecureStorage:
             "mistral_key_path": str(self.mistral_key_path),
             "internal_auth_secret_path": str(self.internal_auth_secret_path),
             "platform": sys.platform,
-            "dpapi_available": sys.platform == "win32"
+            "dpapi_available": _IS_WIN32
         }
 
     def list_available_keys(self) -> list:
@@ -383,36 +434,46 @@ class UnifiedSecureStorage:
         return keys
 
 
+@functools.lru_cache(maxsize=1)
+def _default_storage() -> UnifiedSecureStorage:
+    """Process-wide storage instance shared by the convenience functions.
+
+    The key paths only depend on the home directory, so resolving them (and
+    logging them) once per process is enough.
+    """
+    return UnifiedSecureStorage()
+
+
 # Convenience functions for backward compatibility and ease of use
 
 def get_uspto_api_key() -> Optional[str]:
     """Convenience function to get USPTO API key."""
-    return UnifiedSecureStorage().get_uspto_key()
+    return _default_storage().get_uspto_key()
 
 
 def store_uspto_api_key(key: str) -> bool:
     """Convenience function to store USPTO API key."""
-    return UnifiedSecureStorage().store_uspto_key(key)
+    return _default_storage().store_uspto_key(key)
 
 
 def get_mistral_api_key() -> Optional[str]:
     """Convenience function to get Mistral API key."""
-    return UnifiedSecureStorage().get_mistral_key()
+    return _default_storage().get_mistral_key()
 
 
 def store_mistral_api_key(key: str) -> bool:
     """Convenience function to store Mistral API key."""
-    return UnifiedSecureStorage().store_mistral_key(key)
+    return _default_storage().store_mistral_key(key)
 
 
 def get_internal_auth_secret() -> Optional[str]:
     """Convenience function to get internal auth secret."""
-    return UnifiedSecureStorage().get_internal_auth_secret()
+    return _default_storage().get_internal_auth_secret()
 
 
 def store_internal_auth_secret(secret: str) -> bool:
     """Convenience function to store internal auth secret."""
-    return UnifiedSecureStorage().store_internal_auth_secret(secret)
+    return _default_storage().store_internal_auth_secret(secret)
 
 
 def ensure_internal_auth_secret() -> str:
@@ -428,7 +489,30 @@ def ensure_internal_auth_secret() -> str:
     Raises:
         RuntimeError: If secret generation or storage fails
     """
-    return UnifiedSecureStorage().ensure_internal_auth_secret()
+    return _default_storage().ensure_internal_auth_secret()
+
+
+class _ApiKeyAccessors(NamedTuple):
+    """UnifiedSecureStorage methods backing one dedicated API key file."""
+
+    has: Callable[[UnifiedSecureStorage], bool]
+    get: Callable[[UnifiedSecureStorage], Optional[str]]
+    store: Callable[[UnifiedSecureStorage, str], bool]
+
+
+# Dispatch table for the key-name based helpers below
+_API_KEY_ACCESSORS: Dict[str, _ApiKeyAccessors] = {
+    "USPTO_API_KEY": _ApiKeyAccessors(
+        UnifiedSecureStorage.has_uspto_key,
+        UnifiedSecureStorage.get_uspto_key,
+        UnifiedSecureStorage.store_uspto_key,
+    ),
+    "MISTRAL_API_KEY": _ApiKeyAccessors(
+        UnifiedSecureStorage.has_mistral_key,
+        UnifiedSecureStorage.get_mistral_key,
+        UnifiedSecureStorage.store_mistral_key,
+    ),
+}
 
 
 def has_secure_key(key_name: str) -> bool:
@@ -441,13 +525,10 @@ def has_secure_key(key_name: str) -> bool:
     Returns:
         True if key exists, False otherwise
     """
-    storage = UnifiedSecureStorage()
-    if key_name == "USPTO_API_KEY":
-        return storage.has_uspto_key()
-    elif key_name == "MISTRAL_API_KEY":
-        return storage.has_mistral_key()
-    else:
+    accessors = _API_KEY_ACCESSORS.get(key_name)
+    if accessors is None:
         return False
+    return accessors.has(_default_storage())
 
 
 def get_secure_api_key(key_name: str) -> Optional[str]:
@@ -460,13 +541,10 @@ def get_secure_api_key(key_name: str) -> Optional[str]:
     Returns:
         API key string or None
     """
-    storage = UnifiedSecureStorage()
-    if key_name == "USPTO_API_KEY":
-        return storage.get_uspto_key()
-    elif key_name == "MISTRAL_API_KEY":
-        return storage.get_mistral_key()
-    else:
+    accessors = _API_KEY_ACCESSORS.get(key_name)
+    if accessors is None:
         return None
+    return accessors.get(_default_storage())
 
 
 def store_secure_api_key(key: str, key_name: str) -> bool:
@@ -480,14 +558,29 @@ def store_secure_api_key(key: str, key_name: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    storage = UnifiedSecureStorage()
-    if key_name == "USPTO_API_KEY":
-        return storage.store_uspto_key(key)
-    elif key_name == "MISTRAL_API_KEY":
-        return storage.store_mistral_key(key)
-    else:
+    accessors = _API_KEY_ACCESSORS.get(key_name)
+    if accessors is None:
         # Delegate to generic storage for arbitrary key names
         return store_generic_secret(key, key_name)
+    return accessors.store(_default_storage(), key)
+
+
+def get_api_key_with_env_fallback(key_name: str) -> Optional[str]:
+    """
+    Get an API key from secure storage, falling back to the environment.
+
+    Args:
+        key_name: "USPTO_API_KEY" or "MISTRAL_API_KEY" (also the env var name)
+
+    Returns:
+        Stored key, else the environment variable value, else None
+    """
+    try:
+        stored = get_secure_api_key(key_name)
+    except Exception:
+        # Fall back to environment variable if secure storage fails
+        stored = None
+    return stored or os.getenv(key_name)
 
 
 def get_generic_secret(key_name: str) -> Optional[str]:
@@ -506,7 +599,7 @@ def get_generic_secret(key_name: str) -> Optional[str]:
         Decrypted secret string, or None if not found or decryption fails
     """
     try:
-        storage = UnifiedSecureStorage()
+        storage = _default_storage()
         return storage._load_single_key(
             storage.home_dir / f".uspto_generic_secret_{key_name}",
             key_name
@@ -533,7 +626,7 @@ def store_generic_secret(secret: str, key_name: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        storage = UnifiedSecureStorage()
+        storage = _default_storage()
         return storage._store_single_key(
             secret,
             storage.home_dir / f".uspto_generic_secret_{key_name}",
@@ -5,11 +5,24 @@ Shared DPAPI operations for all secure storage implementations.
 This module provides a single source of truth for DPAPI-related
 structures and helper functions, eliminating duplication across
 secure_storage.py and shared_secure_storage.py.
+
+The bindings stay in ctypes on purpose: the package is a pure-Python
+hatchling wheel, and DPAPI is called once per key-file write and (with the
+decrypted-key cache in shared_secure_storage) once per key-file change on
+read, so a compiled extension would add a per-platform build for no
+measurable gain. The per-call ctypes overhead is kept low instead by the
+prototyped bindings and copy-free input blobs below.
 """
 
 import ctypes
 import sys
 
+# Platform is fixed for the process lifetime; evaluated once for the hot paths
+_IS_WIN32 = sys.platform == "win32"
+
+# dwFlags for CryptProtectData/CryptUnprotectData: never show a prompt
+CRYPTPROTECT_UI_FORBIDDEN = 0x01
+
 # wintypes is Windows-only — import lazily so this module can be imported on Linux/macOS
 try:
     import ctypes.wintypes
@@ -63,12 +76,11 @@ def get_data_from_blob(blob: DATA_BLOB) -> bytes:
     if not blob.cbData:
         return b''
 
-    cbData = int(blob.cbData)
     pbData = blob.pbData
-    buffer = ctypes.create_string_buffer(cbData)
-    ctypes.memmove(buffer, pbData, cbData)
-    ctypes.windll.kernel32.LocalFree(pbData)
-    return buffer.raw
+    # One copy straight into a bytes object (no intermediate string buffer)
+    data = ctypes.string_at(pbData, blob.cbData)
+    _LocalFree(pbData)
+    return data
 
 
 def is_windows() -> bool:
@@ -78,7 +90,7 @@ def is_windows() -> bool:
     Returns:
         True if running on Windows, False otherwise
     """
-    return sys.platform == "win32"
+    return _IS_WIN32
 
 
 def check_dpapi_available() -> None:
@@ -104,7 +116,9 @@ def create_data_blob(data: bytes) -> DATA_BLOB:
     Create a DATA_BLOB structure from bytes.
 
     Helper function to create a properly initialized DATA_BLOB
-    structure from Python bytes.
+    structure from Python bytes. The blob points straight at the bytes
+    object's buffer (no intermediate copy); DPAPI only reads input blobs,
+    and the blob keeps a reference to `data` for as long as it is alive.
 
     Args:
         data: Binary data to wrap in DATA_BLOB
@@ -118,11 +132,8 @@ def create_data_blob(data: bytes) -> DATA_BLOB:
         14
     """
     blob = DATA_BLOB()
-    blob.pbData = ctypes.cast(
-        ctypes.create_string_buffer(data),
-        ctypes.POINTER(ctypes.c_char)
-    )
     blob.cbData = len(data)
+    blob.pbData = ctypes.cast(ctypes.c_char_p(data), ctypes.POINTER(ctypes.c_char))
     return blob
 
 
@@ -133,6 +144,43 @@ else:
     _LPWSTR = ctypes.c_wchar_p  # type: ignore[attr-defined,misc]
 
 
+# Win32 bindings resolved once, with argtypes/restype declared so ctypes
+# converts arguments directly instead of guessing per call. Private WinDLL
+# handles keep these declarations from leaking into ctypes.windll users, and
+# use_last_error captures GetLastError right after each call.
+if _IS_WIN32:
+    _crypt32 = ctypes.WinDLL("crypt32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _CryptProtectData = _crypt32.CryptProtectData
+    _CryptProtectData.argtypes = [
+        ctypes.POINTER(DATA_BLOB),      # pDataIn
+        ctypes.c_wchar_p,               # szDataDescr
+        ctypes.POINTER(DATA_BLOB),      # pOptionalEntropy
+        ctypes.c_void_p,                # pvReserved
+        ctypes.c_void_p,                # pPromptStruct
+        _DWORD,                         # dwFlags
+        ctypes.POINTER(DATA_BLOB),      # pDataOut
+    ]
+    _CryptProtectData.restype = ctypes.c_int
+
+    _CryptUnprotectData = _crypt32.CryptUnprotectData
+    _CryptUnprotectData.argtypes = [
+        ctypes.POINTER(DATA_BLOB),      # pDataIn
+        ctypes.POINTER(_LPWSTR),        # ppszDataDescr
+        ctypes.POINTER(DATA_BLOB),      # pOptionalEntropy
+        ctypes.c_void_p,                # pvReserved
+        ctypes.c_void_p,                # pPromptStruct
+        _DWORD,                         # dwFlags
+        ctypes.POINTER(DATA_BLOB),      # pDataOut
+    ]
+    _CryptUnprotectData.restype = ctypes.c_int
+
+    _LocalFree = _kernel32.LocalFree
+    _LocalFree.argtypes = [ctypes.c_void_p]
+    _LocalFree.restype = ctypes.c_void_p
+
+
 def encrypt_with_dpapi(data: bytes, entropy: bytes, description: str = "USPTO MCP API Key") -> bytes:
     """
     Encrypt data using Windows DPAPI with custom entropy.
@@ -149,25 +197,16 @@ def encrypt_with_dpapi(data: bytes, entropy: bytes, description: str = "USPTO MC
         OSError: If encryption fails
         RuntimeError: If not running on Windows
     """
-    if sys.platform != "win32":
+    if not _IS_WIN32:
         raise RuntimeError("DPAPI is only available on Windows")
 
-    # Prepare input data blob
-    data_in = DATA_BLOB()
-    data_in.pbData = ctypes.cast(ctypes.create_string_buffer(data), ctypes.POINTER(ctypes.c_char))
-    data_in.cbData = len(data)
-
-    # Prepare output data blob
+    # Input and entropy blobs point at the caller's bytes; output is filled by DPAPI
+    data_in = create_data_blob(data)
+    entropy_blob = create_data_blob(entropy)
     data_out = DATA_BLOB()
 
-    # Prepare entropy blob
-    entropy_blob = DATA_BLOB()
-    entropy_blob.pbData = ctypes.cast(ctypes.create_string_buffer(entropy), ctypes.POINTER(ctypes.c_char))
-    entropy_blob.cbData = len(entropy)
-
     # Call CryptProtectData
-    CRYPTPROTECT_UI_FORBIDDEN = 0x01
-    result = ctypes.windll.crypt32.CryptProtectData(
+    result = _CryptProtectData(
         ctypes.byref(data_in),          # pDataIn
         description,                    # szDataDescr
         ctypes.byref(entropy_blob),     # pOptionalEntropy
@@ -178,7 +217,7 @@ def encrypt_with_dpapi(data: bytes, entropy: bytes, description: str = "USPTO MC
     )
 
     if not result:
-        error_code = ctypes.windll.kernel32.GetLastError()
+        error_code = ctypes.get_last_error()
         raise OSError(f"CryptProtectData failed with error code: {error_code}")
 
     # Extract encrypted data
@@ -201,30 +240,18 @@ def decrypt_with_dpapi(encrypted_data: bytes, entropy: bytes) -> bytes:
         OSError: If decryption fails
         RuntimeError: If not running on Windows
     """
-    if sys.platform != "win32":
+    if not _IS_WIN32:
         raise RuntimeError("DPAPI is only available on Windows")
 
-    # Prepare input data blob
-    data_in = DATA_BLOB()
-    data_in.pbData = ctypes.cast(ctypes.create_string_buffer(encrypted_data), ctypes.POINTER(ctypes.c_char))
-    data_in.cbData = len(encrypted_data)
-
-    # Prepare output data blob
+    # Input and entropy blobs point at the caller's bytes; output is filled by DPAPI
+    data_in = create_data_blob(encrypted_data)
+    entropy_blob = create_data_blob(entropy)
     data_out = DATA_BLOB()
 
-    # Prepare entropy blob
-    entropy_blob = DATA_BLOB()
-    entropy_blob.pbData = ctypes.cast(ctypes.create_string_buffer(entropy), ctypes.POINTER(ctypes.c_char))
-    entropy_blob.cbData = len(entropy)
-
-    # Prepare description pointer — use _LPWSTR (portable across Windows/Linux/macOS)
-    description_ptr = _LPWSTR()
-
     # Call CryptUnprotectData
-    CRYPTPROTECT_UI_FORBIDDEN = 0x01
-    result = ctypes.windll.crypt32.CryptUnprotectData(
+    result = _CryptUnprotectData(
         ctypes.byref(data_in),          # pDataIn
-        ctypes.byref(description_ptr),  # ppszDataDescr
+        None,                           # ppszDataDescr (NULL: description not needed)
         ctypes.byref(entropy_blob),     # pOptionalEntropy
         None,                           # pvReserved
         None,                           # pPromptStruct
@@ -233,12 +260,8 @@ def decrypt_with_dpapi(encrypted_data: bytes, entropy: bytes) -> bytes:
     )
 
     if not result:
-        error_code = ctypes.windll.kernel32.GetLastError()
+        error_code = ctypes.get_last_error()
         raise OSError(f"CryptUnprotectData failed with error code: {error_code}")
 
-    # Clean up description
-    if description_ptr.value:
-        ctypes.windll.kernel32.LocalFree(description_ptr)
-
     # Extract decrypted data
     return get_data_from_blob(data_out)
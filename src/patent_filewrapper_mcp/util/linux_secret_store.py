@@ -106,10 +106,15 @@ def decrypt_from_file_bytes(file_bytes: bytes, name: str) -> Tuple[Optional[byte
     Returns (plaintext, was_encrypted). Content without the magic prefix is
     treated as legacy plaintext and returned as-is with was_encrypted=False.
     Returns (None, True) when an encrypted blob cannot be decrypted (wrong
-    user/machine, corrupted file).
+    user/machine, corrupted file, or no working backend on this host).
     """
     if not file_bytes.startswith(MAGIC):
         return file_bytes, False
+    if not backend_available():
+        # Skip spawning a systemd-creds decrypt that the probe already
+        # showed cannot succeed here (failed loads are retried per lookup)
+        logger.error(f"systemd-creds unavailable - cannot decrypt {name}")
+        return None, True
     try:
         plain = _run_creds(
             ["decrypt", "--user", f"--name={_credential_name(name)}"],
@@ -4,10 +4,12 @@ Enhanced security logging for USPTO Patent File Wrapper MCP
 Provides structured JSON logging for security events with rotation policies.
 Includes threshold-based alerting for critical security events.
 """
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import time
 from collections import defaultdict
 from datetime import datetime, timedelta
@@ -63,7 +65,16 @@ class SecurityLogger:
                 encoding='utf-8'
             )
             handler.setFormatter(JSONFormatter())
-            self.logger.addHandler(handler)
+            # Security events are logged from request handlers on the event
+            # loop: they only enqueue, and a listener thread does the JSON
+            # formatting and file write (same model as config/log_config.py)
+            queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            listener = logging.handlers.QueueListener(
+                queue_handler.queue, handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            self.logger.addHandler(queue_handler)
 
         # Sink-level sanitization guarantee: every handler on this logger must
         # carry the SanitizingFilter, whoever created it.
@@ -140,7 +151,9 @@ class SecurityLogger:
             **data
         }
 
-        self.logger.info(json.dumps(log_entry))
+        # Serialize only when the record will be emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(json.dumps(log_entry))
 
         # Check for alerting if enabled
         if self.enable_alerting and event_type in self.alert_thresholds:
@@ -0,0 +1,129 @@
+"""Tests for inter-MCP token creation and validation (shared/internal_auth.py)."""
+
+import base64
+import hashlib
+import hmac
+import json
+
+from patent_filewrapper_mcp.shared import internal_auth
+from patent_filewrapper_mcp.shared.internal_auth import InternalAuthToken
+
+SECRET = "test-shared-secret-0123456789abcdef"
+
+
+def test_token_round_trip_and_claims():
+    auth = InternalAuthToken(SECRET)
+    token = auth.create_token("fpd-mcp", metadata={"type": "document_access"})
+
+    ok, payload = auth.validate_token(token, expected_service="fpd-mcp")
+    assert ok and payload["metadata"] == {"type": "document_access"}
+    assert auth.validate_token(token, expected_service="ptab-mcp") == (False, None)
+    assert auth.validate_token(token, expected_client_ip="10.0.0.1") == (False, None)
+
+
+def _legacy_token(payload, secret=SECRET):
+    """Token in the pre-compact format still issued by older peer MCPs."""
+    signature = hmac.new(secret.encode(), json.dumps(payload, sort_keys=True).encode(),
+                         hashlib.sha256).hexdigest()
+    return base64.b64encode(json.dumps({"payload": payload, "signature": signature}).encode()).decode()
+
+
+def test_legacy_token_issued_by_default(monkeypatch):
+    """Peers on older releases only parse legacy tokens, so they stay the default."""
+    monkeypatch.delenv("INTERNAL_AUTH_COMPACT_TOKENS", raising=False)
+    auth = InternalAuthToken(SECRET)
+    token = auth.create_token("pfw-mcp")
+
+    # Validated the way an older peer release does it
+    token_data = json.loads(base64.b64decode(token))
+    expected = hmac.new(SECRET.encode(), json.dumps(token_data["payload"], sort_keys=True).encode(),
+                        hashlib.sha256).hexdigest()
+    assert "." not in token and hmac.compare_digest(token_data["signature"], expected)
+    assert auth.validate_token(token, expected_service="pfw-mcp")[0] is True
+
+    monkeypatch.setenv("INTERNAL_AUTH_COMPACT_TOKENS", "true")
+    assert "." in InternalAuthToken(SECRET).create_token("pfw-mcp")
+
+
+def test_compact_token_signs_transmitted_bytes():
+    auth = InternalAuthToken(SECRET, compact_tokens=True)
+    token = auth.create_token("fpd-mcp")
+    encoded, signature = token.split(".")
+    payload_bytes = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+
+    assert "=" not in token
+    assert base64.urlsafe_b64decode(signature + "=") == hmac.new(
+        SECRET.encode(), payload_bytes, hashlib.sha256).digest()
+    assert auth.get_token_info(token)["service"] == "fpd-mcp"
+
+
+def test_legacy_token_still_accepted():
+    now = int(internal_auth.time.time())
+    payload = {"service": "fpd-mcp", "client_ip": "127.0.0.1", "issued_at": now,
+               "expires_at": now + 300, "metadata": {}}
+    auth = InternalAuthToken(SECRET)
+
+    assert auth.validate_token(_legacy_token(payload), expected_service="fpd-mcp") == (True, payload)
+    assert auth.get_token_info(_legacy_token(payload)) == payload
+    assert auth.validate_token(_legacy_token(payload, secret="wrong-secret-000000")) == (False, None)
+
+
+def test_tampered_payload_rejected():
+    auth = InternalAuthToken(SECRET, compact_tokens=True)
+    _, signature = auth.create_token("fpd-mcp").split(".")
+    forged = base64.urlsafe_b64encode(b'{"service":"fpd-mcp","expires_at":9999999999}').decode()
+    assert auth.validate_token(f"{forged}.{signature}") == (False, None)
+
+
+def test_token_from_other_secret_rejected():
+    token = InternalAuthToken("another-secret-value-0000000000").create_token("fpd-mcp")
+    assert InternalAuthToken(SECRET).validate_token(token) == (False, None)
+
+
+def test_valid_token_cached_skips_hmac(monkeypatch):
+    auth = InternalAuthToken(SECRET)
+    token = auth.create_token("fpd-mcp")
+    assert auth.validate_token(token)[0] is True
+
+    calls = []
+    real_new = internal_auth.hmac.new
+    monkeypatch.setattr(internal_auth.hmac, "new", lambda *a, **k: calls.append(1) or real_new(*a, **k))
+    assert auth.validate_token(token, expected_service="fpd-mcp")[0] is True
+    # Claims are still checked on a cache hit
+    assert auth.validate_token(token, expected_service="ptab-mcp") == (False, None)
+    assert calls == []
+
+
+def test_cached_token_still_expires(monkeypatch):
+    auth = InternalAuthToken(SECRET)
+    token = auth.create_token("fpd-mcp", ttl_minutes=1)
+    assert auth.validate_token(token)[0] is True
+
+    later = internal_auth.time.time() + 120
+    monkeypatch.setattr(internal_auth.time, "time", lambda: later)
+    assert auth.validate_token(token) == (False, None)
+    assert token not in auth._valid_cache
+
+
+def test_valid_cache_bounded(monkeypatch):
+    monkeypatch.setattr(InternalAuthToken, "VALID_CACHE_MAXSIZE", 2)
+    auth = InternalAuthToken(SECRET)
+    tokens = [auth.create_token(f"svc-{i}") for i in range(3)]
+    for token in tokens:
+        assert auth.validate_token(token)[0] is True
+    assert list(auth._valid_cache) == tokens[1:]
+
+
+def test_expired_or_mismatched_token_rejected_before_hmac(monkeypatch):
+    auth = InternalAuthToken(SECRET)
+    token = auth.create_token("fpd-mcp", ttl_minutes=1)
+
+    calls = []
+    real_new = internal_auth.hmac.new
+    monkeypatch.setattr(internal_auth.hmac, "new", lambda *a, **k: calls.append(1) or real_new(*a, **k))
+    assert auth.validate_token(token, expected_service="ptab-mcp") == (False, None)
+
+    later = internal_auth.time.time() + 120
+    monkeypatch.setattr(internal_auth.time, "time", lambda: later)
+    assert auth.validate_token(token) == (False, None)
+    assert calls == []
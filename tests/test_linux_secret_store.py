@@ -94,3 +94,14 @@ def test_get_or_create_fernet_returns_working_cipher(tmp_path, monkeypatch):
         # remove the test artifact from the home dir
         artifact = Path.home() / ".uspto_generic_secret_PYTEST_FERNET_KEY"
         artifact.unlink(missing_ok=True)
+
+
+def test_decrypt_skips_subprocess_without_backend(monkeypatch):
+    """An encrypted blob on a host without the backend fails fast."""
+    def _no_spawn(args, input_bytes):
+        raise AssertionError("systemd-creds must not be spawned")
+
+    monkeypatch.setattr(lss, "_backend_ok", False)
+    monkeypatch.setattr(lss, "_run_creds", _no_spawn)
+    assert lss.decrypt_from_file_bytes(lss.MAGIC + b"blob", "TEST_KEY") == (None, True)
+    assert lss.decrypt_from_file_bytes(b"legacy-plain", "TEST_KEY") == (b"legacy-plain", False)
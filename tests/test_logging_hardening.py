@@ -194,3 +194,29 @@ class TestAuthFailureLogging:
         assert exc_info.value.status_code == 401
         assert "Proxy token" in caplog.text
         assert presented not in caplog.text
+
+
+def test_security_events_written_off_the_calling_thread():
+    """security_logger enqueues records; a listener thread writes security.log."""
+    import logging.handlers
+    from patent_filewrapper_mcp.util.security_logger import security_logger
+
+    assert any(
+        isinstance(h, logging.handlers.QueueHandler) for h in security_logger.logger.handlers
+    )
+
+
+def test_safe_logger_skips_sanitizing_below_level(monkeypatch):
+    """A filtered-out call never reaches the sanitizer or message formatting."""
+    from patent_filewrapper_mcp.shared import safe_logger
+
+    calls = []
+    monkeypatch.setattr(
+        safe_logger._sanitizer, "sanitize_string", lambda value: calls.append(value) or value
+    )
+    logger = safe_logger.get_safe_logger("test.lazy_debug")
+    logger.logger.setLevel(logging.INFO)
+    logger.debug("Proxying download for app %s", "17896175")
+    assert calls == []
+    logger.info("Proxying download for app %s", "17896175")
+    assert calls
@@ -66,8 +66,17 @@ async def test_content_length_over_limit_rejected():
 def _mock_async_client(payload: bytes, status_code: int = 200):
     """AsyncClient factory whose transport always returns `payload`."""
 
+    class _NetworkStream(httpx.AsyncByteStream):
+        # Unread body, like a real socket (content= would pre-read it)
+        async def __aiter__(self):
+            yield payload
+
     def handler(request):
-        return httpx.Response(status_code, content=payload)
+        return httpx.Response(
+            status_code,
+            headers={"Content-Length": str(len(payload))},
+            stream=_NetworkStream(),
+        )
 
     real_client = httpx.AsyncClient
 
@@ -78,6 +87,27 @@ def _mock_async_client(payload: bytes, status_code: int = 200):
     return factory
 
 
+@pytest.fixture(autouse=True)
+def _fresh_download_client(monkeypatch):
+    """Each test builds its own pooled download client from the patched factory."""
+    monkeypatch.setattr(proxy_server, "_download_client", None)
+
+
+@pytest.mark.asyncio
+async def test_download_client_reused_across_downloads(monkeypatch):
+    payload = b"%PDF-1.7\n" + b"y" * 100
+    monkeypatch.setattr(
+        proxy_server.httpx, "AsyncClient", _mock_async_client(payload)
+    )
+    await _open_upstream_pdf_stream("https://api.uspto.gov/a.pdf", {}, "req-1", "TEST")
+    client = proxy_server._download_client
+    await _open_upstream_pdf_stream("https://api.uspto.gov/b.pdf", {}, "req-2", "TEST")
+    assert client is not None and proxy_server._download_client is client
+    assert not client.is_closed
+    await proxy_server._close_download_client()
+    assert client.is_closed
+
+
 @pytest.mark.asyncio
 async def test_non_pdf_upstream_body_rejected_with_502(monkeypatch):
     monkeypatch.setattr(
@@ -96,11 +126,93 @@ async def test_pdf_upstream_body_streams_fully(monkeypatch):
     monkeypatch.setattr(
         proxy_server.httpx, "AsyncClient", _mock_async_client(payload)
     )
-    stream = await _open_upstream_pdf_stream(
+    body, content_length = await _open_upstream_pdf_stream(
+        "https://api.uspto.gov/doc.pdf", {}, "req-test", "TEST"
+    )
+    # Small known-size bodies come back fully buffered
+    assert body == payload
+    assert content_length == len(payload)
+
+
+@pytest.mark.asyncio
+async def test_large_pdf_upstream_streams_with_content_length(monkeypatch):
+    payload = b"%PDF-1.7\n" + b"y" * 20000
+    monkeypatch.setattr(
+        proxy_server.httpx, "AsyncClient", _mock_async_client(payload)
+    )
+    monkeypatch.setattr(proxy_server, "MAX_BUFFERED_PDF_BYTES", 1024)
+    stream, content_length = await _open_upstream_pdf_stream(
         "https://api.uspto.gov/doc.pdf", {}, "req-test", "TEST"
     )
     received = b"".join([chunk async for chunk in stream])
     assert received == payload
+    assert content_length == len(payload)
+
+
+@pytest.mark.asyncio
+async def test_download_slot_released_on_every_path(monkeypatch):
+    """Buffered, streamed and failed downloads all hand back their slot."""
+    payload = b"%PDF-1.7\n" + b"y" * 2000
+    denied_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(403, content=b"denied"))
+    )
+    monkeypatch.setattr(
+        proxy_server.httpx, "AsyncClient", _mock_async_client(payload)
+    )
+    slots = proxy_server._get_download_slots()
+    free_before = slots._value
+
+    await _open_upstream_pdf_stream("https://api.uspto.gov/a.pdf", {}, "req-1", "TEST")
+    assert slots._value == free_before
+
+    monkeypatch.setattr(proxy_server, "MAX_BUFFERED_PDF_BYTES", 1024)
+    stream, _ = await _open_upstream_pdf_stream("https://api.uspto.gov/b.pdf", {}, "req-2", "TEST")
+    assert slots._value == free_before - 1
+    b"".join([chunk async for chunk in stream])
+    assert slots._value == free_before
+
+    monkeypatch.setattr(proxy_server, "_download_client", denied_client)
+    with pytest.raises(httpx.HTTPStatusError):
+        await _open_upstream_pdf_stream("https://api.uspto.gov/c.pdf", {}, "req-3", "TEST")
+    assert slots._value == free_before
+
+
+@pytest.mark.asyncio
+async def test_download_slot_released_when_stream_never_starts(monkeypatch):
+    """A client gone before the body is sent must not leak the slot."""
+    from starlette.background import BackgroundTask
+    from starlette.requests import ClientDisconnect
+
+    from patent_filewrapper_mcp.proxy.routes.downloads import _pdf_response
+
+    payload = b"%PDF-1.7\n" + b"y" * 2000
+    monkeypatch.setattr(
+        proxy_server.httpx, "AsyncClient", _mock_async_client(payload)
+    )
+    monkeypatch.setattr(proxy_server, "MAX_BUFFERED_PDF_BYTES", 1024)
+    slots = proxy_server._get_download_slots()
+    free_before = slots._value
+
+    stream, content_length = await _open_upstream_pdf_stream(
+        "https://api.uspto.gov/a.pdf", {}, "req-1", "TEST"
+    )
+    assert slots._value == free_before - 1
+    response = _pdf_response(stream, content_length, {}, BackgroundTask(lambda: None))
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        raise OSError("client went away")
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await response(scope, receive, send)
+    assert slots._value == free_before
+
+    # Closing again (e.g. the route's error path) is a no-op
+    await proxy_server._release_pdf_body(stream)
+    assert slots._value == free_before
 
 
 @pytest.mark.asyncio
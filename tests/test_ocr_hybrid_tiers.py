@@ -1,6 +1,8 @@
 """Tier tests for the refactored OCR waterfall (audits: complexity 8/10 item,
 F1 OCRService delegation, F43 untested Docling/terminal branches, F48/F49)."""
 
+import sys
+
 import pytest
 
 from patent_filewrapper_mcp.api import enhanced_client as ec_mod
@@ -131,3 +133,366 @@ def test_ocr_service_is_the_single_mistral_implementation(client):
     """F1: the client must delegate to OCRService — no second copy."""
     assert not hasattr(client, "extract_document_content_with_mistral")
     assert client.ocr_service.mistral_ocr_model == client.mistral_ocr_model
+
+
+@pytest.mark.asyncio
+async def test_ocr_rate_limit_sliding_window_counter(monkeypatch):
+    from patent_filewrapper_mcp.exceptions import OCRRateLimitError
+    from patent_filewrapper_mcp.services import ocr_rate_limiter
+    from patent_filewrapper_mcp.services.ocr_service import OCRService
+
+    monkeypatch.delenv("MISTRAL_OCR_SHARED_RATE_LIMIT_DIR", raising=False)
+    now = [1000.0]
+    monkeypatch.setattr(ocr_rate_limiter.time, "time", lambda: now[0])
+    service = OCRService(api_key="mistral-test-key-0123456789")
+    for _ in range(service.ocr_rate_limit):
+        await service._check_ocr_rate_limit("req")
+    with pytest.raises(OCRRateLimitError):
+        await service._check_ocr_rate_limit("req")
+
+    # The previous window's calls still weigh in right after the boundary...
+    now[0] = 1020.0
+    with pytest.raises(OCRRateLimitError):
+        await service._check_ocr_rate_limit("req")
+
+    # ...and slide out as the window moves on
+    now[0] = 1000.0 + service.ocr_window
+    await service._check_ocr_rate_limit("req")
+    now[0] += 2 * service.ocr_window
+    for _ in range(service.ocr_rate_limit):
+        await service._check_ocr_rate_limit("req")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="shared limiter uses fcntl")
+async def test_shared_ocr_rate_limit_spans_limiters(monkeypatch, tmp_path):
+    """Two workers pointed at one directory draw from a single budget."""
+    from patent_filewrapper_mcp.exceptions import OCRRateLimitError
+    from patent_filewrapper_mcp.services import ocr_rate_limiter
+
+    monkeypatch.setenv("MISTRAL_OCR_SHARED_RATE_LIMIT_DIR", str(tmp_path))
+    monkeypatch.setattr(ocr_rate_limiter.time, "time", lambda: 1000.0)
+    worker_a = ocr_rate_limiter.build_ocr_rate_limiter(limit=3, window=60)
+    worker_b = ocr_rate_limiter.build_ocr_rate_limiter(limit=3, window=60)
+    assert isinstance(worker_a, ocr_rate_limiter.SharedOCRRateLimiter)
+
+    await worker_a.check("a1")
+    await worker_b.check("b1")
+    await worker_a.check("a2")
+    with pytest.raises(OCRRateLimitError):
+        await worker_b.check("b2")
+
+
+def test_client_resolves_each_key_once(monkeypatch):
+    """The Mistral key the client found missing is not re-read by OCRService."""
+    from patent_filewrapper_mcp import shared_secure_storage
+
+    lookups = []
+
+    def _lookup(key_name):
+        lookups.append(key_name)
+        return "test-uspto-key-0123456789" if key_name == "USPTO_API_KEY" else None
+
+    monkeypatch.setattr(shared_secure_storage, "get_api_key_with_env_fallback", _lookup)
+    c = EnhancedPatentClient()
+    assert lookups == ["USPTO_API_KEY", "MISTRAL_API_KEY"]
+    assert c.mistral_api_key is None
+    assert c.ocr_service.mistral_api_key is None
+
+
+def _mistral_mock_transport(seen):
+    import httpx
+
+    def handler(request):
+        seen.append((request.url.path, request.headers.get("authorization")))
+        if request.url.path.endswith("/files"):
+            return httpx.Response(200, json={"id": "file-1"})
+        return httpx.Response(200, json={
+            "pages": [{"index": 0, "markdown": "page text"}],
+            "usage_info": {"pages_processed": 1},
+        })
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def mistral_service(monkeypatch):
+    """OCRService whose pooled client talks to a mock Mistral API."""
+    import httpx
+
+    from patent_filewrapper_mcp.services import ocr_service
+
+    seen, built = [], []
+    real_client = httpx.AsyncClient
+
+    def _client(**kwargs):
+        built.append(kwargs)
+        return real_client(transport=_mistral_mock_transport(seen), headers=kwargs.get("headers"))
+
+    monkeypatch.setattr(ocr_service.httpx, "AsyncClient", _client)
+    service = ocr_service.OCRService(api_key="mistral-test-key-0123456789")
+    return service, seen, built
+
+
+@pytest.mark.asyncio
+async def test_ocr_service_reuses_one_pooled_client(mistral_service):
+    service, seen, built = mistral_service
+    for doc in ("DOC1", "DOC2"):
+        result = await service.extract_document_content(b"%PDF-1.4 " + doc.encode(), 1, "16123456", doc)
+        assert result["success"] is True
+    await service.aclose()
+
+    assert len(built) == 1
+    assert [path for path, _ in seen] == ["/v1/files", "/v1/ocr"] * 2
+    assert {auth for _, auth in seen} == {"Bearer mistral-test-key-0123456789"}
+
+
+def test_ocr_client_per_event_loop_closed_by_its_own_loop(mistral_service):
+    """A second loop gets its own client; neither replaces nor leaks the other."""
+    import asyncio
+
+    service, _, built = mistral_service
+
+    async def _get():
+        return service._get_client()
+
+    loop_a = asyncio.new_event_loop()
+    try:
+        client_a = loop_a.run_until_complete(_get())
+
+        async def _other_loop():
+            client_b = service._get_client()
+            assert client_b is not client_a and not client_a.is_closed
+            await service.aclose()
+            return client_b
+
+        assert asyncio.run(_other_loop()).is_closed
+        assert not client_a.is_closed
+        assert loop_a.run_until_complete(_get()) is client_a
+        loop_a.run_until_complete(service.aclose())
+        assert client_a.is_closed and service._clients == {}
+    finally:
+        loop_a.close()
+    assert len(built) == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_many_bounds_concurrency(mistral_service, monkeypatch):
+    import asyncio
+
+    service, seen, _ = mistral_service
+    in_flight = peak = 0
+    real_extract = service.extract_document_content
+
+    async def _tracked(*job):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        try:
+            return await real_extract(*job)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(service, "extract_document_content", _tracked)
+    jobs = [(b"%%PDF-1.4 %d" % i, 1, "16123456", f"DOC{i}") for i in range(5)]
+    results = await service.extract_many(jobs, concurrency=2)
+    await service.aclose()
+
+    assert peak == 2
+    assert [r["success"] for r in results] == [True] * 5
+    assert len(seen) == 10
+
+
+@pytest.mark.asyncio
+async def test_identical_pdf_served_from_ocr_cache(mistral_service):
+    service, seen, _ = mistral_service
+    first = await service.extract_document_content(b"%PDF-1.4 form", 1, "16123456", "DOC1")
+    again = await service.extract_document_content(b"%PDF-1.4 form", 1, "17000000", "DOC9")
+    await service.aclose()
+
+    assert len(seen) == 2  # one upload + one OCR call for both requests
+    assert service._ocr_rate_limiter._counts["current"] == 1  # the hit spent no rate-limit budget
+    assert again["extracted_content"] == first["extracted_content"]
+    assert (again["application_number"], again["document_identifier"]) == ("17000000", "DOC9")
+    assert first["processing_cost_usd"] > 0 and "cached" not in first
+    assert again["cached"] is True
+    assert again["processing_cost_usd"] == 0.0 and again["usage_info"] == {}
+
+
+@pytest.mark.asyncio
+async def test_ocr_cache_entry_isolated_from_callers(mistral_service):
+    """Editing a returned result (or its usage_info) never changes later hits."""
+    service, _, _ = mistral_service
+    first = await service.extract_document_content(b"%PDF-1.4 form", 1, "16123456", "DOC1")
+    first["extracted_content"] = "edited"
+    first["usage_info"]["pages_processed"] = 99
+    hit = await service.extract_document_content(b"%PDF-1.4 form", 1, "16123456", "DOC2")
+    hit["extracted_content"] = "edited again"
+    again = await service.extract_document_content(b"%PDF-1.4 form", 1, "16123456", "DOC3")
+    await service.aclose()
+
+    assert again["extracted_content"] == "=== PAGE 1 ===\npage text"
+    cached, = service._ocr_cache.values()
+    assert cached["usage_info"] == {"pages_processed": 1}
+
+
+def test_upload_timeout_is_granular(monkeypatch):
+    from patent_filewrapper_mcp.services.ocr_service import OCRService
+
+    monkeypatch.setenv("MISTRAL_OCR_UPLOAD_TIMEOUT", "90")
+    timeout = OCRService(api_key="", timeout=30.0).ocr_upload_timeout
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (10.0, 30.0, 90.0, 10.0)
+
+
+@pytest.mark.asyncio
+async def test_transient_mistral_errors_retried_in_one_slot(monkeypatch):
+    import httpx
+
+    from patent_filewrapper_mcp.services import ocr_service
+
+    responses = {
+        "/v1/files": [httpx.Response(503), httpx.Response(200, json={"id": "file-1"})],
+        "/v1/ocr": [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json={"pages": [{"index": 0, "markdown": "text"}]}),
+        ],
+    }
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(ocr_service.httpx, "AsyncClient", lambda **kw: real_client(
+        transport=httpx.MockTransport(lambda request: responses[request.url.path].pop(0))))
+    sleeps = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(ocr_service.asyncio, "sleep", _sleep)
+    service = ocr_service.OCRService(api_key="mistral-test-key-0123456789")
+    result = await service.extract_document_content(b"%PDF-1.4 retry", 1, "16123456", "DOC1")
+    await service.aclose()
+
+    assert result["success"] is True
+    assert len(sleeps) == 2 and 7.0 <= sleeps[1] <= 7.25  # Retry-After honoured
+    assert service._ocr_rate_limiter._counts["current"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_mistral_error_not_retried(monkeypatch):
+    import httpx
+
+    from patent_filewrapper_mcp.services import ocr_service
+
+    calls = []
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(ocr_service.httpx, "AsyncClient", lambda **kw: real_client(
+        transport=httpx.MockTransport(lambda request: calls.append(1) or httpx.Response(401))))
+    service = ocr_service.OCRService(api_key="mistral-test-key-0123456789")
+    result = await service.extract_document_content(b"%PDF-1.4 auth", 1, "16123456", "DOC1")
+    await service.aclose()
+
+    assert "authentication failed" in str(result)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_upload_retries_only_connect_errors(monkeypatch):
+    import httpx
+
+    from patent_filewrapper_mcp.services import ocr_service
+
+    def _raise(exc_type):
+        def _handler(request):
+            raise exc_type("transport failure", request=request)
+        return _handler
+
+    responses = {
+        "/v1/files": [_raise(httpx.ConnectError), lambda r: httpx.Response(200, json={"id": "file-1"}),
+                      _raise(httpx.ReadTimeout)],
+        "/v1/ocr": [_raise(httpx.ReadTimeout),
+                    lambda r: httpx.Response(200, json={"pages": [{"index": 0, "markdown": "text"}]})],
+    }
+    calls = []
+
+    def _handler(request):
+        calls.append(request.url.path)
+        return responses[request.url.path].pop(0)(request)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(ocr_service.httpx, "AsyncClient",
+                        lambda **kw: real_client(transport=httpx.MockTransport(_handler)))
+
+    async def _sleep(delay):
+        pass
+
+    monkeypatch.setattr(ocr_service.asyncio, "sleep", _sleep)
+    service = ocr_service.OCRService(api_key="mistral-test-key-0123456789")
+
+    # Connect error on upload and read timeout on /ocr are both retried
+    result = await service.extract_document_content(b"%PDF-1.4 connect", 1, "16123456", "DOC1")
+    assert result["success"] is True
+    assert calls == ["/v1/files", "/v1/files", "/v1/ocr", "/v1/ocr"]
+
+    # A read timeout on upload may follow a stored upload: not retried
+    calls.clear()
+    result = await service.extract_document_content(b"%PDF-1.4 read", 1, "16123456", "DOC2")
+    await service.aclose()
+    assert result.get("success") is not True
+    assert calls == ["/v1/files"]
+
+
+def test_combine_pages_skips_blank_markdown():
+    from patent_filewrapper_mcp.services.ocr_service import OCRService
+
+    pages = [
+        {"index": 0, "markdown": "first"},
+        {"index": 1, "markdown": " \n\t"},
+        {"index": 2},
+        {"index": 3, "markdown": "fourth"},
+    ]
+    assert OCRService._combine_pages(pages) == "=== PAGE 1 ===\nfirst\n\n=== PAGE 4 ===\nfourth"
+
+
+def test_client_import_defers_pypdf2():
+    """PyPDF2 is probed with find_spec and only imported on first extraction."""
+    import subprocess
+
+    code = (
+        "import sys, patent_filewrapper_mcp.api.enhanced_client as ec; "
+        "sys.exit(not ec.PDF_AVAILABLE or 'PyPDF2' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_pdfs_share_one_ocr_call(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from patent_filewrapper_mcp.services import ocr_service
+
+    seen = []
+
+    async def handler(request):
+        seen.append(request.url.path)
+        await asyncio.sleep(0.01)  # keep the first call in flight
+        if request.url.path.endswith("/files"):
+            return httpx.Response(200, json={"id": "file-1"})
+        return httpx.Response(200, json={"pages": [{"index": 0, "markdown": "text"}]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(ocr_service.httpx, "AsyncClient",
+                        lambda **kw: real_client(transport=httpx.MockTransport(handler)))
+    service = ocr_service.OCRService(api_key="mistral-test-key-0123456789")
+    first, second = await asyncio.gather(
+        service.extract_document_content(b"%PDF-1.4 same", 1, "16123456", "DOC1"),
+        service.extract_document_content(b"%PDF-1.4 same", 1, "17000000", "DOC9"),
+    )
+    await service.aclose()
+
+    assert seen == ["/v1/files", "/v1/ocr"]
+    assert service._ocr_rate_limiter._counts["current"] == 1
+    assert (second["application_number"], second["document_identifier"]) == ("17000000", "DOC9")
+    assert second["extracted_content"] == first["extracted_content"]
+    assert service._ocr_inflight == {}
+
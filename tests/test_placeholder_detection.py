@@ -178,6 +178,30 @@ def main():
         print("Please check the implementation.")
         return False
 
+def test_env_placeholder_patterns_extend_defaults(monkeypatch):
+    """MISTRAL_PLACEHOLDER_PATTERNS entries join the compiled default set"""
+    from patent_filewrapper_mcp.services.ocr_service import OCRService
+
+    service = OCRService(api_key="")
+    key = "acme-dummy-0123456789"
+    assert service._validate_mistral_api_key(key) == key
+
+    monkeypatch.setenv("MISTRAL_PLACEHOLDER_PATTERNS", "acme-dummy, other")
+    assert service._validate_mistral_api_key(key) is None
+    assert service._validate_mistral_api_key("a+b|c.your_key_here") is None
+    assert service._validate_mistral_api_key("  real-key-0123456789  ") == "real-key-0123456789"
+
+def test_client_and_ocr_service_agree_on_placeholders():
+    """Both Mistral key validators use the one shared pattern set"""
+    from patent_filewrapper_mcp.services.ocr_service import OCRService
+
+    client = EnhancedPatentClient.__new__(EnhancedPatentClient)
+    service = OCRService(api_key="")
+    for key, expected in (("test_key_0123456789", None), ("change_me_0123456789", None),
+                          ("mistral_api_key_abc123def456", "mistral_api_key_abc123def456")):
+        assert client._validate_mistral_api_key(key) == expected
+        assert service._validate_mistral_api_key(key) == expected
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
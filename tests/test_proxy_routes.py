@@ -1,4 +1,7 @@
 """Test proxy route auth — verifies the production bug fix for persistent link route."""
+import gzip
+import sys
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 from patent_filewrapper_mcp.proxy.server import create_proxy_app
@@ -86,3 +89,437 @@ class TestProxyRoutes:
             # 200 or 503 both indicate the endpoint is responding
             # (503 may occur if USPTO API is unreachable — that's fine for proxy)
             assert resp.status_code in (200, 503), f"Health check failed: {resp.status_code}"
+
+    async def test_root_health_head_is_bodyless(self, proxy_app):
+        """HEAD / is a cheap liveness probe: status only, no component report."""
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app),
+            base_url="http://test"
+        ) as client:
+            resp = await client.head("/")
+            assert resp.status_code in (200, 503)
+            assert resp.content == b""
+
+    async def test_root_health_report_cached_between_polls(self, proxy_app):
+        """Back-to-back GET / polls reuse the serialized report."""
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app),
+            base_url="http://test"
+        ) as client:
+            first = await client.get("/")
+            second = await client.get("/")
+            assert first.content == second.content
+            assert "components" in first.json()
+
+    async def test_doc_codes_table_served_as_markdown(self, proxy_app):
+        """GET /doc-codes renders the reference CSV as a markdown table."""
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app),
+            base_url="http://test"
+        ) as client:
+            resp = await client.get("/doc-codes")
+            assert resp.status_code == 200
+            assert resp.headers["content-type"].startswith("text/markdown")
+            assert resp.text.startswith("# USPTO Document Code Decoder Table")
+            assert "| `ABST` |" in resp.text
+            assert "## Quick Reference - Most Common Codes" in resp.text
+            assert resp.headers["content-encoding"] == "gzip"
+            plain = await client.get("/doc-codes", headers={"Accept-Encoding": "identity"})
+            assert "content-encoding" not in plain.headers
+            assert plain.text == resp.text
+            assert plain.headers["etag"] != resp.headers["etag"]
+            revalidated = await client.get("/doc-codes", headers={"If-None-Match": resp.headers["etag"]})
+            assert revalidated.status_code == 304
+            for if_none_match in (f'"other", W/{resp.headers["etag"]}', "*"):
+                listed = await client.get("/doc-codes", headers={"If-None-Match": if_none_match})
+                assert listed.status_code == 304
+            since = await client.get("/doc-codes", headers={"If-Modified-Since": resp.headers["last-modified"]})
+            assert since.status_code == 304
+            assert "stale-while-revalidate" in resp.headers["cache-control"]
+            assert resp.headers["x-generated-at"].endswith("UTC")
+            assert revalidated.content == b""
+
+    async def test_reflection_summary_and_markdown(self, proxy_app):
+        """Reflection resources resolve by URI in summary and markdown formats."""
+        path = "/reflections/pfw/uspto_pfw_tool_guidance"
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app),
+            base_url="http://test"
+        ) as client:
+            summary = await client.get(path, params={"format": "summary"})
+            assert summary.status_code == 200
+            assert summary.json()["resource"]["uri"] == path
+            markdown = await client.get(path)
+            assert markdown.status_code == 200
+            assert markdown.headers["content-type"].startswith("text/markdown")
+            assert markdown.headers["content-encoding"] == "gzip"
+            plain = await client.get(path, headers={"Accept-Encoding": "identity"})
+            assert "content-encoding" not in plain.headers
+            assert plain.text == markdown.text
+            missing = await client.get("/reflections/pfw/nope", params={"format": "summary"})
+            assert missing.status_code == 404
+            as_json = await client.get(path, params={"format": "json"})
+            assert as_json.json()["metadata"]["resource_uri"] == path
+            wrong_type = await client.get(
+                "/reflections/fpd/uspto_pfw_tool_guidance", params={"format": "json"}
+            )
+            assert wrong_type.status_code == 404
+
+    async def test_non_allowlisted_ip_gets_json_403(self, proxy_app):
+        """Requests from outside the IP allowlist get the pre-serialized 403 body."""
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app, client=("203.0.113.9", 40000)),
+            base_url="http://test"
+        ) as client:
+            resp = await client.get("/")
+            assert resp.status_code == 403
+            assert resp.headers["content-type"] == "application/json"
+            assert resp.json() == {"error": "Access denied from this IP address"}
+
+    async def test_oversized_post_rejected_with_413(self, proxy_app):
+        """POST bodies over MAX_REQUEST_SIZE are refused before reaching the route."""
+        from patent_filewrapper_mcp.proxy.server import MAX_REQUEST_SIZE
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app),
+            base_url="http://test"
+        ) as client:
+            resp = await client.post(
+                "/api/register-download", content=b"x" * (MAX_REQUEST_SIZE + 1)
+            )
+            assert resp.status_code == 413
+            assert resp.json()["max_allowed"] == MAX_REQUEST_SIZE
+
+    async def test_get_skips_request_size_check(self, proxy_app):
+        """GET requests bypass the body-size middleware (no body to count)."""
+        from patent_filewrapper_mcp.proxy.server import MAX_REQUEST_SIZE
+        async with AsyncClient(
+            transport=ASGITransport(app=proxy_app),
+            base_url="http://test"
+        ) as client:
+            resp = await client.get(
+                "/api/recent-downloads",
+                headers={"Content-Length": str(MAX_REQUEST_SIZE + 1)},
+            )
+            assert resp.status_code == 401
+
+
+def test_health_db_probe_reuses_in_memory_connection():
+    """The health-check SQLite probe keeps one in-memory connection instead of
+    creating and unlinking a temp .db file on every request."""
+    from patent_filewrapper_mcp.proxy.routes import admin
+
+    first = admin._check_database()
+    conn = admin._health_db
+    second = admin._check_database()
+    assert first["status"] == second["status"] == "healthy"
+    assert conn is not None and admin._health_db is conn
+
+
+def test_request_context_computed_once_per_scope():
+    """Request ID and client IP are generated once and shared by every layer."""
+    from patent_filewrapper_mcp.proxy.server import _scope_request_context
+
+    scope = {"type": "http", "client": ("127.0.0.1", 5000)}
+    first = _scope_request_context(scope)
+    assert _scope_request_context(scope) == first
+    assert first[1] == "127.0.0.1"
+    assert scope["state"]["request_id"] == first[0]
+    assert _scope_request_context({"type": "http"})[1] == "unknown"
+
+
+@pytest.mark.asyncio
+async def test_document_index_cached_per_application(monkeypatch):
+    """Repeat downloads from one file wrapper reuse the documentBag lookup."""
+    from patent_filewrapper_mcp.proxy import server as proxy_server
+    from patent_filewrapper_mcp.proxy.routes import downloads
+
+    calls = []
+
+    class _FakeClient:
+        async def get_documents(self, app_number):
+            calls.append(app_number)
+            return {"documentBag": [
+                {"documentIdentifier": "DOC1", "downloadOptionBag": [
+                    {"mimeTypeIdentifier": "MS_WORD"},
+                    {"mimeTypeIdentifier": "PDF", "downloadUrl": "https://api.uspto.gov/doc1.pdf"},
+                ]},
+                {"documentIdentifier": "DOC2"},
+            ]}
+
+    monkeypatch.setattr(proxy_server, "api_client", _FakeClient())
+    monkeypatch.setattr(downloads, "_doc_index_cache", {})
+
+    first = await downloads._get_document_index("17896175")
+    second = await downloads._get_document_index("17896175")
+    assert calls == ["17896175"]
+    assert first is second
+    assert set(first) == {"DOC1", "DOC2"}
+    assert first["DOC1"][1]["downloadUrl"] == "https://api.uspto.gov/doc1.pdf"
+    assert first["DOC2"][1] is None
+
+
+@pytest.mark.asyncio
+async def test_filename_metadata_lookup_is_best_effort(monkeypatch):
+    """A failing title/patent search falls back to (None, None) instead of
+    failing the download."""
+    from patent_filewrapper_mcp.proxy import server as proxy_server
+    from patent_filewrapper_mcp.proxy.routes import downloads
+
+    class _FailingClient:
+        async def search_applications(self, *args, **kwargs):
+            raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(proxy_server, "api_client", _FailingClient())
+    monkeypatch.setattr(downloads, "_filename_metadata_cache", {})
+    assert await downloads._get_title_and_patent_number("17896175") == (None, None)
+    assert downloads._filename_metadata_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_filename_metadata_cached_per_application(monkeypatch):
+    """Repeat downloads from one application reuse the title/patent lookup."""
+    from patent_filewrapper_mcp.proxy import server as proxy_server
+    from patent_filewrapper_mcp.proxy.routes import downloads
+
+    searches = []
+
+    class _FakeClient:
+        async def search_applications(self, query, **kwargs):
+            searches.append(query)
+            return {"success": True, "patentFileWrapperDataBag": [
+                {"applicationMetaData": {"inventionTitle": "Widget", "patentNumber": "11000000"}},
+            ]}
+
+    monkeypatch.setattr(proxy_server, "api_client", _FakeClient())
+    monkeypatch.setattr(downloads, "_filename_metadata_cache", {})
+    first = await downloads._get_title_and_patent_number("17896175")
+    assert await downloads._get_title_and_patent_number("17896175") == first
+    assert first[0] == "Widget"
+    assert len(searches) == 1
+
+
+def test_doc_codes_markdown_rendered_once():
+    """The /doc-codes table is parsed once and reused until the CSV changes."""
+    from patent_filewrapper_mcp.proxy.routes import reference
+
+    reference._doc_codes_cache = None
+    first = reference._get_doc_codes_markdown()
+    assert reference._get_doc_codes_markdown() is first
+    assert gzip.decompress(first.gzipped) == first.markdown
+    # No build timestamp in the body: a rebuild (e.g. after a restart) keeps the ETag
+    reference._doc_codes_cache = None
+    assert reference._get_doc_codes_markdown().etag == first.etag
+
+
+@pytest.mark.asyncio
+async def test_persistent_link_charges_rate_limit_once(monkeypatch, proxy_app):
+    """A persistent-link download uses one slot of the per-IP quota, not two."""
+    from fastapi.responses import Response
+    from patent_filewrapper_mcp.proxy.rate_limiter import rate_limiter
+    from patent_filewrapper_mcp.proxy.routes import downloads
+
+    class _FakeLinkCache:
+        def resolve_persistent_link(self, link_hash):
+            return {"app_number": "17896175", "doc_id": "DOC1", "access_count": 1}
+
+    async def _fake_download(*args):
+        return Response(content=b"%PDF-1.7", media_type="application/pdf")
+
+    monkeypatch.setattr(downloads, "get_link_cache", lambda: _FakeLinkCache())
+    monkeypatch.setattr(downloads, "_perform_download", _fake_download)
+    client_ip = "127.0.0.1"
+    monkeypatch.setitem(rate_limiter.requests, client_ip, type(rate_limiter.requests[client_ip])())
+
+    async with AsyncClient(
+        transport=ASGITransport(app=proxy_app, client=(client_ip, 40000)),
+        base_url="http://test"
+    ) as client:
+        resp = await client.get("/document/persistent/deadbeefdeadbeef")
+    assert resp.status_code == 200
+    assert rate_limiter.get_remaining_requests(client_ip) == rate_limiter.max_requests - 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="exercises the non-DPAPI path")
+def test_registration_api_key_picks_up_rotation(tmp_path, monkeypatch):
+    """Registration routes see a rotated key without decrypting on every call."""
+    from patent_filewrapper_mcp import shared_secure_storage as sss
+    from patent_filewrapper_mcp.proxy.routes import registration
+
+    storage = sss.UnifiedSecureStorage()
+    storage.uspto_key_path = tmp_path / ".uspto_api_key"
+    monkeypatch.setattr(sss, "_default_storage", lambda: storage)
+
+    reads = []
+    real_read = storage._read_single_key
+
+    def _counting_read(path, key_name):
+        reads.append(path)
+        return real_read(path, key_name)
+
+    monkeypatch.setattr(storage, "_read_single_key", _counting_read)
+
+    assert sss.store_secure_api_key("pfw-key-original", "USPTO_API_KEY")
+    assert registration._get_pfw_uspto_api_key() == "pfw-key-original"
+    assert registration._get_pfw_uspto_api_key() == "pfw-key-original"
+    assert len(reads) == 1
+
+    assert sss.store_secure_api_key("pfw-key-rotated-value", "USPTO_API_KEY")
+    assert registration._get_pfw_uspto_api_key() == "pfw-key-rotated-value"
+
+
+def test_accepts_gzip_honours_q_zero():
+    """gzip is only served when the client's Accept-Encoding allows it."""
+    from patent_filewrapper_mcp.proxy.routes.reference import _accepts_gzip
+
+    assert _accepts_gzip("gzip, deflate, br")
+    assert _accepts_gzip("br;q=1.0, *;q=0.5")
+    assert not _accepts_gzip("gzip;q=0, br")
+    assert not _accepts_gzip("")
+
+
+def test_accepts_gzip_explicit_entry_overrides_wildcard():
+    """A listed gzip decides by its own q-value, even after an accepting *."""
+    from patent_filewrapper_mcp.proxy.routes.reference import _accepts_gzip
+
+    assert not _accepts_gzip("*;q=1, gzip;q=0")
+    assert _accepts_gzip("*;q=0, gzip")
+    assert not _accepts_gzip("br, *;q=0")
+
+
+def test_reflection_tags_parsed_and_memoized():
+    """The tags query value is split once per distinct string."""
+    from patent_filewrapper_mcp.proxy.routes.reference import _parse_tags
+
+    assert _parse_tags(" search, ,ocr ,") == ("search", "ocr")
+    assert _parse_tags(" search, ,ocr ,") is _parse_tags(" search, ,ocr ,")
+
+
+@pytest.mark.asyncio
+async def test_pfw_download_matching_etag_returns_304(monkeypatch):
+    """A conditional re-download answers 304 from the document index alone:
+    no title search and no upstream PDF fetch."""
+    from patent_filewrapper_mcp.proxy import server as proxy_server
+    from patent_filewrapper_mcp.proxy.routes import downloads
+
+    searches = []
+
+    class _FakeClient:
+        async def get_documents(self, app_number):
+            return {"documentBag": [
+                {"documentIdentifier": "DOC1", "documentCode": "CTNF", "downloadOptionBag": [
+                    {"mimeTypeIdentifier": "PDF", "pageTotalQuantity": 12,
+                     "downloadUrl": "https://api.uspto.gov/doc1.pdf"},
+                ]},
+            ]}
+
+        async def search_applications(self, *args, **kwargs):
+            searches.append(args)
+            return {}
+
+    monkeypatch.setattr(proxy_server, "api_client", _FakeClient())
+    monkeypatch.setattr(downloads, "_doc_index_cache", {})
+
+    etag = downloads._pfw_document_etag("DOC1", "CTNF", 12)
+    resp = await downloads._download_pfw_document(
+        "17896175", "DOC1", "127.0.0.1", "req-1", 0.0, f'W/"stale", {etag}'
+    )
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+    assert resp.body == b""
+    assert searches == []
+    assert not downloads._etag_matches('"other"', etag)
+
+
+def test_doc_codes_csv_decoded_in_one_pass():
+    """UTF-8 (with or without BOM) decodes as UTF-8; anything else as Latin-1."""
+    from patent_filewrapper_mcp.proxy.routes.reference import _decode_doc_codes_csv
+
+    assert _decode_doc_codes_csv("﻿CODE,café".encode("utf-8")) == "CODE,café"
+    assert _decode_doc_codes_csv(b"CODE,\xa7 1.17") == "CODE,§ 1.17"
+
+
+def test_doc_code_field_cleaned_for_markdown():
+    """Cells are flattened, ASCII-folded, truncated, then pipe-escaped."""
+    from patent_filewrapper_mcp.proxy.routes.reference import _clean_doc_code_field
+
+    assert _clean_doc_code_field(" a|b\r\ncafé ", 50) == "a\\|b  caf?"
+    assert _clean_doc_code_field("x" * 20, 10) == "xxxxxxx..."
+
+
+def test_reflection_content_rendered_once(monkeypatch):
+    """Metadata, summary and statistics share one rendering of the guidance."""
+    from patent_filewrapper_mcp.reflections.pfw_reflections import PFWReflection
+
+    reflection = PFWReflection()
+    renders = []
+    original = reflection.get_content
+    monkeypatch.setattr(reflection, "get_content", lambda: renders.append(1) or original())
+    size = reflection.get_metadata()["size_estimate"]
+    assert reflection.get_summary() == reflection.get_summary()
+    assert reflection.get_content_size() == size == len(reflection.get_cached_content())
+    assert len(renders) == 1
+
+
+def test_reflection_metadata_is_deterministic():
+    """Two instances of a reflection report identical metadata (no per-instance clock)."""
+    from patent_filewrapper_mcp.reflections.pfw_reflections import PFWReflection
+
+    assert PFWReflection().get_metadata() == PFWReflection().get_metadata()
+
+
+def test_reflection_tag_filter_any_match():
+    """Tag filters match when any requested tag is on the reflection."""
+    from patent_filewrapper_mcp.reflections.pfw_reflections import PFWReflection
+
+    reflection = PFWReflection()
+    tag = reflection.tags[0]
+    assert reflection.matches_filter(tags=("no-such-tag", tag))
+    assert not reflection.matches_filter(tags=("no-such-tag",))
+    assert reflection.matches_filter(tags=())
+    assert not reflection.matches_filter(tags=(tag,), mcp_type="ptab")
+
+
+def test_reflection_statistics_from_memoized_sizes():
+    """Statistics sum the memoized content sizes and union the tag lists."""
+    from patent_filewrapper_mcp.reflections.reflection_manager import ReflectionManager
+
+    manager = ReflectionManager()
+    stats = manager.get_statistics()
+    reflections = list(manager._reflections.values())
+    assert stats["total_content_size"] == sum(r.get_content_size() for r in reflections)
+    assert stats["available_tags"] == sorted({tag for r in reflections for tag in r.tags})
+    assert sum(stats["by_mcp_type"].values()) == stats["total_reflections"]
+
+
+def test_doc_code_rows_parsed_after_title_and_header():
+    """Rows before and including the DOC CODE header are skipped; sections split by category."""
+    import io
+    from patent_filewrapper_mcp.proxy.routes.reference import _parse_doc_code_rows
+
+    csv_text = (
+        ',"Document Description List\nUpdated 04/27/2022",,\n'
+        "Category,Document Description,USPTO Business Process,DOC CODE\n"
+        "Prosecution, Abstract ,Filing,ABST\n"
+        "PTAB,Petition,Trial,PET\n"
+        "Final Petition Decision,Decision,Petitions,FPD1\n"
+        "Prosecution,No code,Filing, \n"
+    )
+    prosecution, ptab, fpd = _parse_doc_code_rows(io.StringIO(csv_text, newline=""))
+    assert [(e.code, e.description) for e in prosecution] == [("ABST", "Abstract")]
+    assert [e.code for e in ptab] == ["PET"]
+    assert [e.code for e in fpd] == ["FPD1"]
+
+
+def test_doc_code_rows_parsed_without_header():
+    """A CSV whose header text changed is parsed from the first row, not dropped."""
+    import io
+    from patent_filewrapper_mcp.proxy.routes.reference import _parse_doc_code_rows
+
+    csv_text = (
+        "Category,Document Description,USPTO Business Process,Document Code\n"
+        "Prosecution,Abstract,Filing,ABST\n"
+        "PTAB,Petition,Trial,PET\n"
+    )
+    prosecution, ptab, _ = _parse_doc_code_rows(io.StringIO(csv_text, newline=""))
+    assert "ABST" in [e.code for e in prosecution]
+    assert [e.code for e in ptab] == ["PET"]
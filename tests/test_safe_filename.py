@@ -60,3 +60,17 @@ class TestSafeFilename:
         """Case of extension is preserved — .PDF stays .PDF, .pdf stays .pdf."""
         assert _safe_filename("DOC.PDF") == "DOC.PDF"
         assert _safe_filename("doc.pdf") == "doc.pdf"
+
+    def test_all_control_chars_replaced(self):
+        """Every C0 control char and DEL is replaced in one pass."""
+        result = _safe_filename("a\r\nb\x1f\x7fc.pdf")
+        assert result == "a__b__c.pdf"
+
+
+def test_safe_header_value_strips_control_chars():
+    """CR/LF/DEL are removed from header values; printable text is kept."""
+    from patent_filewrapper_mcp.proxy.server import _safe_header_value
+
+    assert _safe_header_value("name\r\nX-Evil: 1\x7f") == "nameX-Evil: 1"
+    assert _safe_header_value("Résumé.pdf") == "Résumé.pdf"
+    assert _safe_header_value(None) == ""
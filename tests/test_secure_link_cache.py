@@ -0,0 +1,55 @@
+"""SecureLinkCache token round-trip against a throwaway database and key."""
+
+import json
+from datetime import timedelta
+
+from cryptography.fernet import Fernet
+
+from patent_filewrapper_mcp.proxy.secure_link_cache import SecureLinkCache
+
+
+def _cache(tmp_path) -> SecureLinkCache:
+    cache = SecureLinkCache.__new__(SecureLinkCache)
+    cache.cache_duration = timedelta(days=1)
+    cache.db_path = str(tmp_path / "links.db")
+    cache.cipher = Fernet(Fernet.generate_key())
+    cache._init_database()
+    return cache
+
+
+def test_persistent_link_round_trip(tmp_path):
+    cache = _cache(tmp_path)
+    url = cache.generate_persistent_link("16123456", "DOC1", base_url="http://proxy")
+    link_hash = url.rsplit("/", 1)[1]
+
+    resolved = cache.resolve_persistent_link(link_hash)
+    assert resolved["app_number"] == "16123456"
+    assert resolved["doc_id"] == "DOC1"
+    assert resolved["access_count"] == 1
+
+
+def test_resolves_tokens_written_with_stdlib_json(tmp_path):
+    from patent_filewrapper_mcp.util.database import create_secure_connection
+    from datetime import datetime
+
+    cache = _cache(tmp_path)
+    legacy = json.dumps({"app_number": "15000001", "doc_id": "OLD", "timestamp": "t", "random": "r"})
+    token = cache.cipher.encrypt(legacy.encode("utf-8")).decode("utf-8")
+    conn = create_secure_connection(cache.db_path)
+    try:
+        conn.execute(
+            "INSERT INTO download_links VALUES (?, ?, ?, ?, ?, ?)",
+            ("legacyhash", token, datetime.now(), datetime.now(), 0, datetime.now() + timedelta(days=1)),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert cache.resolve_persistent_link("legacyhash")["doc_id"] == "OLD"
+
+
+def test_link_hash_is_24_hex_chars(tmp_path):
+    url = _cache(tmp_path).generate_persistent_link("16123456", "DOC1")
+    link_hash = url.rsplit("/", 1)[1]
+    assert len(link_hash) == 24
+    int(link_hash, 16)
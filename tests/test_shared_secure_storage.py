@@ -0,0 +1,131 @@
+"""UnifiedSecureStorage hot-path behavior (shared instance, key caching).
+
+Uses tmp_path key files only — never touches the real stored keys.
+"""
+
+import sys
+
+import pytest
+
+from patent_filewrapper_mcp import shared_secure_storage as sss
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="exercises the non-DPAPI path")
+
+
+def test_convenience_functions_share_one_storage_instance():
+    assert sss._default_storage() is sss._default_storage()
+
+
+def test_load_single_key_reuses_decrypted_value_until_file_changes(tmp_path, monkeypatch):
+    storage = sss.UnifiedSecureStorage()
+    key_file = tmp_path / ".test_key"
+    assert storage._store_single_key("first-key-value", key_file, "TEST_KEY")
+
+    reads = []
+    real_read = storage._read_single_key
+
+    def _counting_read(path, key_name):
+        reads.append(path)
+        return real_read(path, key_name)
+
+    monkeypatch.setattr(storage, "_read_single_key", _counting_read)
+
+    assert storage._load_single_key(key_file, "TEST_KEY") == "first-key-value"
+    assert storage._load_single_key(key_file, "TEST_KEY") == "first-key-value"
+    assert len(reads) == 1
+
+    assert storage._store_single_key("second-key-value-longer", key_file, "TEST_KEY")
+    assert storage._load_single_key(key_file, "TEST_KEY") == "second-key-value-longer"
+    assert len(reads) == 2
+
+    key_file.unlink()
+    assert storage._load_single_key(key_file, "TEST_KEY") is None
+
+
+def test_create_data_blob_references_input_bytes():
+    import ctypes
+
+    from patent_filewrapper_mcp.util.dpapi_utils import create_data_blob
+
+    blob = create_data_blob(bytes(b"secret-bytes"))
+    assert blob.cbData == 12
+    assert ctypes.string_at(blob.pbData, blob.cbData) == b"secret-bytes"
+
+
+def test_get_data_from_blob_copies_then_frees(monkeypatch):
+    from patent_filewrapper_mcp.util import dpapi_utils
+
+    source = bytes(b"dpapi-output")
+    freed = []
+    monkeypatch.setattr(dpapi_utils, "_LocalFree", freed.append, raising=False)
+    blob = dpapi_utils.create_data_blob(source)
+
+    assert dpapi_utils.get_data_from_blob(blob) == b"dpapi-output"
+    assert len(freed) == 1
+    assert dpapi_utils.get_data_from_blob(dpapi_utils.DATA_BLOB()) == b""
+
+
+def test_api_key_env_fallback_prefers_stored_key(monkeypatch):
+    monkeypatch.setenv("MISTRAL_API_KEY", "env-mistral-key-value")
+    monkeypatch.setattr(sss, "get_secure_api_key", lambda key_name: None)
+    assert sss.get_api_key_with_env_fallback("MISTRAL_API_KEY") == "env-mistral-key-value"
+
+    monkeypatch.setattr(sss, "get_secure_api_key", lambda key_name: "stored-mistral-key")
+    assert sss.get_api_key_with_env_fallback("MISTRAL_API_KEY") == "stored-mistral-key"
+
+
+def test_store_single_key_replaces_file_atomically(tmp_path, monkeypatch):
+    import os
+    import stat
+
+    storage = sss.UnifiedSecureStorage()
+    key_file = tmp_path / ".test_key"
+    assert storage._store_single_key("original-key-value", key_file, "TEST_KEY")
+    assert stat.S_IMODE(key_file.stat().st_mode) == 0o600
+
+    def _crash(src, dst):
+        raise OSError("simulated crash before rename")
+
+    monkeypatch.setattr(sss.os, "replace", _crash)
+    assert not storage._store_single_key("replacement-key-value", key_file, "TEST_KEY")
+    monkeypatch.undo()
+
+    assert storage._load_single_key(key_file, "TEST_KEY") == "original-key-value"
+    assert os.listdir(tmp_path) == [".test_key"]
+
+
+def test_key_file_write_ignores_stale_temp_file(tmp_path):
+    """A leftover fixed-name temp file from an old crash is neither reused nor clobbered."""
+    key_file = tmp_path / ".test_key"
+    stale = tmp_path / ".test_key.tmp"
+    stale.write_bytes(b"stale")
+
+    sss._write_key_file(key_file, b"fresh")
+
+    assert key_file.read_bytes() == b"fresh"
+    assert stale.read_bytes() == b"stale"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".test_key", ".test_key.tmp"]
+
+
+def test_importing_storage_does_not_load_dpapi_layer():
+    import subprocess
+
+    code = (
+        "import sys, patent_filewrapper_mcp.shared_secure_storage; "
+        "sys.exit('patent_filewrapper_mcp.util.dpapi_utils' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_key_name_helpers_dispatch_to_dedicated_files(tmp_path, monkeypatch):
+    storage = sss.UnifiedSecureStorage()
+    storage.uspto_key_path = tmp_path / ".uspto_api_key"
+    storage.mistral_key_path = tmp_path / ".mistral_api_key"
+    monkeypatch.setattr(sss, "_default_storage", lambda: storage)
+
+    assert sss.store_secure_api_key("m" * 32, "MISTRAL_API_KEY")
+    assert sss.has_secure_key("MISTRAL_API_KEY")
+    assert not sss.has_secure_key("USPTO_API_KEY")
+    assert sss.get_secure_api_key("MISTRAL_API_KEY") == "m" * 32
+    assert not sss.has_secure_key("UNKNOWN_KEY")
+    assert sss.get_secure_api_key("UNKNOWN_KEY") is None